@@ -82,4 +82,22 @@ class ThresholdSauvolaSuite:
         result = filters.threshold_sauvola(self.image, window_size=51)
 
     def time_sauvola_3d(self):
-        result = filters.threshold_sauvola(self.image3D, window_size=51)
\ No newline at end of file
+        result = filters.threshold_sauvola(self.image3D, window_size=51)
+
+
+class RidgeFilters3DSuite:
+    """Benchmark for ridge filters of 3d images."""
+    params = [np.float32, np.float64]
+    param_names = ['dtype']
+
+    def setup(self, dtype):
+        self.image3d = data.binary_blobs(length=96, n_dim=3).astype(dtype)
+
+    def time_frangi_3d(self, dtype):
+        filters.frangi(self.image3d, sigmas=[1, 2, 3])
+
+    def peakmem_frangi_3d(self, dtype):
+        filters.frangi(self.image3d, sigmas=[1, 2, 3])
+
+    def time_sato_3d(self, dtype):
+        filters.sato(self.image3d, sigmas=[1, 2, 3], mode='reflect')
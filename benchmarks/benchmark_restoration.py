@@ -64,6 +64,145 @@ class RestorationSuite:
                                      multichannel=False)
 
 
+class TotalVariationSuite:
+    """Benchmark for Chambolle total-variation denoising."""
+    params = [np.float32, np.float64]
+    param_names = ['dtype']
+
+    def setup(self, dtype):
+        rstate = np.random.RandomState(0)
+        self.volume = rstate.rand(64, 128, 128).astype(dtype)
+        self.image = data.astronaut().astype(dtype) / 255
+        self.out = np.empty_like(self.volume)
+
+    def time_denoise_tv_chambolle_3d(self, dtype):
+        restoration.denoise_tv_chambolle(self.volume, weight=0.1)
+
+    def time_denoise_tv_chambolle_3d_out(self, dtype):
+        try:
+            restoration.denoise_tv_chambolle(self.volume, weight=0.1,
+                                             out=self.out)
+        except TypeError:
+            raise NotImplementedError("out unavailable")
+
+    def time_denoise_tv_chambolle_multichannel(self, dtype):
+        restoration.denoise_tv_chambolle(self.image, weight=0.1,
+                                         multichannel=True)
+
+    def peakmem_denoise_tv_chambolle_3d(self, dtype):
+        restoration.denoise_tv_chambolle(self.volume, weight=0.1)
+
+
+class WaveletSuite:
+    """Benchmark for wavelet denoising and noise estimation."""
+    params = [[np.float32, np.float64], [1, 3]]
+    param_names = ['dtype', 'workers']
+
+    def setup(self, dtype, workers):
+        rstate = np.random.RandomState(0)
+        image = np.tile(data.astronaut() / 255, (2, 2, 1))
+        image += 0.1 * rstate.randn(*image.shape)
+        self.image = image.astype(dtype)
+        try:
+            restoration.denoise_wavelet(self.image[:8, :8, 0],
+                                        workers=workers)
+        except TypeError:
+            raise NotImplementedError("workers unavailable")
+
+    def time_denoise_wavelet(self, dtype, workers):
+        restoration.denoise_wavelet(self.image, multichannel=True,
+                                    workers=workers)
+
+    def time_denoise_wavelet_ycbcr(self, dtype, workers):
+        restoration.denoise_wavelet(self.image, multichannel=True,
+                                    convert2ycbcr=True, workers=workers)
+
+    def time_estimate_sigma(self, dtype, workers):
+        restoration.estimate_sigma(self.image, multichannel=True)
+
+
+class CycleSpinSuite:
+    """Benchmark for cycle spinning with a thread pool."""
+    params = [1, 4]
+    param_names = ['num_workers']
+
+    def setup(self, num_workers):
+        rstate = np.random.RandomState(0)
+        self.image = camera() / 255 + 0.1 * rstate.randn(512, 512)
+        self.func_kw = dict(sigma=0.1, rescale_sigma=True)
+
+    def time_cycle_spin_wavelet(self, num_workers):
+        restoration.cycle_spin(self.image, restoration.denoise_wavelet,
+                               max_shifts=3, num_workers=num_workers,
+                               func_kw=self.func_kw)
+
+    def peakmem_cycle_spin_wavelet(self, num_workers):
+        restoration.cycle_spin(self.image, restoration.denoise_wavelet,
+                               max_shifts=3, num_workers=num_workers,
+                               func_kw=self.func_kw)
+
+
+class NonLocalMeansWorkersSuite:
+    """Benchmark for multithreaded fast non-local means."""
+    params = [1, 2, 4]
+    param_names = ['workers']
+
+    def setup(self, workers):
+        nz = 32
+        self.volume = np.stack([camera()[::2, ::2], ] * nz,
+                               axis=-1).astype(np.float32) / 255
+        self.sigma = .05
+        self.volume += self.sigma * np.random.randn(*self.volume.shape)
+        try:
+            restoration.denoise_nl_means(self.volume[:8, :8, :8],
+                                         patch_distance=1, workers=workers)
+        except TypeError:
+            raise NotImplementedError("workers unavailable")
+
+    def time_denoise_nl_means_fast(self, workers):
+        restoration.denoise_nl_means(self.volume, patch_size=3,
+                                     patch_distance=2, sigma=self.sigma,
+                                     h=0.7 * self.sigma, fast_mode=True,
+                                     multichannel=False, workers=workers)
+
+
+class BilateralSuite:
+    """Benchmark for the exact and permutohedral bilateral filters.
+
+    The ``track_`` method reports the mean absolute difference between each
+    result and the exact filter with a single thread, for images in [0, 1].
+    """
+    params = [['exact', 'exact-4', 'permutohedral'], [2, 5]]
+    param_names = ['method', 'sigma_spatial']
+
+    def setup(self, method, sigma_spatial):
+        try:
+            restoration.denoise_bilateral(np.ones((4, 4)),
+                                          method='permutohedral')
+        except TypeError:
+            raise NotImplementedError("method unavailable")
+        self.image = data.astronaut()[:256, :256] / 255
+        self.image += 0.05 * np.random.RandomState(0).randn(*self.image.shape)
+        self.image = np.clip(self.image, 0, 1)
+        self.kwargs = dict(sigma_color=0.1, sigma_spatial=sigma_spatial,
+                           multichannel=True)
+        if method == 'exact-4':
+            self.kwargs['workers'] = 4
+        else:
+            self.kwargs['method'] = method
+
+    def time_denoise_bilateral(self, method, sigma_spatial):
+        restoration.denoise_bilateral(self.image, **self.kwargs)
+
+    def track_error_vs_exact(self, method, sigma_spatial):
+        exact = restoration.denoise_bilateral(
+            self.image, sigma_color=0.1, sigma_spatial=sigma_spatial,
+            multichannel=True, mode='edge')
+        kwargs = dict(self.kwargs, mode='edge')
+        out = restoration.denoise_bilateral(self.image, **kwargs)
+        return np.abs(out - exact).mean()
+
+
 class DeconvolutionSuite:
     """Benchmark for restoration routines in scikit image."""
     def setup(self):
@@ -98,6 +237,108 @@ class DeconvolutionSuite:
                                     iterations=1)
 
 
+class DeconvolutionStackSuite:
+    """Benchmark for the deconvolution of a stack of images with one PSF."""
+    params = [np.float32, np.float64]
+    param_names = ['dtype']
+
+    def setup(self, dtype):
+        rstate = np.random.RandomState(0)
+        self.psf = (np.ones((5, 5)) / 25).astype(dtype)
+        image = ndi.convolve(camera() / 255, self.psf)
+        self.stack = np.stack([image + 0.02 * rstate.randn(*image.shape)
+                               for _ in range(8)]).astype(dtype)
+        try:
+            restoration.richardson_lucy(self.stack[:, :8, :8], self.psf, 1)
+        except ValueError:
+            raise NotImplementedError("stacks unavailable")
+
+    def time_richardson_lucy_stack(self, dtype):
+        restoration.richardson_lucy(self.stack, self.psf, iterations=10)
+
+    def time_richardson_lucy_loop(self, dtype):
+        for image in self.stack:
+            restoration.richardson_lucy(image, self.psf, iterations=10)
+
+    def time_wiener_loop(self, dtype):
+        for image in self.stack:
+            restoration.wiener(image, self.psf, 0.05)
+
+
+class InpaintSuite:
+    """Benchmark for biharmonic inpainting."""
+    params = [1, 4]
+    param_names = ['workers']
+
+    def setup(self, workers):
+        rstate = np.random.RandomState(0)
+        self.image = data.astronaut() / 255
+        self.mask = np.zeros(self.image.shape[:2], dtype=bool)
+        for r, c, h, w in rstate.randint(5, 480, size=(300, 4)):
+            self.mask[r:r + h % 25, c:c + w % 25] = True
+        try:
+            restoration.inpaint_biharmonic(self.image[:8, :8, 0],
+                                           self.mask[:8, :8],
+                                           workers=workers)
+        except TypeError:
+            raise NotImplementedError("workers unavailable")
+
+    def time_inpaint_biharmonic(self, workers):
+        restoration.inpaint_biharmonic(self.image, self.mask,
+                                       multichannel=True, workers=workers)
+
+
+class CalibrateDenoiserSuite:
+    """Benchmark for the J-invariant parameter search."""
+    params = [[1, 4], [None, 2]]
+    param_names = ['workers', 'halving_factor']
+
+    def setup(self, workers, halving_factor):
+        rstate = np.random.RandomState(0)
+        image = data.camera()[::2, ::2] / 255
+        self.image = image + 0.1 * rstate.standard_normal(image.shape)
+        self.parameters = {'weight': np.linspace(0.01, 0.3, 16)}
+        try:
+            restoration.calibrate_denoiser(
+                self.image[:8, :8], restoration.denoise_tv_chambolle,
+                {'weight': [0.1]}, workers=workers)
+        except TypeError:
+            raise NotImplementedError("workers unavailable")
+
+    def time_calibrate_denoiser(self, workers, halving_factor):
+        restoration.calibrate_denoiser(
+            self.image, restoration.denoise_tv_chambolle, self.parameters,
+            approximate_loss=False, halving_factor=halving_factor,
+            workers=workers)
+
+
+class UnwrapStackSuite:
+    """Benchmark for unwrapping a stack of 2D phase images."""
+    params = [1, 4]
+    param_names = ['workers']
+
+    def setup(self, workers):
+        rstate = np.random.RandomState(0)
+        c0, c1 = np.ogrid[-1:1:128j, -1:1:128j]
+        gaussian = np.exp(-(c0 ** 2 + c1 ** 2))
+        frames = np.linspace(4, 14, 100)[:, np.newaxis, np.newaxis] * np.pi
+        image = frames * gaussian + 0.1 * rstate.standard_normal((100, 128,
+                                                                  128))
+        self.image = np.angle(np.exp(1j * image))
+        try:
+            restoration.unwrap_phase(self.image[:1], stack=True,
+                                     workers=workers)
+        except TypeError:
+            raise NotImplementedError("stack unavailable")
+
+    def time_unwrap_phase_stack(self, workers):
+        restoration.unwrap_phase(self.image, stack=True, workers=workers)
+
+    def time_unwrap_phase_loop(self, workers):
+        for frame in self.image:
+            restoration.unwrap_phase(frame)
+
+
 class RollingBall(object):
     """Benchmark Rolling Ball algorithm."""
 
@@ -108,6 +349,12 @@ class RollingBall(object):
     time_rollingball.params = [25, 50, 75, 100, 150, 200]
     time_rollingball.param_names = ["radius"]
 
+    def time_rollingball_paraboloid(self, radius):
+        restoration.rolling_ball(data.coins(), radius=radius,
+                                 method='paraboloid')
+    time_rollingball_paraboloid.params = [25, 100, 200, 1000]
+    time_rollingball_paraboloid.param_names = ["radius"]
+
     def peakmem_reference(self, *args):
         """Provide reference for memory measurement with empty benchmark.
 
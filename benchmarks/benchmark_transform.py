@@ -12,3 +12,151 @@ class TransformSuite:
 
     def time_hough_line(self):
         result1, result2, result3 = transform.hough_line(self.image)
+
+
+class HoughCircleSuite:
+    """Benchmark for the circular Hough transform."""
+    params = [np.float64, np.uint16]
+    param_names = ['dtype']
+
+    def setup(self, dtype):
+        from skimage.draw import circle_perimeter
+        self.image = np.zeros((512, 512), dtype=bool)
+        for r, c, rad in [(150, 150, 40), (300, 350, 80), (400, 120, 25)]:
+            self.image[circle_perimeter(r, c, rad)] = True
+        self.radii = np.arange(20, 100)
+
+    def time_hough_circle(self, dtype):
+        transform.hough_circle(self.image, self.radii, normalize=False,
+                               dtype=dtype)
+
+    def peakmem_hough_circle(self, dtype):
+        transform.hough_circle(self.image, self.radii, normalize=False,
+                               dtype=dtype)
+
+    def peakmem_hough_circle_peaks_streaming(self, dtype):
+        if not hasattr(transform, 'hough_circle_peaks_streaming'):
+            raise NotImplementedError("streaming peaks unavailable")
+        transform.hough_circle_peaks_streaming(
+            self.image, self.radii, normalize=False, dtype=dtype,
+            total_num_peaks=3)
+
+
+class ResizeSuite:
+    """Benchmark for down-sampling with anti-aliasing."""
+    params = ([np.float32, np.float64], ['gaussian', 'box', 'lanczos'])
+    param_names = ['dtype', 'method']
+
+    def setup(self, dtype, method):
+        if (method != 'gaussian'
+                and not hasattr(transform, 'resize_separable')):
+            raise NotImplementedError("resize_separable unavailable")
+        self.image = np.random.random((2048, 2048)).astype(dtype)
+
+    def time_thumbnail(self, dtype, method):
+        if method == 'gaussian':
+            transform.resize(self.image, (128, 128), anti_aliasing=True)
+        else:
+            transform.resize_separable(self.image, (128, 128), kernel=method)
+
+
+class PyramidSuite:
+    """Benchmark for Gaussian pyramids."""
+    params = [np.float32, np.float64]
+    param_names = ['dtype']
+
+    def setup(self, dtype):
+        self.image = np.random.random((2048, 2048)).astype(dtype)
+
+    def time_pyramid_gaussian(self, dtype):
+        for layer in transform.pyramid_gaussian(self.image):
+            pass
+
+
+class RadonSuite:
+    """Benchmark for the Radon transform and filtered back-projection."""
+    params = [np.float32, np.float64]
+    param_names = ['dtype']
+
+    def setup(self, dtype):
+        self.image = np.random.random((256, 256)).astype(dtype)
+        self.theta = np.linspace(0, 180, 360, endpoint=False)
+        self.sinogram = transform.radon(self.image, self.theta)
+
+    def time_radon(self, dtype):
+        transform.radon(self.image, self.theta)
+
+    def time_iradon(self, dtype):
+        transform.iradon(self.sinogram, self.theta)
+
+
+class IradonSartSuite:
+    """Benchmark for SART and OS-SART reconstructions."""
+    params = ([np.float32, np.float64], [None, 10])
+    param_names = ['dtype', 'n_subsets']
+
+    def setup(self, dtype, n_subsets):
+        image = np.zeros((128, 128))
+        image[40:90, 50:80] = 1
+        self.theta = np.linspace(0, 180, 90, endpoint=False)
+        self.sinogram = transform.radon(image, self.theta).astype(dtype)
+        try:
+            transform.iradon_sart(self.sinogram[:, :1], self.theta[:1],
+                                  n_subsets=n_subsets)
+        except TypeError:
+            raise NotImplementedError("ordered subsets unavailable")
+
+    def time_iradon_sart(self, dtype, n_subsets):
+        transform.iradon_sart(self.sinogram, self.theta, n_subsets=n_subsets)
+
+
+class RansacSuite:
+    """Benchmark for RANSAC estimation of geometric transforms."""
+    params = (['affine', 'projective'], [None, 64])
+    param_names = ['model', 'batch_size']
+
+    def setup(self, model, batch_size):
+        from skimage.measure import ransac
+        self.ransac = ransac
+        self.model_class, self.min_samples = {
+            'affine': (transform.AffineTransform, 3),
+            'projective': (transform.ProjectiveTransform, 4)}[model]
+        random_state = np.random.RandomState(0)
+        self.src = 500 * random_state.random_sample((2000, 2))
+        tform = transform.AffineTransform(scale=(0.9, 1.1), rotation=0.2,
+                                          translation=(20, -10))
+        self.dst = tform(self.src) + random_state.normal(size=(2000, 2))
+        outliers = random_state.random_sample(2000) < 0.5
+        self.dst[outliers] = 500 * random_state.random_sample(
+            (np.count_nonzero(outliers), 2))
+        try:
+            ransac((self.src, self.dst), self.model_class, self.min_samples,
+                   2, max_trials=1, batch_size=batch_size)
+        except TypeError:
+            raise NotImplementedError("batched RANSAC unavailable")
+
+    def time_ransac(self, model, batch_size):
+        self.ransac((self.src, self.dst), self.model_class, self.min_samples,
+                    2, max_trials=500, random_state=0, batch_size=batch_size)
+
+
+class GeometricTransformSuite:
+    """Benchmark for applying composed geometric transforms."""
+    params = ['affine', 'projective']
+    param_names = ['model']
+
+    def setup(self, model):
+        tform = (transform.SimilarityTransform(scale=1.1, rotation=0.3)
+                 + transform.AffineTransform(shear=0.1,
+                                             translation=(20, -10)))
+        if model == 'projective':
+            tform += transform.ProjectiveTransform(
+                np.array([[1, 0, 0], [0, 1, 0], [1e-4, 2e-4, 1]]))
+        self.tform = tform
+        self.coords = 500 * np.random.random_sample((1000000, 2))
+
+    def time_call(self, model):
+        self.tform(self.coords)
+
+    def time_inverse(self, model):
+        self.tform.inverse(self.coords)
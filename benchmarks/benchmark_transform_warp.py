@@ -52,3 +52,24 @@ class WarpSuite:
         transformations."""
         result = warp(self.image, self.tform, order=self.order,
                       preserve_range=True)
+
+
+class WarpMultichannelSuite:
+    """Benchmark for warping color images and volumes with a matrix."""
+    params = (['rgb', 'volume'], [0, 1])
+    param_names = ['shape', 'order']
+
+    def setup(self, shape, order):
+        if shape == 'rgb':
+            self.image = np.random.random((2048, 2048, 3)).astype(np.float32)
+            self.matrix = SimilarityTransform(
+                rotation=np.pi / 10, translation=(0, 4)).params
+        else:
+            self.image = np.random.random((128, 128, 128)).astype(np.float32)
+            self.matrix = np.eye(4)
+            self.matrix[:3, :3] = [[0.95, 0.1, 0], [-0.1, 0.95, 0],
+                                   [0, 0, 1.05]]
+        self.order = order
+
+    def time_warp(self, shape, order):
+        warp(self.image, self.matrix, order=self.order)
@@ -9,9 +9,23 @@ try:
     import scipy.fft
     from scipy.fft import next_fast_len
     fftmodule = scipy.fft
+    _workers_supported = True
 except ImportError:
     import numpy.fft
     fftmodule = numpy.fft
     from scipy.fftpack import next_fast_len
+    _workers_supported = False
+
+
+def _workers_kwarg(workers):
+    """Keyword arguments passing `workers` to `fftmodule` functions.
+
+    ``numpy.fft`` has no ``workers`` argument, in which case it is dropped and
+    the transforms run on a single thread.
+    """
+    if workers is None or not _workers_supported:
+        return {}
+    return {'workers': workers}
+
 
 __all__ = ['fftmodule', 'next_fast_len']
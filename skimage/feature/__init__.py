@@ -18,7 +18,7 @@ from .corner import (corner_kitchen_rosenfeld, corner_harris,
                      hessian_matrix_eigvals, hessian_matrix_det,
                      corner_moravec, corner_orientations,
                      shape_index)
-from .template import match_template
+from .template import match_template, match_templates
 from .brief import BRIEF
 from .censure import CENSURE
 from .orb import ORB
@@ -78,6 +78,7 @@ __all__ = ['canny',
            'corner_fast',
            'corner_orientations',
            'match_template',
+           'match_templates',
            'register_translation',
            'masked_register_translation',
            'BRIEF',
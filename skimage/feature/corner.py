@@ -12,7 +12,8 @@ from .corner_cy import _corner_fast
 from ._hessian_det_appx import _hessian_matrix_det
 from ..transform import integral_image
 from .._shared.utils import safe_as_int
-from .corner_cy import _corner_moravec, _corner_orientations
+from .corner_cy import (_corner_moravec, _corner_orientations,
+                        _symmetric_eigvals_33)
 from warnings import warn
 
 
@@ -250,7 +251,7 @@ def _image_orthogonal_matrix22_eigvals(M00, M01, M11):
     return l1, l2
 
 
-def _symmetric_compute_eigenvalues(S_elems):
+def _symmetric_compute_eigenvalues(S_elems, num_threads=None):
     """Compute eigenvalues from the upperdiagonal entries of a symmetric matrix
 
     Parameters
@@ -258,6 +259,9 @@ def _symmetric_compute_eigenvalues(S_elems):
     S_elems : list of ndarray
         The upper-diagonal elements of the matrix, as returned by
         `hessian_matrix` or `structure_tensor`.
+    num_threads : int or None, optional
+        The number of threads used for 3D images. If ``None``, the OpenMP
+        default is used.
 
     Returns
     -------
@@ -269,6 +273,17 @@ def _symmetric_compute_eigenvalues(S_elems):
 
     if len(S_elems) == 3:  # Use fast Cython code for 2D
         eigs = np.stack(_image_orthogonal_matrix22_eigvals(*S_elems))
+    elif len(S_elems) == 6:
+        # closed form solution for 3D, without stacking the matrices
+        dtype = np.result_type(*S_elems)
+        if dtype != np.float32:
+            dtype = np.float64
+        shape = np.shape(S_elems[0])
+        S_elems = [np.ascontiguousarray(elem, dtype=dtype).ravel()
+                   for elem in S_elems]
+        eigs = np.empty((3, S_elems[0].size), dtype=dtype)
+        _symmetric_eigvals_33(*S_elems, eigs, num_threads or 0)
+        eigs = eigs.reshape((3, ) + shape)
     else:
         matrices = _symmetric_image(S_elems)
         # eigvalsh returns eigenvalues in increasing order. We want decreasing
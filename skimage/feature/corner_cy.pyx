@@ -5,7 +5,8 @@
 import numpy as np
 cimport numpy as cnp
 from libc.float cimport DBL_MAX
-from libc.math cimport atan2, fabs
+from libc.math cimport atan2, cos, fabs, hypot, sin, sqrt
+from cython.parallel import prange
 
 from .._shared.fused_numerics cimport np_floats
 from ..util import img_as_float64
@@ -289,3 +290,187 @@ def _corner_orientations(np_floats[:, ::1] image, Py_ssize_t[:, :] corners,
             orientations[i] = atan2(m01, m10)
 
     return np.asarray(orientations)
+
+
+cdef inline bint _refine_close_pair(double a00, double a01, double a02,
+                                    double a11, double a12, double a22,
+                                    double far, double* l0,
+                                    double* l1) nogil:
+    """Eigenvalues of a symmetric 3x3 matrix other than `far`.
+
+    They are the eigenvalues of the 2x2 matrix of the restriction to the
+    plane orthogonal to the eigenvector of `far`. Returns False, leaving `l0`
+    and `l1` unchanged, if the eigenvector cannot be determined.
+    """
+    cdef double v0, v1, v2, w0, w1, w2, u0, u1, u2, n, best
+    cdef double b00 = a00 - far, b11 = a11 - far, b22 = a22 - far
+    cdef double p, r, t, au0, au1, au2, aw0, aw1, aw2, mean, radius
+
+    # the eigenvector is orthogonal to the rows of A - far * I; take the
+    # largest cross product of two rows
+    v0 = a01 * a12 - a02 * b11
+    v1 = a02 * a01 - b00 * a12
+    v2 = b00 * b11 - a01 * a01
+    best = v0 * v0 + v1 * v1 + v2 * v2
+    w0 = a01 * b22 - a02 * a12
+    w1 = a02 * a02 - b00 * b22
+    w2 = b00 * a12 - a01 * a02
+    n = w0 * w0 + w1 * w1 + w2 * w2
+    if n > best:
+        v0 = w0; v1 = w1; v2 = w2; best = n
+    w0 = b11 * b22 - a12 * a12
+    w1 = a12 * a02 - a01 * b22
+    w2 = a01 * a12 - b11 * a02
+    n = w0 * w0 + w1 * w1 + w2 * w2
+    if n > best:
+        v0 = w0; v1 = w1; v2 = w2; best = n
+    if best < 1e-20:
+        return False
+    n = sqrt(best)
+    v0 /= n
+    v1 /= n
+    v2 /= n
+
+    # orthonormal basis (u, w) of the plane orthogonal to v, u being
+    # orthogonal to the axis along which v is smallest
+    if fabs(v0) <= fabs(v1) and fabs(v0) <= fabs(v2):
+        u0 = 0; u1 = v2; u2 = -v1
+    elif fabs(v1) <= fabs(v2):
+        u0 = -v2; u1 = 0; u2 = v0
+    else:
+        u0 = v1; u1 = -v0; u2 = 0
+    n = sqrt(u0 * u0 + u1 * u1 + u2 * u2)
+    u0 /= n
+    u1 /= n
+    u2 /= n
+    w0 = v1 * u2 - v2 * u1
+    w1 = v2 * u0 - v0 * u2
+    w2 = v0 * u1 - v1 * u0
+
+    au0 = a00 * u0 + a01 * u1 + a02 * u2
+    au1 = a01 * u0 + a11 * u1 + a12 * u2
+    au2 = a02 * u0 + a12 * u1 + a22 * u2
+    aw0 = a00 * w0 + a01 * w1 + a02 * w2
+    aw1 = a01 * w0 + a11 * w1 + a12 * w2
+    aw2 = a02 * w0 + a12 * w1 + a22 * w2
+    p = u0 * au0 + u1 * au1 + u2 * au2
+    r = w0 * aw0 + w1 * aw1 + w2 * aw2
+    t = 0.5 * ((w0 * au0 + w1 * au1 + w2 * au2)
+               + (u0 * aw0 + u1 * aw1 + u2 * aw2))
+
+    mean = 0.5 * (p + r)
+    radius = hypot(0.5 * (p - r), t)
+    l0[0] = mean + radius
+    l1[0] = mean - radius
+    return True
+
+
+cdef inline void _symmetric_eigvals_33_pixel(double a00, double a01,
+                                             double a02, double a11,
+                                             double a12, double a22,
+                                             double* e0, double* e1,
+                                             double* e2) nogil:
+    """Eigenvalues of a symmetric 3x3 matrix, in decreasing order.
+
+    The characteristic polynomial of the shifted and scaled matrix is solved
+    in closed form with the trigonometric method. Two close roots of the
+    polynomial are only accurate to about the square root of the machine
+    precision, so only the root farthest from the others is kept and the
+    close pair is computed from the matrix restricted to the plane orthogonal
+    to its eigenvector.
+    """
+    cdef double shift = (a00 + a11 + a22) / 3
+    cdef double scale, c0, c1, c2_over_3, a_over_3, half_b, q, rho
+    cdef double theta, cos_theta, sin_theta, r0, r1, r2, tmp
+    cdef double sqrt3 = 1.7320508075688772
+
+    a00 -= shift
+    a11 -= shift
+    a22 -= shift
+    scale = max(max(max(fabs(a00), fabs(a01)), max(fabs(a02), fabs(a11))),
+                max(fabs(a12), fabs(a22)))
+    if scale == 0:
+        e0[0] = e1[0] = e2[0] = shift
+        return
+    a00 /= scale
+    a01 /= scale
+    a02 /= scale
+    a11 /= scale
+    a12 /= scale
+    a22 /= scale
+
+    # det(l * I - A) = l**3 - c2 * l**2 + c1 * l - c0
+    c0 = (a00 * a11 * a22 + 2 * a01 * a02 * a12 - a00 * a12 * a12
+          - a11 * a02 * a02 - a22 * a01 * a01)
+    c1 = (a00 * a11 - a01 * a01 + a00 * a22 - a02 * a02
+          + a11 * a22 - a12 * a12)
+    c2_over_3 = (a00 + a11 + a22) / 3
+
+    a_over_3 = (3 * c2_over_3 * c2_over_3 - c1) / 3
+    if a_over_3 < 0:
+        a_over_3 = 0
+    half_b = 0.5 * (c0 + c2_over_3 * (2 * c2_over_3 * c2_over_3 - c1))
+    q = a_over_3 * a_over_3 * a_over_3 - half_b * half_b
+    if q < 0:
+        q = 0
+
+    rho = sqrt(a_over_3)
+    theta = atan2(sqrt(q), half_b) / 3
+    cos_theta = cos(theta)
+    sin_theta = sin(theta)
+    r0 = c2_over_3 + 2 * rho * cos_theta
+    r1 = c2_over_3 - rho * (cos_theta + sqrt3 * sin_theta)
+    r2 = c2_over_3 - rho * (cos_theta - sqrt3 * sin_theta)
+
+    # sort in decreasing order
+    if r1 > r0:
+        tmp = r0; r0 = r1; r1 = tmp
+    if r2 > r1:
+        tmp = r1; r1 = r2; r2 = tmp
+        if r1 > r0:
+            tmp = r0; r0 = r1; r1 = tmp
+
+    # the error of the trigonometric roots is about eps / gap for a gap
+    # between two roots of the scaled matrix; only refine close pairs
+    if r0 - r1 >= r1 - r2:
+        if r1 - r2 < 1e-3 and _refine_close_pair(a00, a01, a02, a11, a12, a22, r0, &r1, &r2):
+            if r1 < r2:
+                tmp = r1; r1 = r2; r2 = tmp
+    elif r0 - r1 < 1e-3:
+        if _refine_close_pair(a00, a01, a02, a11, a12, a22, r2, &r0, &r1):
+            if r0 < r1:
+                tmp = r0; r0 = r1; r1 = tmp
+
+    e0[0] = r0 * scale + shift
+    e1[0] = r1 * scale + shift
+    e2[0] = r2 * scale + shift
+
+
+def _symmetric_eigvals_33(np_floats[::1] a00, np_floats[::1] a01,
+                          np_floats[::1] a02, np_floats[::1] a11,
+                          np_floats[::1] a12, np_floats[::1] a22,
+                          np_floats[:, ::1] out, int num_threads=0):
+    """Compute the eigenvalues of symmetric 3x3 matrices in closed form.
+
+    Parameters
+    ----------
+    a00, a01, a02, a11, a12, a22 : (N, ) array
+        Upper-diagonal elements of the matrices.
+    out : (3, N) array
+        Output array, receiving the eigenvalues in decreasing order.
+    num_threads : int, optional
+        The number of threads used, 0 selecting the OpenMP default.
+
+    """
+    cdef Py_ssize_t i, n = a00.shape[0]
+    cdef double e0, e1, e2
+
+    for i in prange(n, nogil=True, schedule='static',
+                    num_threads=num_threads):
+        # assigned in the loop, so that they are private to each thread
+        e0 = e1 = e2 = 0
+        _symmetric_eigvals_33_pixel(a00[i], a01[i], a02[i],
+                                    a11[i], a12[i], a22[i], &e0, &e1, &e2)
+        out[0, i] = <np_floats>e0
+        out[1, i] = <np_floats>e1
+        out[2, i] = <np_floats>e2
@@ -95,7 +95,7 @@ def haar_like_feature(int_image, r, c, width, height, feature_type=None,
 
     Parameters
     ----------
-    int_image : (M, N) ndarray
+    int_image : (M, N) ndarray or IntegralImage
         Integral image for which the features need to be computed.
     r : int
         Row-coordinate of top left corner of the detection window.
@@ -192,6 +192,7 @@ def haar_like_feature(int_image, r, c, width, height, feature_type=None,
            :DOI:`10.1109/CVPR.2001.990517`
 
     """
+    int_image = np.asarray(int_image)
     if feature_coord is None:
         feature_type_ = _validate_feature_type(feature_type)
 
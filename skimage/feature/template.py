@@ -1,7 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-from scipy.signal import fftconvolve
 
-from .._shared.utils import check_nD
+from .._shared.fft import fftmodule, next_fast_len
+from .._shared.utils import check_nD, _supported_float_type
 
 
 def _window_sum_2d(image, window_shape):
@@ -60,7 +62,8 @@ def match_template(image, template, pad_input=False, mode='constant',
     Returns
     -------
     output : array
-        Response image with correlation coefficients.
+        Response image with correlation coefficients. It is single-precision
+        if both `image` and `template` are single-precision.
 
     Notes
     -----
@@ -110,70 +113,180 @@ def match_template(image, template, pad_input=False, mode='constant',
            [ 0.   ,  0.   ,  0.   ,  0.125, -1.   ,  0.125],
            [ 0.   ,  0.   ,  0.   ,  0.125,  0.125,  0.125]])
     """
+    return match_templates(image, [template], pad_input=pad_input,
+                           mode=mode, constant_values=constant_values,
+                           num_workers=1)[0]
+
+
+def match_templates(image, templates, pad_input=False, mode='constant',
+                    constant_values=0, num_workers=None):
+    """Match several templates to the same 2-D or 3-D image.
+
+    This is equivalent to calling `match_template` once per template, but the
+    padded image, its Fourier spectrum and its windowed (integral) sums are
+    computed only once per distinct template shape and shared between all
+    templates of that shape.
+
+    Parameters
+    ----------
+    image : (M, N[, D]) array
+        2-D or 3-D input image.
+    templates : sequence of arrays
+        Templates to locate. Each must be `(m <= M, n <= N[, d <= D])`.
+        Templates may have different shapes.
+    pad_input : bool
+        If True, pad `image` so that outputs are the same size as the image,
+        and output values correspond to the template center. See
+        `match_template`.
+    mode : see `numpy.pad`, optional
+        Padding mode.
+    constant_values : see `numpy.pad`, optional
+        Constant values used in conjunction with ``mode='constant'``.
+    num_workers : int or None, optional
+        The number of parallel threads used to correlate the templates of a
+        given shape with the image. If set to ``None``, the full set of
+        available cores are used.
+
+    Returns
+    -------
+    outputs : list of arrays
+        Response images with correlation coefficients, in the same order as
+        `templates`. They are single-precision if `image` and all templates
+        are single-precision, and double-precision otherwise.
+
+    See Also
+    --------
+    match_template
+
+    Examples
+    --------
+    >>> image = np.zeros((6, 6))
+    >>> image[1, 1] = 1
+    >>> image[4, 4] = -1
+    >>> template_pos = np.zeros((3, 3))
+    >>> template_pos[1, 1] = 1
+    >>> results = match_templates(image, [template_pos, -template_pos])
+    >>> [np.unravel_index(np.argmax(r), r.shape) for r in results]
+    [(0, 0), (3, 3)]
+    """
     check_nD(image, (2, 3))
 
-    if image.ndim < template.ndim:
-        raise ValueError("Dimensionality of template must be less than or "
-                         "equal to the dimensionality of image.")
-    if np.any(np.less(image.shape, template.shape)):
-        raise ValueError("Image must be larger than template.")
+    templates = [np.asarray(template) for template in templates]
+    for template in templates:
+        if image.ndim < template.ndim:
+            raise ValueError("Dimensionality of template must be less than "
+                             "or equal to the dimensionality of image.")
+        if np.any(np.less(image.shape, template.shape)):
+            raise ValueError("Image must be larger than template.")
 
+    float_dtype = _supported_float_type([image.dtype]
+                                        + [t.dtype for t in templates])
     image_shape = image.shape
+    image = np.asarray(image, dtype=float_dtype)
+
+    # group templates by shape, so that everything depending only on the
+    # image and the template shape is computed once per group
+    groups = {}
+    for i, template in enumerate(templates):
+        groups.setdefault(template.shape, []).append(i)
 
-    image = np.array(image, dtype=np.float64, copy=False)
-
-    pad_width = tuple((width, width) for width in template.shape)
-    if mode == 'constant':
-        image = np.pad(image, pad_width=pad_width, mode=mode,
-                       constant_values=constant_values)
-    else:
-        image = np.pad(image, pad_width=pad_width, mode=mode)
-
-    # Use special case for 2-D images for much better performance in
-    # computation of integral images
-    if image.ndim == 2:
-        image_window_sum = _window_sum_2d(image, template.shape)
-        image_window_sum2 = _window_sum_2d(image ** 2, template.shape)
-    elif image.ndim == 3:
-        image_window_sum = _window_sum_3d(image, template.shape)
-        image_window_sum2 = _window_sum_3d(image ** 2, template.shape)
-
-    template_mean = template.mean()
-    template_volume = np.prod(template.shape)
-    template_ssd = np.sum((template - template_mean) ** 2)
-
-    if image.ndim == 2:
-        xcorr = fftconvolve(image, template[::-1, ::-1],
-                            mode="valid")[1:-1, 1:-1]
-    elif image.ndim == 3:
-        xcorr = fftconvolve(image, template[::-1, ::-1, ::-1],
-                            mode="valid")[1:-1, 1:-1, 1:-1]
-
-    numerator = xcorr - image_window_sum * template_mean
-
-    denominator = image_window_sum2
-    np.multiply(image_window_sum, image_window_sum, out=image_window_sum)
-    np.divide(image_window_sum, template_volume, out=image_window_sum)
-    denominator -= image_window_sum
-    denominator *= template_ssd
-    np.maximum(denominator, 0, out=denominator)  # sqrt of negative number not allowed
-    np.sqrt(denominator, out=denominator)
-
-    response = np.zeros_like(xcorr, dtype=np.float64)
-
-    # avoid zero-division
-    mask = denominator > np.finfo(np.float64).eps
-
-    response[mask] = numerator[mask] / denominator[mask]
-
-    slices = []
-    for i in range(template.ndim):
-        if pad_input:
-            d0 = (template.shape[i] - 1) // 2
-            d1 = d0 + image_shape[i]
+    outputs = [None] * len(templates)
+    for template_shape, indices in groups.items():
+        padded = _PaddedImage(image, template_shape, mode, constant_values)
+
+        def match_one(i):
+            return padded.correlate(templates[i], image_shape, pad_input)
+
+        if num_workers == 1 or len(indices) == 1:
+            responses = [match_one(i) for i in indices]
         else:
-            d0 = template.shape[i] - 1
-            d1 = d0 + image_shape[i] - template.shape[i] + 1
-        slices.append(slice(d0, d1))
+            with ThreadPoolExecutor(max_workers=num_workers) as ex:
+                responses = list(ex.map(match_one, indices))
+        for i, response in zip(indices, responses):
+            outputs[i] = response
+
+    return outputs
+
 
-    return response[tuple(slices)]
+class _PaddedImage:
+    """Padded image with its spectrum and window sums for a template shape.
+    """
+
+    def __init__(self, image, template_shape, mode, constant_values):
+        self.template_shape = template_shape
+        self.dtype = image.dtype
+
+        pad_width = tuple((width, width) for width in template_shape)
+        if mode == 'constant':
+            image = np.pad(image, pad_width=pad_width, mode=mode,
+                           constant_values=constant_values)
+        else:
+            image = np.pad(image, pad_width=pad_width, mode=mode)
+
+        # Use special case for 2-D images for much better performance in
+        # computation of integral images. The running sums are accumulated
+        # in double precision, even for single-precision images, to avoid
+        # catastrophic cancellation in the variance below.
+        image64 = image.astype(np.float64, copy=False)
+        if image.ndim == 2:
+            window_sum = _window_sum_2d(image64, template_shape)
+            window_sum2 = _window_sum_2d(image64 ** 2, template_shape)
+        elif image.ndim == 3:
+            window_sum = _window_sum_3d(image64, template_shape)
+            window_sum2 = _window_sum_3d(image64 ** 2, template_shape)
+        self.window_sum = window_sum
+
+        # image variance within each window, up to the template volume
+        self.template_volume = np.prod(template_shape)
+        window_var = window_sum2
+        window_var -= window_sum * window_sum / self.template_volume
+        np.maximum(window_var, 0, out=window_var)
+        self.window_var = window_var
+
+        # spectrum of the padded image, zero-padded to an FFT-friendly size
+        # large enough for a linear (non-circular) correlation
+        self.fft_shape = tuple(next_fast_len(s1 + s2 - 1)
+                               for s1, s2 in zip(image.shape, template_shape))
+        self.image_shape = image.shape
+        self.image_fft = fftmodule.rfftn(image, self.fft_shape)
+
+    def correlate(self, template, image_shape, pad_input):
+        template = np.asarray(template, dtype=self.dtype)
+        ndim = template.ndim
+
+        template_mean = template.mean()
+        template_ssd = np.sum((template - template_mean) ** 2)
+
+        # equivalent to ``fftconvolve(image, template[::-1, ...], 'valid')``
+        # with the cached image spectrum
+        flipped = template[(slice(None, None, -1),) * ndim]
+        template_fft = fftmodule.rfftn(flipped, self.fft_shape)
+        template_fft *= self.image_fft
+        xcorr = fftmodule.irfftn(template_fft, self.fft_shape)
+        xcorr = xcorr[tuple(slice(t, s - 1)
+                            for t, s in zip(self.template_shape,
+                                            self.image_shape))]
+
+        numerator = xcorr - self.window_sum * template_mean
+
+        denominator = self.window_var * template_ssd
+        np.sqrt(denominator, out=denominator)
+
+        response = np.zeros_like(xcorr, dtype=self.dtype)
+
+        # avoid zero-division
+        mask = denominator > np.finfo(np.float64).eps
+
+        response[mask] = numerator[mask] / denominator[mask]
+
+        slices = []
+        for i in range(ndim):
+            if pad_input:
+                d0 = (template.shape[i] - 1) // 2
+                d1 = d0 + image_shape[i]
+            else:
+                d0 = template.shape[i] - 1
+                d1 = d0 + image_shape[i] - template.shape[i] + 1
+            slices.append(slice(d0, d1))
+
+        return response[tuple(slices)]
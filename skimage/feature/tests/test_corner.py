@@ -1,6 +1,7 @@
 import numpy as np
 
 from skimage._shared.testing import (assert_almost_equal, assert_array_equal,
+                                     assert_allclose,
                                      assert_equal)
 from skimage import data
 from skimage import img_as_float
@@ -184,6 +185,39 @@ def test_hessian_matrix_eigvals():
                                       [0,  0,  0,  0, 0]]))
 
 
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_hessian_matrix_eigvals_3d_closed_form(dtype):
+    rng = np.random.RandomState(0)
+    image = rng.rand(8, 9, 10).astype(dtype)
+    H = hessian_matrix(image, sigma=1)
+    # degenerate matrices: null and multiple eigenvalues
+    for i, elem in enumerate(H):
+        elem[0] = 0
+        elem[1] = 2 if i in (0, 3, 5) else 0
+    E = hessian_matrix_eigvals(H)
+    assert E.dtype == dtype
+
+    matrices = np.zeros(image.shape + (3, 3))
+    for elem, (row, col) in zip(H, [(0, 0), (0, 1), (0, 2),
+                                    (1, 1), (1, 2), (2, 2)]):
+        matrices[..., row, col] = matrices[..., col, row] = elem
+    expected = np.moveaxis(np.linalg.eigvalsh(matrices)[..., ::-1], -1, 0)
+    decimal = 5 if dtype == np.float32 else 10
+    assert_almost_equal(E, expected, decimal=decimal)
+
+
+def test_hessian_matrix_eigvals_3d_near_degenerate():
+    # two eigenvalues differing by 1e-8 of the largest one
+    rng = np.random.RandomState(0)
+    Q, _ = np.linalg.qr(rng.randn(3, 3))
+    matrix = Q @ np.diag([1 + 1e-8, 1, -0.5]) @ Q.T
+    H = [np.full((2, 2, 2), matrix[row, col])
+         for row, col in [(0, 0), (0, 1), (0, 2), (1, 1), (1, 2), (2, 2)]]
+    E = hessian_matrix_eigvals(H)
+    expected = np.linalg.eigvalsh(matrix)[::-1]
+    assert_allclose(E[:, 0, 0, 0], expected, rtol=0, atol=1e-13)
+
+
 def test_hessian_matrix_eigvals_3d(im3d):
     H = hessian_matrix(im3d)
     E = hessian_matrix_eigvals(H)
@@ -3,7 +3,7 @@ from skimage._shared.testing import assert_almost_equal, assert_equal
 
 from skimage import data, img_as_float
 from skimage.morphology import diamond
-from skimage.feature import match_template, peak_local_max
+from skimage.feature import match_template, match_templates, peak_local_max
 from skimage._shared import testing
 
 
@@ -184,3 +184,63 @@ def test_bounding_values():
     print(result.max())
     assert result.max() < 1 + 1e-7
     assert result.min() > -1 - 1e-7
+
+
+@testing.parametrize('pad_input', [False, True])
+def test_match_templates(pad_input):
+    np.random.seed(1)
+    image = np.random.rand(40, 50)
+    templates = [image[5:12, 20:30], image[30:37, 2:12],
+                 image[10:15, 10:13], np.random.rand(7, 10)]
+
+    results = match_templates(image, templates, pad_input=pad_input,
+                              num_workers=2)
+
+    assert len(results) == len(templates)
+    for template, result in zip(templates, results):
+        expected = match_template(image, template, pad_input=pad_input)
+        assert result.dtype == np.float64
+        assert_almost_equal(result, expected)
+    assert_equal(np.unravel_index(results[0].argmax(), results[0].shape),
+                 (8, 25) if pad_input else (5, 20))
+
+
+def test_match_templates_3d():
+    np.random.seed(1)
+    image = np.random.rand(12, 12, 12)
+    templates = [image[3:6, 5:8, 4:7], image[1:4, 1:4, 1:4]]
+
+    results = match_templates(image, templates)
+
+    assert_equal(np.unravel_index(results[0].argmax(), results[0].shape),
+                 (3, 5, 4))
+    assert_equal(np.unravel_index(results[1].argmax(), results[1].shape),
+                 (1, 1, 1))
+
+
+def test_match_template_float32():
+    np.random.seed(1)
+    image = np.random.rand(40, 50).astype(np.float32)
+    template = image[5:12, 20:30]
+
+    result = match_template(image, template)
+
+    assert result.dtype == np.float32
+    assert_almost_equal(result,
+                        match_template(image.astype(np.float64), template),
+                        decimal=5)
+    assert_equal(np.unravel_index(result.argmax(), result.shape), (5, 20))
+
+
+@testing.parametrize('scale', [1e-4, 1e-6])
+def test_match_template_float32_low_amplitude(scale):
+    np.random.seed(1)
+    image = (scale * np.random.rand(40, 50)).astype(np.float32)
+    template = image[5:12, 20:30]
+
+    result = match_template(image, template)
+
+    assert_almost_equal(result,
+                        match_template(image.astype(np.float64), template),
+                        decimal=5)
+    assert_equal(np.unravel_index(result.argmax(), result.shape), (5, 20))
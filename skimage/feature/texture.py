@@ -352,7 +352,7 @@ def multiblock_lbp(int_image, r, c, width, height):
 
     Parameters
     ----------
-    int_image : (N, M) array
+    int_image : (N, M) array or IntegralImage
         Integral image.
     r : int
         Row-coordinate of top left corner of a rectangle containing feature.
@@ -9,13 +9,15 @@ perpendicular but not along the structure.
 """
 
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from warnings import warn
 
 import numpy as np
 
 from ..util import img_as_float, invert
 from .._shared.utils import check_nD
-from ..feature.corner import hessian_matrix, hessian_matrix_eigvals
+from ..feature.corner import hessian_matrix, _symmetric_compute_eigenvalues
 
 
 def _divide_nonzero(array1, array2, cval=1e-10):
@@ -106,13 +108,26 @@ def _check_sigmas(sigmas):
     return sigmas
 
 
+def _scaled_hessian_eigenvalues(image, sigma, mode, cval, num_threads=None):
+    """Eigenvalues of the Hessian matrix, scaled by ``sigma ** 2``."""
+    hessian_elements = hessian_matrix(image, sigma=sigma, order='rc',
+                                      mode=mode, cval=cval)
+
+    # Correct for scale
+    for e in hessian_elements:
+        e *= sigma ** 2
+
+    return _symmetric_compute_eigenvalues(hessian_elements,
+                                          num_threads=num_threads)
+
+
 def compute_hessian_eigenvalues(image, sigma, sorting='none',
-                                mode='constant', cval=0):
+                                mode='constant', cval=0, tile_size=None,
+                                num_workers=1):
     """
     Compute Hessian eigenvalues of nD images.
 
-    For 2D images, the computation uses a more efficient, skimage-based
-    algorithm.
+    For 2D and 3D images, the eigenvalues are computed in closed form.
 
     Parameters
     ----------
@@ -129,26 +144,62 @@ def compute_hessian_eigenvalues(image, sigma, sorting='none',
     cval : float, optional
         Used in conjunction with mode 'constant', the value outside
         the image boundaries.
+    tile_size : int or None, optional
+        The image is processed by bands of ``tile_size`` rows (along the first
+        axis), extended by the support of the Gaussian kernel and of the
+        derivatives, so that the Hessian matrix is never stored for the whole
+        image and the result is the same as without tiling. Each band also
+        filters its margin rows, so bands should be much larger than the
+        margin of about ``4 * sigma`` rows. If ``None`` (default), the image
+        is not tiled. Tiling is not used with ``mode='wrap'``.
+    num_workers : int or None, optional
+        The number of parallel threads used to process the tiles, each
+        holding the Hessian matrix of one band. If set to ``None``, the
+        number of CPUs is used.
 
     Returns
     -------
     eigenvalues : (D, N, ..., M) ndarray
         Array with (sorted) eigenvalues of Hessian eigenvalues for each pixel
-        of the input image.
+        of the input image. Single-precision images give single-precision
+        eigenvalues.
     """
 
     # Convert image to float
     image = img_as_float(image)
 
-    # Make nD hessian
-    hessian_elements = hessian_matrix(image, sigma=sigma, order='rc',
-                                      mode=mode, cval=cval)
-
-    # Correct for scale
-    hessian_elements = [(sigma ** 2) * e for e in hessian_elements]
-
-    # Compute Hessian eigenvalues
-    hessian_eigenvalues = hessian_matrix_eigvals(hessian_elements)
+    n_rows = image.shape[0]
+    # gaussian_filter is truncated at 4 standard deviations, and each of the
+    # two derivatives needs one more row
+    margin = int(4 * sigma + 0.5) + 2
+    if tile_size is None:
+        tile_size = n_rows
+    elif tile_size < 1:
+        raise ValueError("`tile_size` must be a positive integer.")
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    elif num_workers < 1:
+        raise ValueError("`num_workers` must be a positive integer.")
+
+    if tile_size >= n_rows or mode == 'wrap':
+        hessian_eigenvalues = _scaled_hessian_eigenvalues(image, sigma, mode,
+                                                          cval)
+    else:
+        hessian_eigenvalues = np.empty((image.ndim, ) + image.shape,
+                                       dtype=image.dtype)
+
+        def process_tile(start):
+            stop = min(start + tile_size, n_rows)
+            extended_start = max(start - margin, 0)
+            extended_stop = min(stop + margin, n_rows)
+            tile_eigenvalues = _scaled_hessian_eigenvalues(
+                image[extended_start:extended_stop], sigma, mode, cval,
+                num_threads=1)
+            hessian_eigenvalues[:, start:stop] = tile_eigenvalues[
+                :, start - extended_start:stop - extended_start]
+
+        with ThreadPoolExecutor(max_workers=num_workers) as ex:
+            list(ex.map(process_tile, range(0, n_rows, tile_size)))
 
     if sorting == 'abs':
 
@@ -228,9 +279,9 @@ def meijering(image, sigmas=range(1, 10, 2), alpha=None,
     if black_ridges:
         image = invert(image)
 
-    # Generate empty (n+1)D arrays for storing auxiliary images filtered at
-    # different (sigma) scales
-    filtered_array = np.zeros(sigmas.shape + image.shape)
+    # Generate an empty array for the maximum of the images filtered at
+    # the different (sigma) scales, which are all non-negative
+    filtered_max = np.zeros(image.shape)
 
     # Filtering for all (sigma) scales
     for i, sigma in enumerate(sigmas):
@@ -258,11 +309,10 @@ def meijering(image, sigmas=range(1, 10, 2), alpha=None,
             # Remove background
             filtered = np.where(auxiliary < 0, filtered, 0)
 
-            # Store results in (n+1)D matrices
-            filtered_array[i] = filtered
+            # Keep for every pixel the maximum value over all (sigma) scales
+            np.maximum(filtered_max, filtered, out=filtered_max)
 
-    # Return for every pixel the maximum value over all (sigma) scales
-    return np.max(filtered_array, axis=0)
+    return filtered_max
 
 
 def sato(image, sigmas=range(1, 10, 2), black_ridges=True,
@@ -331,9 +381,9 @@ def sato(image, sigmas=range(1, 10, 2), black_ridges=True,
     if not black_ridges:
         image = invert(image)
 
-    # Generate empty (n+1)D arrays for storing auxiliary images filtered
-    # at different (sigma) scales
-    filtered_array = np.zeros(sigmas.shape + image.shape)
+    # Generate an empty array for the maximum of the images filtered at
+    # the different (sigma) scales, which are all non-negative
+    filtered_max = np.zeros(image.shape)
 
     # Filtering for all (sigma) scales
     for i, sigma in enumerate(sigmas):
@@ -347,11 +397,12 @@ def sato(image, sigmas=range(1, 10, 2), black_ridges=True,
         # np.abs(lambda2) in 2D, np.sqrt(np.abs(lambda2 * lambda3)) in 3D
         filtered = np.abs(np.multiply.reduce(lambdas)) ** (1/len(lambdas))
 
-        # Remove background and store results in (n+1)D matrices
-        filtered_array[i] = np.where(lambdas[-1] > 0, filtered, 0)
+        # Remove background and keep for every pixel the maximum value over
+        # all (sigma) scales
+        np.maximum(filtered_max, np.where(lambdas[-1] > 0, filtered, 0),
+                   out=filtered_max)
 
-    # Return for every pixel the maximum value over all (sigma) scales
-    return np.max(filtered_array, axis=0)
+    return filtered_max
 
 
 def frangi(image, sigmas=range(1, 10, 2), scale_range=None,
@@ -448,10 +499,9 @@ def frangi(image, sigmas=range(1, 10, 2), scale_range=None,
     if black_ridges:
         image = invert(image)
 
-    # Generate empty (n+1)D arrays for storing auxiliary images filtered
-    # at different (sigma) scales
-    filtered_array = np.zeros(sigmas.shape + image.shape)
-    lambdas_array = np.zeros_like(filtered_array)
+    # Generate an empty array for the maximum of the images filtered at
+    # the different (sigma) scales, which are all non-negative
+    filtered_max = np.zeros(image.shape)
 
     # Filtering for all (sigma) scales
     for i, sigma in enumerate(sigmas):
@@ -475,19 +525,19 @@ def frangi(image, sigmas=range(1, 10, 2), scale_range=None,
         # see equation (12)in reference [1]_
         r_g = sum([lambda1 ** 2] + [lambdai ** 2 for lambdai in lambdas])
 
-        # Compute output image for given (sigma) scale and store results in
-        # (n+1)D matrices, see equations (13) and (15) in reference [1]_
-        filtered_array[i] = ((1 - np.exp(-r_a / alpha_sq))
-                             * np.exp(-r_b / beta_sq)
-                             * (1 - np.exp(-r_g / gamma_sq)))
+        # Compute output image for given (sigma) scale, see equations (13)
+        # and (15) in reference [1]_
+        filtered = ((1 - np.exp(-r_a / alpha_sq))
+                    * np.exp(-r_b / beta_sq)
+                    * (1 - np.exp(-r_g / gamma_sq)))
 
-        lambdas_array[i] = np.max(lambdas, axis=0)
+        # Remove background
+        filtered[np.max(lambdas, axis=0) > 0] = 0
 
-    # Remove background
-    filtered_array[lambdas_array > 0] = 0
+        # Keep for every pixel the maximum value over all (sigma) scales
+        np.maximum(filtered_max, filtered, out=filtered_max)
 
-    # Return for every pixel the maximum value over all (sigma) scales
-    return np.max(filtered_array, axis=0)
+    return filtered_max
 
 
 def hessian(image, sigmas=range(1, 10, 2), scale_range=None, scale_step=None,
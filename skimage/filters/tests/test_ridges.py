@@ -2,6 +2,7 @@ import pytest
 import numpy as np
 from numpy.testing import assert_allclose, assert_array_less, assert_equal
 from skimage.filters import meijering, sato, frangi, hessian
+from skimage.filters.ridges import compute_hessian_eigenvalues
 from skimage.data import camera, retina
 from skimage.util import crop, invert
 from skimage.color import rgb2gray
@@ -244,6 +245,30 @@ def test_border_warning(func):
         func(img, sigmas=[1])
 
 
+@pytest.mark.parametrize('mode', ['reflect', 'constant', 'wrap'])
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_hessian_eigenvalues_tiles(mode, dtype):
+    image = np.random.RandomState(0).rand(23, 14, 12).astype(dtype)
+    expected = compute_hessian_eigenvalues(image, 1.5, sorting='abs',
+                                           mode=mode, tile_size=100)
+    assert expected.dtype == dtype
+    for tile_size in (1, 4, 10):
+        eigenvalues = compute_hessian_eigenvalues(image, 1.5, sorting='abs',
+                                                  mode=mode,
+                                                  tile_size=tile_size,
+                                                  num_workers=2)
+        assert_equal(eigenvalues, expected)
+
+    for tile_size in (0, -3):
+        with pytest.raises(ValueError):
+            compute_hessian_eigenvalues(image, 1.5, tile_size=tile_size)
+    with pytest.raises(ValueError):
+        compute_hessian_eigenvalues(image, 1.5, tile_size=4, num_workers=0)
+    assert_equal(compute_hessian_eigenvalues(image, 1.5, sorting='abs',
+                                             mode=mode),
+                 expected)
+
+
 if __name__ == "__main__":
     from numpy import testing
     testing.run_module_suite()
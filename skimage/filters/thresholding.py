@@ -1,4 +1,3 @@
-import itertools
 import math
 import numpy as np
 from scipy import ndimage as ndi
@@ -6,12 +5,12 @@ from collections import OrderedDict
 from collections.abc import Iterable
 from ..exposure import histogram
 from .._shared.utils import check_nD, warn
-from ..transform import integral_image
+from ..transform import IntegralImage
 from ..util import dtype_limits
 from ..filters._multiotsu import (_get_multiotsu_thresh_indices_lut,
                                   _get_multiotsu_thresh_indices)
 
-from ._sparse import correlate_sparse, _validate_window_size
+from ._sparse import _validate_window_size
 
 
 __all__ = ['try_all_threshold',
@@ -941,26 +940,14 @@ def _mean_std(image, w):
         w = (w,) * image.ndim
     _validate_window_size(w)
 
-    pad_width = tuple((k // 2 + 1, k // 2) for k in w)
-    padded = np.pad(image.astype('float'), pad_width,
-                    mode='reflect')
-    padded_sq = padded * padded
-
-    integral = integral_image(padded)
-    integral_sq = integral_image(padded_sq)
-
-    kern = np.zeros(tuple(k + 1 for k in w))
-    for indices in itertools.product(*([[0, -1]] * image.ndim)):
-        kern[indices] = (-1) ** (image.ndim % 2 != np.sum(indices) % 2)
-
-    total_window_size = np.prod(w)
-    sum_full = correlate_sparse(integral, kern, mode='valid')
-    m = sum_full / total_window_size
-    sum_sq_full = correlate_sparse(integral_sq, kern, mode='valid')
-    g2 = sum_sq_full / total_window_size
-    # Note: we use np.clip because g2 is not guaranteed to be greater than
-    # m*m when floating point error is considered
-    s = np.sqrt(np.clip(g2 - m * m, 0, None))
+    pad_width = tuple((k // 2, k // 2) for k in w)
+    padded = np.pad(image, pad_width, mode='reflect')
+
+    # A single pass computes the tables of the image and of its square,
+    # exactly for integer images
+    integral = IntegralImage(padded, squared=True)
+    m = integral.window_mean(w)
+    s = np.sqrt(integral.window_variance(w))
     return m, s
 
 
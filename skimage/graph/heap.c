@@ -0,0 +1,9747 @@
+/* Generated by Cython 0.29.37 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "depends": [],
+        "name": "skimage.graph.heap",
+        "sources": [
+            "/root/package/skimage/graph/heap.pyx"
+        ]
+    },
+    "module_name": "skimage.graph.heap"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 1
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__skimage__graph__heap
+#define __PYX_HAVE_API__skimage__graph__heap
+/* Early includes */
+#include <string.h>
+#include <stdlib.h>
+#include "pyport.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+
+static const char *__pyx_f[] = {
+  "skimage/graph/heap.pyx",
+  "stringsource",
+  "skimage/graph/heap.pxd",
+};
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
+/* NoFastGil.proto */
+#define __Pyx_PyGILState_Ensure PyGILState_Ensure
+#define __Pyx_PyGILState_Release PyGILState_Release
+#define __Pyx_FastGIL_Remember()
+#define __Pyx_FastGIL_Forget()
+#define __Pyx_FastGilFuncInit()
+
+
+/* "skimage/graph/heap.pxd":9
+ * 
+ * # determine datatypes for heap
+ * ctypedef double VALUE_T             # <<<<<<<<<<<<<<
+ * ctypedef Py_ssize_t REFERENCE_T
+ * ctypedef REFERENCE_T INDEX_T
+ */
+typedef double __pyx_t_7skimage_5graph_4heap_VALUE_T;
+
+/* "skimage/graph/heap.pxd":10
+ * # determine datatypes for heap
+ * ctypedef double VALUE_T
+ * ctypedef Py_ssize_t REFERENCE_T             # <<<<<<<<<<<<<<
+ * ctypedef REFERENCE_T INDEX_T
+ * ctypedef unsigned char BOOL_T
+ */
+typedef Py_ssize_t __pyx_t_7skimage_5graph_4heap_REFERENCE_T;
+
+/* "skimage/graph/heap.pxd":11
+ * ctypedef double VALUE_T
+ * ctypedef Py_ssize_t REFERENCE_T
+ * ctypedef REFERENCE_T INDEX_T             # <<<<<<<<<<<<<<
+ * ctypedef unsigned char BOOL_T
+ * ctypedef unsigned char LEVELS_T
+ */
+typedef __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_t_7skimage_5graph_4heap_INDEX_T;
+
+/* "skimage/graph/heap.pxd":12
+ * ctypedef Py_ssize_t REFERENCE_T
+ * ctypedef REFERENCE_T INDEX_T
+ * ctypedef unsigned char BOOL_T             # <<<<<<<<<<<<<<
+ * ctypedef unsigned char LEVELS_T
+ * 
+ */
+typedef unsigned char __pyx_t_7skimage_5graph_4heap_BOOL_T;
+
+/* "skimage/graph/heap.pxd":13
+ * ctypedef REFERENCE_T INDEX_T
+ * ctypedef unsigned char BOOL_T
+ * ctypedef unsigned char LEVELS_T             # <<<<<<<<<<<<<<
+ * 
+ * cdef class BinaryHeap:
+ */
+typedef unsigned char __pyx_t_7skimage_5graph_4heap_LEVELS_T;
+
+/*--- Type declarations ---*/
+struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap;
+struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap;
+
+/* "skimage/graph/heap.pxd":15
+ * ctypedef unsigned char LEVELS_T
+ * 
+ * cdef class BinaryHeap:             # <<<<<<<<<<<<<<
+ *     cdef readonly INDEX_T count
+ *     cdef readonly LEVELS_T levels, min_levels
+ */
+struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_7skimage_5graph_4heap_BinaryHeap *__pyx_vtab;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T count;
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T levels;
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T min_levels;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *_values;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T *_references;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T _popped_ref;
+};
+
+
+/* "skimage/graph/heap.pxd":30
+ *     cdef VALUE_T pop_fast(self) nogil
+ * 
+ * cdef class FastUpdateBinaryHeap(BinaryHeap):             # <<<<<<<<<<<<<<
+ *     cdef readonly REFERENCE_T max_reference
+ *     cdef INDEX_T *_crossref
+ */
+struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap {
+  struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap __pyx_base;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T max_reference;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T *_crossref;
+  __pyx_t_7skimage_5graph_4heap_BOOL_T _invalid_ref;
+  __pyx_t_7skimage_5graph_4heap_BOOL_T _pushed;
+};
+
+
+
+/* "skimage/graph/heap.pyx":48
+ * 
+ * 
+ * cdef class BinaryHeap:             # <<<<<<<<<<<<<<
+ *     """BinaryHeap(initial_capacity=128)
+ * 
+ */
+
+struct __pyx_vtabstruct_7skimage_5graph_4heap_BinaryHeap {
+  void (*_add_or_remove_level)(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *, __pyx_t_7skimage_5graph_4heap_LEVELS_T);
+  void (*_update)(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *);
+  void (*_update_one)(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *, __pyx_t_7skimage_5graph_4heap_INDEX_T);
+  void (*_remove)(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *, __pyx_t_7skimage_5graph_4heap_INDEX_T);
+  __pyx_t_7skimage_5graph_4heap_INDEX_T (*push_fast)(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *, __pyx_t_7skimage_5graph_4heap_VALUE_T, __pyx_t_7skimage_5graph_4heap_REFERENCE_T);
+  __pyx_t_7skimage_5graph_4heap_VALUE_T (*pop_fast)(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *);
+};
+static struct __pyx_vtabstruct_7skimage_5graph_4heap_BinaryHeap *__pyx_vtabptr_7skimage_5graph_4heap_BinaryHeap;
+
+
+/* "skimage/graph/heap.pyx":457
+ * 
+ * 
+ * cdef class FastUpdateBinaryHeap(BinaryHeap):             # <<<<<<<<<<<<<<
+ *     """FastUpdateBinaryHeap(initial_capacity=128, max_reference=None)
+ * 
+ */
+
+struct __pyx_vtabstruct_7skimage_5graph_4heap_FastUpdateBinaryHeap {
+  struct __pyx_vtabstruct_7skimage_5graph_4heap_BinaryHeap __pyx_base;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T (*value_of_fast)(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *, __pyx_t_7skimage_5graph_4heap_REFERENCE_T);
+  __pyx_t_7skimage_5graph_4heap_INDEX_T (*push_if_lower_fast)(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *, __pyx_t_7skimage_5graph_4heap_VALUE_T, __pyx_t_7skimage_5graph_4heap_REFERENCE_T);
+};
+static struct __pyx_vtabstruct_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_vtabptr_7skimage_5graph_4heap_FastUpdateBinaryHeap;
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* RaiseDoubleKeywords.proto */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywords.proto */
+static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
+    PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
+    const char* function_name);
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_SubtractObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyInt_SubtractObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceSubtract(op1, op2) : PyNumber_Subtract(op1, op2))
+#endif
+
+/* PyNumberPow2.proto */
+#define __Pyx_PyNumber_InPlacePowerOf2(a, b, c) __Pyx__PyNumber_PowerOf2(a, b, c, 1)
+#define __Pyx_PyNumber_PowerOf2(a, b, c) __Pyx__PyNumber_PowerOf2(a, b, c, 0)
+static PyObject* __Pyx__PyNumber_PowerOf2(PyObject *two, PyObject *exp, PyObject *none, int inplace);
+
+/* PyUnicode_Substring.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_Substring(
+            PyObject* text, Py_ssize_t start, Py_ssize_t stop);
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
+/* DivInt[__pyx_t_7skimage_5graph_4heap_INDEX_T].proto */
+static CYTHON_INLINE __pyx_t_7skimage_5graph_4heap_INDEX_T __Pyx_div___pyx_t_7skimage_5graph_4heap_INDEX_T(__pyx_t_7skimage_5graph_4heap_INDEX_T, __pyx_t_7skimage_5graph_4heap_INDEX_T);
+
+/* ModInt[__pyx_t_7skimage_5graph_4heap_INDEX_T].proto */
+static CYTHON_INLINE __pyx_t_7skimage_5graph_4heap_INDEX_T __Pyx_mod___pyx_t_7skimage_5graph_4heap_INDEX_T(__pyx_t_7skimage_5graph_4heap_INDEX_T, __pyx_t_7skimage_5graph_4heap_INDEX_T);
+
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* PyObject_GenericGetAttrNoDict.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
+#endif
+
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
+
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable);
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* SetupReduce.proto */
+static int __Pyx_setup_reduce(PyObject* type_obj);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* IntPow.proto */
+static CYTHON_INLINE long __Pyx_pow_long(long, long);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_char(unsigned char value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE unsigned char __Pyx_PyInt_As_unsigned_char(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+static void __pyx_f_7skimage_5graph_4heap_10BinaryHeap__add_or_remove_level(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_v_add_or_remove); /* proto*/
+static void __pyx_f_7skimage_5graph_4heap_10BinaryHeap__update(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self); /* proto*/
+static void __pyx_f_7skimage_5graph_4heap_10BinaryHeap__update_one(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i); /* proto*/
+static void __pyx_f_7skimage_5graph_4heap_10BinaryHeap__remove(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i1); /* proto*/
+static __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_f_7skimage_5graph_4heap_10BinaryHeap_push_fast(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_v_value, __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_v_reference); /* proto*/
+static __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_f_7skimage_5graph_4heap_10BinaryHeap_pop_fast(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self); /* proto*/
+static void __pyx_f_7skimage_5graph_4heap_20FastUpdateBinaryHeap__remove(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i1); /* proto*/
+static __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_f_7skimage_5graph_4heap_20FastUpdateBinaryHeap_push_fast(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_v_value, __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_v_reference); /* proto*/
+static __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_f_7skimage_5graph_4heap_20FastUpdateBinaryHeap_push_if_lower_fast(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_v_value, __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_v_reference); /* proto*/
+static __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_f_7skimage_5graph_4heap_20FastUpdateBinaryHeap_value_of_fast(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_v_reference); /* proto*/
+
+/* Module declarations from 'cython' */
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'libc.stdlib' */
+
+/* Module declarations from 'skimage.graph.heap' */
+static PyTypeObject *__pyx_ptype_7skimage_5graph_4heap_BinaryHeap = 0;
+static PyTypeObject *__pyx_ptype_7skimage_5graph_4heap_FastUpdateBinaryHeap = 0;
+static __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_v_7skimage_5graph_4heap_inf;
+static CYTHON_INLINE __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_f_7skimage_5graph_4heap_index_min(__pyx_t_7skimage_5graph_4heap_INDEX_T, __pyx_t_7skimage_5graph_4heap_INDEX_T); /*proto*/
+#define __Pyx_MODULE_NAME "skimage.graph.heap"
+extern int __pyx_module_is_main_skimage__graph__heap;
+int __pyx_module_is_main_skimage__graph__heap = 0;
+
+/* Implementation of 'skimage.graph.heap' */
+static PyObject *__pyx_builtin_MemoryError;
+static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_IndexError;
+static PyObject *__pyx_builtin_TypeError;
+static PyObject *__pyx_builtin_ValueError;
+static const char __pyx_k_[] = "";
+static const char __pyx_k_g[] = "%g, ";
+static const char __pyx_k__2[] = "\n";
+static const char __pyx_k_init[] = "__init__";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_reset[] = "reset";
+static const char __pyx_k_value[] = "value";
+static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_level_i[] = "level %i: ";
+static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_setstate[] = "__setstate__";
+static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
+static const char __pyx_k_reference[] = "reference";
+static const char __pyx_k_BinaryHeap[] = "BinaryHeap";
+static const char __pyx_k_IndexError[] = "IndexError";
+static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_MemoryError[] = "MemoryError";
+static const char __pyx_k_max_reference[] = "max_reference";
+static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_initial_capacity[] = "initial_capacity";
+static const char __pyx_k_invalid_reference[] = "invalid reference";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_FastUpdateBinaryHeap[] = "FastUpdateBinaryHeap";
+static const char __pyx_k_pop_from_an_empty_heap[] = "pop from an empty heap";
+static const char __pyx_k_Cython_implementation_of_a_binar[] = "Cython implementation of a binary min heap.\n\nOriginal author: Almar Klein\nModified by: Zachary Pincus\n\nLicense: BSD\n\nCopyright 2009 Almar Klein\n\nRedistribution and use in source and binary forms, with or without\nmodification, are permitted provided that the following conditions\nare met:\n\n1. Redistributions of source code must retain the above copyright\n   notice, this list of conditions and the following disclaimer.\n2. Redistributions in binary form must reproduce the above copyright\n   notice, this list of conditions and the following disclaimer in the\n   documentation and/or other materials provided with the distribution.\n\nTHIS SOFTWARE IS PROVIDED BY THE AUTHOR ``AS IS'' AND ANY EXPRESS OR\nIMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES\nOF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.\nIN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT, INDIRECT,\nINCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT\nNOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,\nDATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY\nTHEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF\nTHIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.\n";
+static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
+static const char __pyx_k_reference_outside_of_range_0_max[] = "reference outside of range [0, max_reference]";
+static PyObject *__pyx_kp_u_;
+static PyObject *__pyx_n_s_BinaryHeap;
+static PyObject *__pyx_n_s_FastUpdateBinaryHeap;
+static PyObject *__pyx_n_s_IndexError;
+static PyObject *__pyx_n_s_MemoryError;
+static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_n_s_ValueError;
+static PyObject *__pyx_kp_u__2;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_kp_u_g;
+static PyObject *__pyx_n_s_getstate;
+static PyObject *__pyx_n_s_init;
+static PyObject *__pyx_n_s_initial_capacity;
+static PyObject *__pyx_kp_u_invalid_reference;
+static PyObject *__pyx_kp_u_level_i;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_max_reference;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
+static PyObject *__pyx_kp_u_pop_from_an_empty_heap;
+static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_reduce;
+static PyObject *__pyx_n_s_reduce_cython;
+static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_s_reference;
+static PyObject *__pyx_kp_u_reference_outside_of_range_0_max;
+static PyObject *__pyx_n_s_reset;
+static PyObject *__pyx_n_s_setstate;
+static PyObject *__pyx_n_s_setstate_cython;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_n_s_value;
+static int __pyx_pf_7skimage_5graph_4heap_10BinaryHeap___cinit__(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_initial_capacity, CYTHON_UNUSED PyObject *__pyx_v_args, CYTHON_UNUSED PyObject *__pyx_v_kws); /* proto */
+static int __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_2__init__(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self, CYTHON_UNUSED __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_initial_capacity); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_4reset(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self); /* proto */
+static void __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_6__dealloc__(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_8__str__(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_10push(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_v_value, __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_v_reference); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_12min_val(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_14values(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_16references(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_18pop(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_5count___get__(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_6levels___get__(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_10min_levels___get__(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_20__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_22__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap___cinit__(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_initial_capacity, PyObject *__pyx_v_max_reference); /* proto */
+static int __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_2__init__(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_initial_capacity, CYTHON_UNUSED PyObject *__pyx_v_max_reference); /* proto */
+static void __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_4__dealloc__(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_6reset(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_8push(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, double __pyx_v_value, int __pyx_v_reference); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_10push_if_lower(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, double __pyx_v_value, int __pyx_v_reference); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_12value_of(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, int __pyx_v_reference); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_14cross_references(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_13max_reference___get__(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_16__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_18__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new_7skimage_5graph_4heap_BinaryHeap(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_7skimage_5graph_4heap_FastUpdateBinaryHeap(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_int_1;
+static PyObject *__pyx_int_2;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__6;
+static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_tuple__8;
+static PyObject *__pyx_tuple__9;
+/* Late includes */
+
+/* "skimage/graph/heap.pyx":44
+ * 
+ * # this is handy
+ * cdef inline INDEX_T index_min(INDEX_T a, INDEX_T b) nogil:             # <<<<<<<<<<<<<<
+ *     return a if a <= b else b
+ * 
+ */
+
+static CYTHON_INLINE __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_f_7skimage_5graph_4heap_index_min(__pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_a, __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_b) {
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_r;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_1;
+
+  /* "skimage/graph/heap.pyx":45
+ * # this is handy
+ * cdef inline INDEX_T index_min(INDEX_T a, INDEX_T b) nogil:
+ *     return a if a <= b else b             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  if (((__pyx_v_a <= __pyx_v_b) != 0)) {
+    __pyx_t_1 = __pyx_v_a;
+  } else {
+    __pyx_t_1 = __pyx_v_b;
+  }
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "skimage/graph/heap.pyx":44
+ * 
+ * # this is handy
+ * cdef inline INDEX_T index_min(INDEX_T a, INDEX_T b) nogil:             # <<<<<<<<<<<<<<
+ *     return a if a <= b else b
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":130
+ *     # 2**l
+ * 
+ *     def __cinit__(self, INDEX_T initial_capacity=128, *args, **kws):             # <<<<<<<<<<<<<<
+ *         # calc levels from the default capacity
+ *         cdef LEVELS_T levels = 0
+ */
+
+/* Python wrapper */
+static int __pyx_pw_7skimage_5graph_4heap_10BinaryHeap_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_7skimage_5graph_4heap_10BinaryHeap_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_initial_capacity;
+  CYTHON_UNUSED PyObject *__pyx_v_args = 0;
+  CYTHON_UNUSED PyObject *__pyx_v_kws = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
+  __pyx_v_kws = PyDict_New(); if (unlikely(!__pyx_v_kws)) return -1;
+  __Pyx_GOTREF(__pyx_v_kws);
+  if (PyTuple_GET_SIZE(__pyx_args) > 1) {
+    __pyx_v_args = PyTuple_GetSlice(__pyx_args, 1, PyTuple_GET_SIZE(__pyx_args));
+    if (unlikely(!__pyx_v_args)) {
+      __Pyx_DECREF(__pyx_v_kws); __pyx_v_kws = 0;
+      __Pyx_RefNannyFinishContext();
+      return -1;
+    }
+    __Pyx_GOTREF(__pyx_v_args);
+  } else {
+    __pyx_v_args = __pyx_empty_tuple; __Pyx_INCREF(__pyx_empty_tuple);
+  }
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_initial_capacity,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        default:
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_initial_capacity);
+          if (value) { values[0] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t used_pos_args = (pos_args < 1) ? pos_args : 1;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, __pyx_v_kws, values, used_pos_args, "__cinit__") < 0)) __PYX_ERR(0, 130, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        default:
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+      }
+    }
+    if (values[0]) {
+      __pyx_v_initial_capacity = __Pyx_PyIndex_AsSsize_t(values[0]); if (unlikely((__pyx_v_initial_capacity == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 130, __pyx_L3_error)
+    } else {
+      __pyx_v_initial_capacity = ((__pyx_t_7skimage_5graph_4heap_INDEX_T)0x80);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_DECREF(__pyx_v_args); __pyx_v_args = 0;
+  __Pyx_DECREF(__pyx_v_kws); __pyx_v_kws = 0;
+  __Pyx_AddTraceback("skimage.graph.heap.BinaryHeap.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_10BinaryHeap___cinit__(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self), __pyx_v_initial_capacity, __pyx_v_args, __pyx_v_kws);
+
+  /* function exit code */
+  __Pyx_XDECREF(__pyx_v_args);
+  __Pyx_XDECREF(__pyx_v_kws);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_7skimage_5graph_4heap_10BinaryHeap___cinit__(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_initial_capacity, CYTHON_UNUSED PyObject *__pyx_v_args, CYTHON_UNUSED PyObject *__pyx_v_kws) {
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_v_levels;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_number;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("__cinit__", 0);
+
+  /* "skimage/graph/heap.pyx":132
+ *     def __cinit__(self, INDEX_T initial_capacity=128, *args, **kws):
+ *         # calc levels from the default capacity
+ *         cdef LEVELS_T levels = 0             # <<<<<<<<<<<<<<
+ *         while 2**levels < initial_capacity:
+ *             levels += 1
+ */
+  __pyx_v_levels = 0;
+
+  /* "skimage/graph/heap.pyx":133
+ *         # calc levels from the default capacity
+ *         cdef LEVELS_T levels = 0
+ *         while 2**levels < initial_capacity:             # <<<<<<<<<<<<<<
+ *             levels += 1
+ *         # set levels
+ */
+  while (1) {
+    __pyx_t_1 = ((__Pyx_pow_long(2, ((long)__pyx_v_levels)) < __pyx_v_initial_capacity) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "skimage/graph/heap.pyx":134
+ *         cdef LEVELS_T levels = 0
+ *         while 2**levels < initial_capacity:
+ *             levels += 1             # <<<<<<<<<<<<<<
+ *         # set levels
+ *         self.min_levels = self.levels = levels
+ */
+    __pyx_v_levels = (__pyx_v_levels + 1);
+  }
+
+  /* "skimage/graph/heap.pyx":136
+ *             levels += 1
+ *         # set levels
+ *         self.min_levels = self.levels = levels             # <<<<<<<<<<<<<<
+ * 
+ *         # we start with 0 values
+ */
+  __pyx_v_self->min_levels = __pyx_v_levels;
+  __pyx_v_self->levels = __pyx_v_levels;
+
+  /* "skimage/graph/heap.pyx":139
+ * 
+ *         # we start with 0 values
+ *         self.count = 0             # <<<<<<<<<<<<<<
+ * 
+ *         # allocate arrays
+ */
+  __pyx_v_self->count = 0;
+
+  /* "skimage/graph/heap.pyx":142
+ * 
+ *         # allocate arrays
+ *         cdef INDEX_T number = 2**self.levels             # <<<<<<<<<<<<<<
+ *         self._values = <VALUE_T *>malloc(2 * number * sizeof(VALUE_T))
+ *         self._references = <REFERENCE_T *>malloc(number * sizeof(REFERENCE_T))
+ */
+  __pyx_v_number = __Pyx_pow_long(2, ((long)__pyx_v_self->levels));
+
+  /* "skimage/graph/heap.pyx":143
+ *         # allocate arrays
+ *         cdef INDEX_T number = 2**self.levels
+ *         self._values = <VALUE_T *>malloc(2 * number * sizeof(VALUE_T))             # <<<<<<<<<<<<<<
+ *         self._references = <REFERENCE_T *>malloc(number * sizeof(REFERENCE_T))
+ * 
+ */
+  __pyx_v_self->_values = ((__pyx_t_7skimage_5graph_4heap_VALUE_T *)malloc(((2 * __pyx_v_number) * (sizeof(__pyx_t_7skimage_5graph_4heap_VALUE_T)))));
+
+  /* "skimage/graph/heap.pyx":144
+ *         cdef INDEX_T number = 2**self.levels
+ *         self._values = <VALUE_T *>malloc(2 * number * sizeof(VALUE_T))
+ *         self._references = <REFERENCE_T *>malloc(number * sizeof(REFERENCE_T))             # <<<<<<<<<<<<<<
+ * 
+ *     def __init__(self, INDEX_T initial_capacity=128):
+ */
+  __pyx_v_self->_references = ((__pyx_t_7skimage_5graph_4heap_REFERENCE_T *)malloc((__pyx_v_number * (sizeof(__pyx_t_7skimage_5graph_4heap_REFERENCE_T)))));
+
+  /* "skimage/graph/heap.pyx":130
+ *     # 2**l
+ * 
+ *     def __cinit__(self, INDEX_T initial_capacity=128, *args, **kws):             # <<<<<<<<<<<<<<
+ *         # calc levels from the default capacity
+ *         cdef LEVELS_T levels = 0
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":146
+ *         self._references = <REFERENCE_T *>malloc(number * sizeof(REFERENCE_T))
+ * 
+ *     def __init__(self, INDEX_T initial_capacity=128):             # <<<<<<<<<<<<<<
+ *         """__init__(initial_capacity=128)
+ * 
+ */
+
+/* Python wrapper */
+static int __pyx_pw_7skimage_5graph_4heap_10BinaryHeap_3__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7skimage_5graph_4heap_10BinaryHeap_2__init__[] = "__init__(initial_capacity=128)\n\n        Class constructor.\n\n        Takes an optional parameter 'initial_capacity' so that\n        if the required heap capacity is known or can be estimated in advance,\n        there will need to be fewer resize operations on the heap.\n\n        ";
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_7skimage_5graph_4heap_10BinaryHeap_2__init__;
+#endif
+static int __pyx_pw_7skimage_5graph_4heap_10BinaryHeap_3__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  CYTHON_UNUSED __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_initial_capacity;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_initial_capacity,0};
+    PyObject* values[1] = {0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_initial_capacity);
+          if (value) { values[0] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 146, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    if (values[0]) {
+      __pyx_v_initial_capacity = __Pyx_PyIndex_AsSsize_t(values[0]); if (unlikely((__pyx_v_initial_capacity == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 146, __pyx_L3_error)
+    } else {
+      __pyx_v_initial_capacity = ((__pyx_t_7skimage_5graph_4heap_INDEX_T)0x80);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 146, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("skimage.graph.heap.BinaryHeap.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_2__init__(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self), __pyx_v_initial_capacity);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_2__init__(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self, CYTHON_UNUSED __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_initial_capacity) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "skimage/graph/heap.pyx":156
+ * 
+ *         """
+ *         if self._values is NULL or self._references is NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         self.reset()
+ */
+  __pyx_t_2 = ((__pyx_v_self->_values == NULL) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_self->_references == NULL) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (unlikely(__pyx_t_1)) {
+
+    /* "skimage/graph/heap.pyx":157
+ *         """
+ *         if self._values is NULL or self._references is NULL:
+ *             raise MemoryError()             # <<<<<<<<<<<<<<
+ *         self.reset()
+ * 
+ */
+    PyErr_NoMemory(); __PYX_ERR(0, 157, __pyx_L1_error)
+
+    /* "skimage/graph/heap.pyx":156
+ * 
+ *         """
+ *         if self._values is NULL or self._references is NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         self.reset()
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":158
+ *         if self._values is NULL or self._references is NULL:
+ *             raise MemoryError()
+ *         self.reset()             # <<<<<<<<<<<<<<
+ * 
+ *     def reset(self):
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_reset); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 158, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 158, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "skimage/graph/heap.pyx":146
+ *         self._references = <REFERENCE_T *>malloc(number * sizeof(REFERENCE_T))
+ * 
+ *     def __init__(self, INDEX_T initial_capacity=128):             # <<<<<<<<<<<<<<
+ *         """__init__(initial_capacity=128)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("skimage.graph.heap.BinaryHeap.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":160
+ *         self.reset()
+ * 
+ *     def reset(self):             # <<<<<<<<<<<<<<
+ *         """reset()
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_5reset(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7skimage_5graph_4heap_10BinaryHeap_4reset[] = "reset()\n\n        Reset the heap to default, empty state.\n\n        ";
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_5reset(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("reset (wrapper)", 0);
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_4reset(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_4reset(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self) {
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_number;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_v_values;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_t_1;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_2;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_3;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_4;
+  __Pyx_RefNannySetupContext("reset", 0);
+
+  /* "skimage/graph/heap.pyx":166
+ * 
+ *         """
+ *         cdef INDEX_T number = 2**self.levels             # <<<<<<<<<<<<<<
+ *         cdef INDEX_T i
+ *         cdef VALUE_T *values = self._values
+ */
+  __pyx_v_number = __Pyx_pow_long(2, ((long)__pyx_v_self->levels));
+
+  /* "skimage/graph/heap.pyx":168
+ *         cdef INDEX_T number = 2**self.levels
+ *         cdef INDEX_T i
+ *         cdef VALUE_T *values = self._values             # <<<<<<<<<<<<<<
+ *         for i in range(number * 2):
+ *             values[i] = inf
+ */
+  __pyx_t_1 = __pyx_v_self->_values;
+  __pyx_v_values = __pyx_t_1;
+
+  /* "skimage/graph/heap.pyx":169
+ *         cdef INDEX_T i
+ *         cdef VALUE_T *values = self._values
+ *         for i in range(number * 2):             # <<<<<<<<<<<<<<
+ *             values[i] = inf
+ * 
+ */
+  __pyx_t_2 = (__pyx_v_number * 2);
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
+
+    /* "skimage/graph/heap.pyx":170
+ *         cdef VALUE_T *values = self._values
+ *         for i in range(number * 2):
+ *             values[i] = inf             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+ */
+    (__pyx_v_values[__pyx_v_i]) = __pyx_v_7skimage_5graph_4heap_inf;
+  }
+
+  /* "skimage/graph/heap.pyx":160
+ *         self.reset()
+ * 
+ *     def reset(self):             # <<<<<<<<<<<<<<
+ *         """reset()
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":172
+ *             values[i] = inf
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self._values)
+ *         free(self._references)
+ */
+
+/* Python wrapper */
+static void __pyx_pw_7skimage_5graph_4heap_10BinaryHeap_7__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_7skimage_5graph_4heap_10BinaryHeap_7__dealloc__(PyObject *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_6__dealloc__(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_6__dealloc__(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__", 0);
+
+  /* "skimage/graph/heap.pyx":173
+ * 
+ *     def __dealloc__(self):
+ *         free(self._values)             # <<<<<<<<<<<<<<
+ *         free(self._references)
+ * 
+ */
+  free(__pyx_v_self->_values);
+
+  /* "skimage/graph/heap.pyx":174
+ *     def __dealloc__(self):
+ *         free(self._values)
+ *         free(self._references)             # <<<<<<<<<<<<<<
+ * 
+ *     def __str__(self):
+ */
+  free(__pyx_v_self->_references);
+
+  /* "skimage/graph/heap.pyx":172
+ *             values[i] = inf
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self._values)
+ *         free(self._references)
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "skimage/graph/heap.pyx":176
+ *         free(self._references)
+ * 
+ *     def __str__(self):             # <<<<<<<<<<<<<<
+ *         s = ''
+ *         for level in range(1, self.levels + 1):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_9__str__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_9__str__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__str__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_8__str__(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_8__str__(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self) {
+  PyObject *__pyx_v_s = NULL;
+  PyObject *__pyx_v_level = NULL;
+  PyObject *__pyx_v_i0 = NULL;
+  PyObject *__pyx_v_i = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  PyObject *(*__pyx_t_4)(PyObject *);
+  PyObject *__pyx_t_5 = NULL;
+  Py_ssize_t __pyx_t_6;
+  PyObject *(*__pyx_t_7)(PyObject *);
+  Py_ssize_t __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__str__", 0);
+
+  /* "skimage/graph/heap.pyx":177
+ * 
+ *     def __str__(self):
+ *         s = ''             # <<<<<<<<<<<<<<
+ *         for level in range(1, self.levels + 1):
+ *             i0 = 2**level - 1  # LevelStart
+ */
+  __Pyx_INCREF(__pyx_kp_u_);
+  __pyx_v_s = __pyx_kp_u_;
+
+  /* "skimage/graph/heap.pyx":178
+ *     def __str__(self):
+ *         s = ''
+ *         for level in range(1, self.levels + 1):             # <<<<<<<<<<<<<<
+ *             i0 = 2**level - 1  # LevelStart
+ *             s += 'level %i: ' % level
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_long((__pyx_v_self->levels + 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_int_1);
+  __Pyx_GIVEREF(__pyx_int_1);
+  PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_int_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 178, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
+    __pyx_t_2 = __pyx_t_1; __Pyx_INCREF(__pyx_t_2); __pyx_t_3 = 0;
+    __pyx_t_4 = NULL;
+  } else {
+    __pyx_t_3 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 178, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 178, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_4)) {
+      if (likely(PyList_CheckExact(__pyx_t_2))) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_2)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_1); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 178, __pyx_L1_error)
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 178, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      } else {
+        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_1); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 178, __pyx_L1_error)
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 178, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      }
+    } else {
+      __pyx_t_1 = __pyx_t_4(__pyx_t_2);
+      if (unlikely(!__pyx_t_1)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 178, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_level, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "skimage/graph/heap.pyx":179
+ *         s = ''
+ *         for level in range(1, self.levels + 1):
+ *             i0 = 2**level - 1  # LevelStart             # <<<<<<<<<<<<<<
+ *             s += 'level %i: ' % level
+ *             for i in range(i0, i0 + 2**level):
+ */
+    __pyx_t_1 = __Pyx_PyNumber_PowerOf2(__pyx_int_2, __pyx_v_level, Py_None); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 179, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyInt_SubtractObjC(__pyx_t_1, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 179, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_i0, __pyx_t_5);
+    __pyx_t_5 = 0;
+
+    /* "skimage/graph/heap.pyx":180
+ *         for level in range(1, self.levels + 1):
+ *             i0 = 2**level - 1  # LevelStart
+ *             s += 'level %i: ' % level             # <<<<<<<<<<<<<<
+ *             for i in range(i0, i0 + 2**level):
+ *                 s += '%g, ' % self._values[i]
+ */
+    __pyx_t_5 = __Pyx_PyUnicode_FormatSafe(__pyx_kp_u_level_i, __pyx_v_level); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 180, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_1 = __Pyx_PyUnicode_Concat(__pyx_v_s, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 180, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF_SET(__pyx_v_s, ((PyObject*)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "skimage/graph/heap.pyx":181
+ *             i0 = 2**level - 1  # LevelStart
+ *             s += 'level %i: ' % level
+ *             for i in range(i0, i0 + 2**level):             # <<<<<<<<<<<<<<
+ *                 s += '%g, ' % self._values[i]
+ *             s = s[:-1] + '\n'
+ */
+    __pyx_t_1 = __Pyx_PyNumber_PowerOf2(__pyx_int_2, __pyx_v_level, Py_None); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 181, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = PyNumber_Add(__pyx_v_i0, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 181, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 181, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_v_i0);
+    __Pyx_GIVEREF(__pyx_v_i0);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_i0);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_5);
+    __pyx_t_5 = 0;
+    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_1, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 181, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (likely(PyList_CheckExact(__pyx_t_5)) || PyTuple_CheckExact(__pyx_t_5)) {
+      __pyx_t_1 = __pyx_t_5; __Pyx_INCREF(__pyx_t_1); __pyx_t_6 = 0;
+      __pyx_t_7 = NULL;
+    } else {
+      __pyx_t_6 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 181, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_7 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 181, __pyx_L1_error)
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    for (;;) {
+      if (likely(!__pyx_t_7)) {
+        if (likely(PyList_CheckExact(__pyx_t_1))) {
+          if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_1)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_5 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_6); __Pyx_INCREF(__pyx_t_5); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 181, __pyx_L1_error)
+          #else
+          __pyx_t_5 = PySequence_ITEM(__pyx_t_1, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 181, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          #endif
+        } else {
+          if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_6); __Pyx_INCREF(__pyx_t_5); __pyx_t_6++; if (unlikely(0 < 0)) __PYX_ERR(0, 181, __pyx_L1_error)
+          #else
+          __pyx_t_5 = PySequence_ITEM(__pyx_t_1, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 181, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          #endif
+        }
+      } else {
+        __pyx_t_5 = __pyx_t_7(__pyx_t_1);
+        if (unlikely(!__pyx_t_5)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 181, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_5);
+      }
+      __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_5);
+      __pyx_t_5 = 0;
+
+      /* "skimage/graph/heap.pyx":182
+ *             s += 'level %i: ' % level
+ *             for i in range(i0, i0 + 2**level):
+ *                 s += '%g, ' % self._values[i]             # <<<<<<<<<<<<<<
+ *             s = s[:-1] + '\n'
+ *         return s
+ */
+      __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 182, __pyx_L1_error)
+      __pyx_t_5 = PyFloat_FromDouble((__pyx_v_self->_values[__pyx_t_8])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 182, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_9 = PyUnicode_Format(__pyx_kp_u_g, __pyx_t_5); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 182, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_5 = __Pyx_PyUnicode_Concat(__pyx_v_s, __pyx_t_9); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 182, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_DECREF_SET(__pyx_v_s, ((PyObject*)__pyx_t_5));
+      __pyx_t_5 = 0;
+
+      /* "skimage/graph/heap.pyx":181
+ *             i0 = 2**level - 1  # LevelStart
+ *             s += 'level %i: ' % level
+ *             for i in range(i0, i0 + 2**level):             # <<<<<<<<<<<<<<
+ *                 s += '%g, ' % self._values[i]
+ *             s = s[:-1] + '\n'
+ */
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "skimage/graph/heap.pyx":183
+ *             for i in range(i0, i0 + 2**level):
+ *                 s += '%g, ' % self._values[i]
+ *             s = s[:-1] + '\n'             # <<<<<<<<<<<<<<
+ *         return s
+ * 
+ */
+    __pyx_t_1 = __Pyx_PyUnicode_Substring(__pyx_v_s, 0, -1L); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 183, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = __Pyx_PyUnicode_Concat(__pyx_t_1, __pyx_kp_u__2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 183, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_s, ((PyObject*)__pyx_t_5));
+    __pyx_t_5 = 0;
+
+    /* "skimage/graph/heap.pyx":178
+ *     def __str__(self):
+ *         s = ''
+ *         for level in range(1, self.levels + 1):             # <<<<<<<<<<<<<<
+ *             i0 = 2**level - 1  # LevelStart
+ *             s += 'level %i: ' % level
+ */
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "skimage/graph/heap.pyx":184
+ *                 s += '%g, ' % self._values[i]
+ *             s = s[:-1] + '\n'
+ *         return s             # <<<<<<<<<<<<<<
+ * 
+ *     ## C Maintenance methods
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_s);
+  __pyx_r = __pyx_v_s;
+  goto __pyx_L0;
+
+  /* "skimage/graph/heap.pyx":176
+ *         free(self._references)
+ * 
+ *     def __str__(self):             # <<<<<<<<<<<<<<
+ *         s = ''
+ *         for level in range(1, self.levels + 1):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("skimage.graph.heap.BinaryHeap.__str__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_s);
+  __Pyx_XDECREF(__pyx_v_level);
+  __Pyx_XDECREF(__pyx_v_i0);
+  __Pyx_XDECREF(__pyx_v_i);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":188
+ *     ## C Maintenance methods
+ * 
+ *     cdef void _add_or_remove_level(self, LEVELS_T add_or_remove) nogil:             # <<<<<<<<<<<<<<
+ *         # init indexing ints
+ *         cdef INDEX_T i, i1, i2, n
+ */
+
+static void __pyx_f_7skimage_5graph_4heap_10BinaryHeap__add_or_remove_level(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_v_add_or_remove) {
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i1;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i2;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_n;
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_v_new_levels;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_number;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_v_values;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T *__pyx_v_references;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_v_old_values;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T *__pyx_v_old_references;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_3;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_4;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_5;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_t_6;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T *__pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  #ifdef WITH_THREAD
+  PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  #endif
+  __Pyx_RefNannySetupContext("_add_or_remove_level", 0);
+  #ifdef WITH_THREAD
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  #endif
+
+  /* "skimage/graph/heap.pyx":190
+ *     cdef void _add_or_remove_level(self, LEVELS_T add_or_remove) nogil:
+ *         # init indexing ints
+ *         cdef INDEX_T i, i1, i2, n             # <<<<<<<<<<<<<<
+ * 
+ *         # new amount of levels
+ */
+  /*try:*/ {
+
+    /* "skimage/graph/heap.pyx":193
+ * 
+ *         # new amount of levels
+ *         cdef LEVELS_T new_levels = self.levels + add_or_remove             # <<<<<<<<<<<<<<
+ * 
+ *         # allocate new arrays
+ */
+    __pyx_v_new_levels = (__pyx_v_self->levels + __pyx_v_add_or_remove);
+
+    /* "skimage/graph/heap.pyx":196
+ * 
+ *         # allocate new arrays
+ *         cdef INDEX_T number = 2**new_levels             # <<<<<<<<<<<<<<
+ *         cdef VALUE_T *values
+ *         cdef REFERENCE_T *references
+ */
+    __pyx_v_number = __Pyx_pow_long(2, ((long)__pyx_v_new_levels));
+
+    /* "skimage/graph/heap.pyx":199
+ *         cdef VALUE_T *values
+ *         cdef REFERENCE_T *references
+ *         values = <VALUE_T *>malloc(number * 2 * sizeof(VALUE_T))             # <<<<<<<<<<<<<<
+ *         references = <REFERENCE_T *>malloc(number * sizeof(REFERENCE_T))
+ *         if values is NULL or references is NULL:
+ */
+    __pyx_v_values = ((__pyx_t_7skimage_5graph_4heap_VALUE_T *)malloc(((__pyx_v_number * 2) * (sizeof(__pyx_t_7skimage_5graph_4heap_VALUE_T)))));
+
+    /* "skimage/graph/heap.pyx":200
+ *         cdef REFERENCE_T *references
+ *         values = <VALUE_T *>malloc(number * 2 * sizeof(VALUE_T))
+ *         references = <REFERENCE_T *>malloc(number * sizeof(REFERENCE_T))             # <<<<<<<<<<<<<<
+ *         if values is NULL or references is NULL:
+ *             free(values)
+ */
+    __pyx_v_references = ((__pyx_t_7skimage_5graph_4heap_REFERENCE_T *)malloc((__pyx_v_number * (sizeof(__pyx_t_7skimage_5graph_4heap_REFERENCE_T)))));
+
+    /* "skimage/graph/heap.pyx":201
+ *         values = <VALUE_T *>malloc(number * 2 * sizeof(VALUE_T))
+ *         references = <REFERENCE_T *>malloc(number * sizeof(REFERENCE_T))
+ *         if values is NULL or references is NULL:             # <<<<<<<<<<<<<<
+ *             free(values)
+ *             free(references)
+ */
+    __pyx_t_2 = ((__pyx_v_values == NULL) != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L7_bool_binop_done;
+    }
+    __pyx_t_2 = ((__pyx_v_references == NULL) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L7_bool_binop_done:;
+    if (__pyx_t_1) {
+
+      /* "skimage/graph/heap.pyx":202
+ *         references = <REFERENCE_T *>malloc(number * sizeof(REFERENCE_T))
+ *         if values is NULL or references is NULL:
+ *             free(values)             # <<<<<<<<<<<<<<
+ *             free(references)
+ *             with gil:
+ */
+      free(__pyx_v_values);
+
+      /* "skimage/graph/heap.pyx":203
+ *         if values is NULL or references is NULL:
+ *             free(values)
+ *             free(references)             # <<<<<<<<<<<<<<
+ *             with gil:
+ *                 raise MemoryError()
+ */
+      free(__pyx_v_references);
+
+      /* "skimage/graph/heap.pyx":204
+ *             free(values)
+ *             free(references)
+ *             with gil:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ * 
+ */
+      {
+          #ifdef WITH_THREAD
+          PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+          #endif
+          /*try:*/ {
+
+            /* "skimage/graph/heap.pyx":205
+ *             free(references)
+ *             with gil:
+ *                 raise MemoryError()             # <<<<<<<<<<<<<<
+ * 
+ *         # init arrays
+ */
+            PyErr_NoMemory(); __PYX_ERR(0, 205, __pyx_L10_error)
+          }
+
+          /* "skimage/graph/heap.pyx":204
+ *             free(values)
+ *             free(references)
+ *             with gil:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ * 
+ */
+          /*finally:*/ {
+            __pyx_L10_error: {
+              #ifdef WITH_THREAD
+              __Pyx_PyGILState_Release(__pyx_gilstate_save);
+              #endif
+              goto __pyx_L4_error;
+            }
+          }
+      }
+
+      /* "skimage/graph/heap.pyx":201
+ *         values = <VALUE_T *>malloc(number * 2 * sizeof(VALUE_T))
+ *         references = <REFERENCE_T *>malloc(number * sizeof(REFERENCE_T))
+ *         if values is NULL or references is NULL:             # <<<<<<<<<<<<<<
+ *             free(values)
+ *             free(references)
+ */
+    }
+
+    /* "skimage/graph/heap.pyx":208
+ * 
+ *         # init arrays
+ *         for i in range(number * 2):             # <<<<<<<<<<<<<<
+ *             values[i] = inf
+ *         for i in range(number):
+ */
+    __pyx_t_3 = (__pyx_v_number * 2);
+    __pyx_t_4 = __pyx_t_3;
+    for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+      __pyx_v_i = __pyx_t_5;
+
+      /* "skimage/graph/heap.pyx":209
+ *         # init arrays
+ *         for i in range(number * 2):
+ *             values[i] = inf             # <<<<<<<<<<<<<<
+ *         for i in range(number):
+ *             references[i] = -1
+ */
+      (__pyx_v_values[__pyx_v_i]) = __pyx_v_7skimage_5graph_4heap_inf;
+    }
+
+    /* "skimage/graph/heap.pyx":210
+ *         for i in range(number * 2):
+ *             values[i] = inf
+ *         for i in range(number):             # <<<<<<<<<<<<<<
+ *             references[i] = -1
+ * 
+ */
+    __pyx_t_3 = __pyx_v_number;
+    __pyx_t_4 = __pyx_t_3;
+    for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+      __pyx_v_i = __pyx_t_5;
+
+      /* "skimage/graph/heap.pyx":211
+ *             values[i] = inf
+ *         for i in range(number):
+ *             references[i] = -1             # <<<<<<<<<<<<<<
+ * 
+ *         # copy data
+ */
+      (__pyx_v_references[__pyx_v_i]) = -1L;
+    }
+
+    /* "skimage/graph/heap.pyx":214
+ * 
+ *         # copy data
+ *         cdef VALUE_T *old_values = self._values             # <<<<<<<<<<<<<<
+ *         cdef REFERENCE_T *old_references = self._references
+ *         if self.count:
+ */
+    __pyx_t_6 = __pyx_v_self->_values;
+    __pyx_v_old_values = __pyx_t_6;
+
+    /* "skimage/graph/heap.pyx":215
+ *         # copy data
+ *         cdef VALUE_T *old_values = self._values
+ *         cdef REFERENCE_T *old_references = self._references             # <<<<<<<<<<<<<<
+ *         if self.count:
+ *             i1 = 2**new_levels - 1  # LevelStart
+ */
+    __pyx_t_7 = __pyx_v_self->_references;
+    __pyx_v_old_references = __pyx_t_7;
+
+    /* "skimage/graph/heap.pyx":216
+ *         cdef VALUE_T *old_values = self._values
+ *         cdef REFERENCE_T *old_references = self._references
+ *         if self.count:             # <<<<<<<<<<<<<<
+ *             i1 = 2**new_levels - 1  # LevelStart
+ *             i2 = 2**self.levels - 1  # LevelStart
+ */
+    __pyx_t_1 = (__pyx_v_self->count != 0);
+    if (__pyx_t_1) {
+
+      /* "skimage/graph/heap.pyx":217
+ *         cdef REFERENCE_T *old_references = self._references
+ *         if self.count:
+ *             i1 = 2**new_levels - 1  # LevelStart             # <<<<<<<<<<<<<<
+ *             i2 = 2**self.levels - 1  # LevelStart
+ *             n = index_min(2**new_levels, 2**self.levels)
+ */
+      __pyx_v_i1 = (__Pyx_pow_long(2, ((long)__pyx_v_new_levels)) - 1);
+
+      /* "skimage/graph/heap.pyx":218
+ *         if self.count:
+ *             i1 = 2**new_levels - 1  # LevelStart
+ *             i2 = 2**self.levels - 1  # LevelStart             # <<<<<<<<<<<<<<
+ *             n = index_min(2**new_levels, 2**self.levels)
+ *             for i in range(n):
+ */
+      __pyx_v_i2 = (__Pyx_pow_long(2, ((long)__pyx_v_self->levels)) - 1);
+
+      /* "skimage/graph/heap.pyx":219
+ *             i1 = 2**new_levels - 1  # LevelStart
+ *             i2 = 2**self.levels - 1  # LevelStart
+ *             n = index_min(2**new_levels, 2**self.levels)             # <<<<<<<<<<<<<<
+ *             for i in range(n):
+ *                 values[i1+i] = old_values[i2+i]
+ */
+      __pyx_v_n = __pyx_f_7skimage_5graph_4heap_index_min(__Pyx_pow_long(2, ((long)__pyx_v_new_levels)), __Pyx_pow_long(2, ((long)__pyx_v_self->levels)));
+
+      /* "skimage/graph/heap.pyx":220
+ *             i2 = 2**self.levels - 1  # LevelStart
+ *             n = index_min(2**new_levels, 2**self.levels)
+ *             for i in range(n):             # <<<<<<<<<<<<<<
+ *                 values[i1+i] = old_values[i2+i]
+ *             for i in range(n):
+ */
+      __pyx_t_3 = __pyx_v_n;
+      __pyx_t_4 = __pyx_t_3;
+      for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+        __pyx_v_i = __pyx_t_5;
+
+        /* "skimage/graph/heap.pyx":221
+ *             n = index_min(2**new_levels, 2**self.levels)
+ *             for i in range(n):
+ *                 values[i1+i] = old_values[i2+i]             # <<<<<<<<<<<<<<
+ *             for i in range(n):
+ *                 references[i] = old_references[i]
+ */
+        (__pyx_v_values[(__pyx_v_i1 + __pyx_v_i)]) = (__pyx_v_old_values[(__pyx_v_i2 + __pyx_v_i)]);
+      }
+
+      /* "skimage/graph/heap.pyx":222
+ *             for i in range(n):
+ *                 values[i1+i] = old_values[i2+i]
+ *             for i in range(n):             # <<<<<<<<<<<<<<
+ *                 references[i] = old_references[i]
+ * 
+ */
+      __pyx_t_3 = __pyx_v_n;
+      __pyx_t_4 = __pyx_t_3;
+      for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+        __pyx_v_i = __pyx_t_5;
+
+        /* "skimage/graph/heap.pyx":223
+ *                 values[i1+i] = old_values[i2+i]
+ *             for i in range(n):
+ *                 references[i] = old_references[i]             # <<<<<<<<<<<<<<
+ * 
+ *         # make current
+ */
+        (__pyx_v_references[__pyx_v_i]) = (__pyx_v_old_references[__pyx_v_i]);
+      }
+
+      /* "skimage/graph/heap.pyx":216
+ *         cdef VALUE_T *old_values = self._values
+ *         cdef REFERENCE_T *old_references = self._references
+ *         if self.count:             # <<<<<<<<<<<<<<
+ *             i1 = 2**new_levels - 1  # LevelStart
+ *             i2 = 2**self.levels - 1  # LevelStart
+ */
+    }
+
+    /* "skimage/graph/heap.pyx":226
+ * 
+ *         # make current
+ *         free(self._values)             # <<<<<<<<<<<<<<
+ *         free(self._references)
+ *         self._values = values
+ */
+    free(__pyx_v_self->_values);
+
+    /* "skimage/graph/heap.pyx":227
+ *         # make current
+ *         free(self._values)
+ *         free(self._references)             # <<<<<<<<<<<<<<
+ *         self._values = values
+ *         self._references = references
+ */
+    free(__pyx_v_self->_references);
+
+    /* "skimage/graph/heap.pyx":228
+ *         free(self._values)
+ *         free(self._references)
+ *         self._values = values             # <<<<<<<<<<<<<<
+ *         self._references = references
+ * 
+ */
+    __pyx_v_self->_values = __pyx_v_values;
+
+    /* "skimage/graph/heap.pyx":229
+ *         free(self._references)
+ *         self._values = values
+ *         self._references = references             # <<<<<<<<<<<<<<
+ * 
+ *         # we need a full update
+ */
+    __pyx_v_self->_references = __pyx_v_references;
+
+    /* "skimage/graph/heap.pyx":232
+ * 
+ *         # we need a full update
+ *         self.levels = new_levels             # <<<<<<<<<<<<<<
+ *         self._update()
+ * 
+ */
+    __pyx_v_self->levels = __pyx_v_new_levels;
+
+    /* "skimage/graph/heap.pyx":233
+ *         # we need a full update
+ *         self.levels = new_levels
+ *         self._update()             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void _update(self) nogil:
+ */
+    ((struct __pyx_vtabstruct_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self->__pyx_vtab)->_update(__pyx_v_self);
+  }
+
+  /* "skimage/graph/heap.pyx":190
+ *     cdef void _add_or_remove_level(self, LEVELS_T add_or_remove) nogil:
+ *         # init indexing ints
+ *         cdef INDEX_T i, i1, i2, n             # <<<<<<<<<<<<<<
+ * 
+ *         # new amount of levels
+ */
+  /*finally:*/ {
+    /*normal exit:*/{
+      #ifdef WITH_THREAD
+      __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      #endif
+      goto __pyx_L5;
+    }
+    __pyx_L4_error: {
+      #ifdef WITH_THREAD
+      __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      #endif
+      goto __pyx_L1_error;
+    }
+    __pyx_L5:;
+  }
+
+  /* "skimage/graph/heap.pyx":188
+ *     ## C Maintenance methods
+ * 
+ *     cdef void _add_or_remove_level(self, LEVELS_T add_or_remove) nogil:             # <<<<<<<<<<<<<<
+ *         # init indexing ints
+ *         cdef INDEX_T i, i1, i2, n
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("skimage.graph.heap.BinaryHeap._add_or_remove_level", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 1);
+  __pyx_L0:;
+  #ifdef WITH_THREAD
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  #endif
+}
+
+/* "skimage/graph/heap.pyx":235
+ *         self._update()
+ * 
+ *     cdef void _update(self) nogil:             # <<<<<<<<<<<<<<
+ *         """Update the full tree from the bottom up.
+ * 
+ */
+
+static void __pyx_f_7skimage_5graph_4heap_10BinaryHeap__update(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self) {
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_v_values;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i0;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_ii;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_n;
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_v_level;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_t_1;
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_t_2;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_3;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_4;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_5;
+  int __pyx_t_6;
+
+  /* "skimage/graph/heap.pyx":242
+ *         """
+ *         # shorter name for values
+ *         cdef VALUE_T *values = self._values             # <<<<<<<<<<<<<<
+ * 
+ *         # Note that i represents an absolute index here
+ */
+  __pyx_t_1 = __pyx_v_self->_values;
+  __pyx_v_values = __pyx_t_1;
+
+  /* "skimage/graph/heap.pyx":249
+ * 
+ *         # track tree
+ *         for level in range(self.levels, 1, -1):             # <<<<<<<<<<<<<<
+ *             i0 = (1 << level) - 1  # 2**level-1 = LevelStart
+ *             n = i0 + 1  # 2**level
+ */
+  for (__pyx_t_2 = __pyx_v_self->levels + 1; __pyx_t_2 > 1 + 1; ) { __pyx_t_2-=1;
+    __pyx_v_level = __pyx_t_2;
+
+    /* "skimage/graph/heap.pyx":250
+ *         # track tree
+ *         for level in range(self.levels, 1, -1):
+ *             i0 = (1 << level) - 1  # 2**level-1 = LevelStart             # <<<<<<<<<<<<<<
+ *             n = i0 + 1  # 2**level
+ *             for i in range(i0, i0+n, 2):
+ */
+    __pyx_v_i0 = ((1 << __pyx_v_level) - 1);
+
+    /* "skimage/graph/heap.pyx":251
+ *         for level in range(self.levels, 1, -1):
+ *             i0 = (1 << level) - 1  # 2**level-1 = LevelStart
+ *             n = i0 + 1  # 2**level             # <<<<<<<<<<<<<<
+ *             for i in range(i0, i0+n, 2):
+ *                 ii = (i-1) // 2  # CalcPrevAbs
+ */
+    __pyx_v_n = (__pyx_v_i0 + 1);
+
+    /* "skimage/graph/heap.pyx":252
+ *             i0 = (1 << level) - 1  # 2**level-1 = LevelStart
+ *             n = i0 + 1  # 2**level
+ *             for i in range(i0, i0+n, 2):             # <<<<<<<<<<<<<<
+ *                 ii = (i-1) // 2  # CalcPrevAbs
+ *                 if values[i] < values[i+1]:
+ */
+    __pyx_t_3 = (__pyx_v_i0 + __pyx_v_n);
+    __pyx_t_4 = __pyx_t_3;
+    for (__pyx_t_5 = __pyx_v_i0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=2) {
+      __pyx_v_i = __pyx_t_5;
+
+      /* "skimage/graph/heap.pyx":253
+ *             n = i0 + 1  # 2**level
+ *             for i in range(i0, i0+n, 2):
+ *                 ii = (i-1) // 2  # CalcPrevAbs             # <<<<<<<<<<<<<<
+ *                 if values[i] < values[i+1]:
+ *                     values[ii] = values[i]
+ */
+      __pyx_v_ii = __Pyx_div___pyx_t_7skimage_5graph_4heap_INDEX_T((__pyx_v_i - 1), 2);
+
+      /* "skimage/graph/heap.pyx":254
+ *             for i in range(i0, i0+n, 2):
+ *                 ii = (i-1) // 2  # CalcPrevAbs
+ *                 if values[i] < values[i+1]:             # <<<<<<<<<<<<<<
+ *                     values[ii] = values[i]
+ *                 else:
+ */
+      __pyx_t_6 = (((__pyx_v_values[__pyx_v_i]) < (__pyx_v_values[(__pyx_v_i + 1)])) != 0);
+      if (__pyx_t_6) {
+
+        /* "skimage/graph/heap.pyx":255
+ *                 ii = (i-1) // 2  # CalcPrevAbs
+ *                 if values[i] < values[i+1]:
+ *                     values[ii] = values[i]             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     values[ii] = values[i+1]
+ */
+        (__pyx_v_values[__pyx_v_ii]) = (__pyx_v_values[__pyx_v_i]);
+
+        /* "skimage/graph/heap.pyx":254
+ *             for i in range(i0, i0+n, 2):
+ *                 ii = (i-1) // 2  # CalcPrevAbs
+ *                 if values[i] < values[i+1]:             # <<<<<<<<<<<<<<
+ *                     values[ii] = values[i]
+ *                 else:
+ */
+        goto __pyx_L7;
+      }
+
+      /* "skimage/graph/heap.pyx":257
+ *                     values[ii] = values[i]
+ *                 else:
+ *                     values[ii] = values[i+1]             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void _update_one(self, INDEX_T i) nogil:
+ */
+      /*else*/ {
+        (__pyx_v_values[__pyx_v_ii]) = (__pyx_v_values[(__pyx_v_i + 1)]);
+      }
+      __pyx_L7:;
+    }
+  }
+
+  /* "skimage/graph/heap.pyx":235
+ *         self._update()
+ * 
+ *     cdef void _update(self) nogil:             # <<<<<<<<<<<<<<
+ *         """Update the full tree from the bottom up.
+ * 
+ */
+
+  /* function exit code */
+}
+
+/* "skimage/graph/heap.pyx":259
+ *                     values[ii] = values[i+1]
+ * 
+ *     cdef void _update_one(self, INDEX_T i) nogil:             # <<<<<<<<<<<<<<
+ *         """Update the tree for one value."""
+ *         # shorter name for values
+ */
+
+static void __pyx_f_7skimage_5graph_4heap_10BinaryHeap__update_one(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i) {
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_v_values;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_ii;
+  CYTHON_UNUSED __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_v_level;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_t_1;
+  int __pyx_t_2;
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_t_3;
+
+  /* "skimage/graph/heap.pyx":262
+ *         """Update the tree for one value."""
+ *         # shorter name for values
+ *         cdef VALUE_T *values = self._values             # <<<<<<<<<<<<<<
+ * 
+ *         # make index uneven
+ */
+  __pyx_t_1 = __pyx_v_self->_values;
+  __pyx_v_values = __pyx_t_1;
+
+  /* "skimage/graph/heap.pyx":265
+ * 
+ *         # make index uneven
+ *         if i % 2 == 0:             # <<<<<<<<<<<<<<
+ *             i -= 1
+ * 
+ */
+  __pyx_t_2 = ((__Pyx_mod___pyx_t_7skimage_5graph_4heap_INDEX_T(__pyx_v_i, 2) == 0) != 0);
+  if (__pyx_t_2) {
+
+    /* "skimage/graph/heap.pyx":266
+ *         # make index uneven
+ *         if i % 2 == 0:
+ *             i -= 1             # <<<<<<<<<<<<<<
+ * 
+ *         # track tree
+ */
+    __pyx_v_i = (__pyx_v_i - 1);
+
+    /* "skimage/graph/heap.pyx":265
+ * 
+ *         # make index uneven
+ *         if i % 2 == 0:             # <<<<<<<<<<<<<<
+ *             i -= 1
+ * 
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":271
+ *         cdef INDEX_T ii
+ *         cdef LEVELS_T level
+ *         for level in range(self.levels, 1, -1):             # <<<<<<<<<<<<<<
+ *             ii = (i-1) // 2  # CalcPrevAbs
+ * 
+ */
+  for (__pyx_t_3 = __pyx_v_self->levels + 1; __pyx_t_3 > 1 + 1; ) { __pyx_t_3-=1;
+    __pyx_v_level = __pyx_t_3;
+
+    /* "skimage/graph/heap.pyx":272
+ *         cdef LEVELS_T level
+ *         for level in range(self.levels, 1, -1):
+ *             ii = (i-1) // 2  # CalcPrevAbs             # <<<<<<<<<<<<<<
+ * 
+ *             # test
+ */
+    __pyx_v_ii = __Pyx_div___pyx_t_7skimage_5graph_4heap_INDEX_T((__pyx_v_i - 1), 2);
+
+    /* "skimage/graph/heap.pyx":275
+ * 
+ *             # test
+ *             if values[i] < values[i+1]:             # <<<<<<<<<<<<<<
+ *                 values[ii] = values[i]
+ *             else:
+ */
+    __pyx_t_2 = (((__pyx_v_values[__pyx_v_i]) < (__pyx_v_values[(__pyx_v_i + 1)])) != 0);
+    if (__pyx_t_2) {
+
+      /* "skimage/graph/heap.pyx":276
+ *             # test
+ *             if values[i] < values[i+1]:
+ *                 values[ii] = values[i]             # <<<<<<<<<<<<<<
+ *             else:
+ *                 values[ii] = values[i+1]
+ */
+      (__pyx_v_values[__pyx_v_ii]) = (__pyx_v_values[__pyx_v_i]);
+
+      /* "skimage/graph/heap.pyx":275
+ * 
+ *             # test
+ *             if values[i] < values[i+1]:             # <<<<<<<<<<<<<<
+ *                 values[ii] = values[i]
+ *             else:
+ */
+      goto __pyx_L6;
+    }
+
+    /* "skimage/graph/heap.pyx":278
+ *                 values[ii] = values[i]
+ *             else:
+ *                 values[ii] = values[i+1]             # <<<<<<<<<<<<<<
+ *             # next
+ *             if ii % 2:
+ */
+    /*else*/ {
+      (__pyx_v_values[__pyx_v_ii]) = (__pyx_v_values[(__pyx_v_i + 1)]);
+    }
+    __pyx_L6:;
+
+    /* "skimage/graph/heap.pyx":280
+ *                 values[ii] = values[i+1]
+ *             # next
+ *             if ii % 2:             # <<<<<<<<<<<<<<
+ *                 i = ii
+ *             else:
+ */
+    __pyx_t_2 = (__Pyx_mod___pyx_t_7skimage_5graph_4heap_INDEX_T(__pyx_v_ii, 2) != 0);
+    if (__pyx_t_2) {
+
+      /* "skimage/graph/heap.pyx":281
+ *             # next
+ *             if ii % 2:
+ *                 i = ii             # <<<<<<<<<<<<<<
+ *             else:
+ *                 i = ii - 1
+ */
+      __pyx_v_i = __pyx_v_ii;
+
+      /* "skimage/graph/heap.pyx":280
+ *                 values[ii] = values[i+1]
+ *             # next
+ *             if ii % 2:             # <<<<<<<<<<<<<<
+ *                 i = ii
+ *             else:
+ */
+      goto __pyx_L7;
+    }
+
+    /* "skimage/graph/heap.pyx":283
+ *                 i = ii
+ *             else:
+ *                 i = ii - 1             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void _remove(self, INDEX_T i1) nogil:
+ */
+    /*else*/ {
+      __pyx_v_i = (__pyx_v_ii - 1);
+    }
+    __pyx_L7:;
+  }
+
+  /* "skimage/graph/heap.pyx":259
+ *                     values[ii] = values[i+1]
+ * 
+ *     cdef void _update_one(self, INDEX_T i) nogil:             # <<<<<<<<<<<<<<
+ *         """Update the tree for one value."""
+ *         # shorter name for values
+ */
+
+  /* function exit code */
+}
+
+/* "skimage/graph/heap.pyx":285
+ *                 i = ii - 1
+ * 
+ *     cdef void _remove(self, INDEX_T i1) nogil:             # <<<<<<<<<<<<<<
+ *         """Remove a value from the heap. By index."""
+ *         cdef LEVELS_T levels = self.levels
+ */
+
+static void __pyx_f_7skimage_5graph_4heap_10BinaryHeap__remove(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i1) {
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_v_levels;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_count;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i0;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i2;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_r1;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_r2;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_v_values;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T *__pyx_v_references;
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_t_1;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_2;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_t_3;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T *__pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+
+  /* "skimage/graph/heap.pyx":287
+ *     cdef void _remove(self, INDEX_T i1) nogil:
+ *         """Remove a value from the heap. By index."""
+ *         cdef LEVELS_T levels = self.levels             # <<<<<<<<<<<<<<
+ *         cdef INDEX_T count = self.count
+ *         # get indices
+ */
+  __pyx_t_1 = __pyx_v_self->levels;
+  __pyx_v_levels = __pyx_t_1;
+
+  /* "skimage/graph/heap.pyx":288
+ *         """Remove a value from the heap. By index."""
+ *         cdef LEVELS_T levels = self.levels
+ *         cdef INDEX_T count = self.count             # <<<<<<<<<<<<<<
+ *         # get indices
+ *         cdef INDEX_T i0 = (1 << levels) - 1  # 2**self.levels - 1 # LevelStart
+ */
+  __pyx_t_2 = __pyx_v_self->count;
+  __pyx_v_count = __pyx_t_2;
+
+  /* "skimage/graph/heap.pyx":290
+ *         cdef INDEX_T count = self.count
+ *         # get indices
+ *         cdef INDEX_T i0 = (1 << levels) - 1  # 2**self.levels - 1 # LevelStart             # <<<<<<<<<<<<<<
+ *         cdef INDEX_T i2 = i0 + count - 1
+ * 
+ */
+  __pyx_v_i0 = ((1 << __pyx_v_levels) - 1);
+
+  /* "skimage/graph/heap.pyx":291
+ *         # get indices
+ *         cdef INDEX_T i0 = (1 << levels) - 1  # 2**self.levels - 1 # LevelStart
+ *         cdef INDEX_T i2 = i0 + count - 1             # <<<<<<<<<<<<<<
+ * 
+ *         # get relative indices
+ */
+  __pyx_v_i2 = ((__pyx_v_i0 + __pyx_v_count) - 1);
+
+  /* "skimage/graph/heap.pyx":294
+ * 
+ *         # get relative indices
+ *         cdef INDEX_T r1 = i1 - i0             # <<<<<<<<<<<<<<
+ *         cdef INDEX_T r2 = count - 1
+ * 
+ */
+  __pyx_v_r1 = (__pyx_v_i1 - __pyx_v_i0);
+
+  /* "skimage/graph/heap.pyx":295
+ *         # get relative indices
+ *         cdef INDEX_T r1 = i1 - i0
+ *         cdef INDEX_T r2 = count - 1             # <<<<<<<<<<<<<<
+ * 
+ *         cdef VALUE_T *values = self._values
+ */
+  __pyx_v_r2 = (__pyx_v_count - 1);
+
+  /* "skimage/graph/heap.pyx":297
+ *         cdef INDEX_T r2 = count - 1
+ * 
+ *         cdef VALUE_T *values = self._values             # <<<<<<<<<<<<<<
+ *         cdef REFERENCE_T *references = self._references
+ * 
+ */
+  __pyx_t_3 = __pyx_v_self->_values;
+  __pyx_v_values = __pyx_t_3;
+
+  /* "skimage/graph/heap.pyx":298
+ * 
+ *         cdef VALUE_T *values = self._values
+ *         cdef REFERENCE_T *references = self._references             # <<<<<<<<<<<<<<
+ * 
+ *         # swap with last
+ */
+  __pyx_t_4 = __pyx_v_self->_references;
+  __pyx_v_references = __pyx_t_4;
+
+  /* "skimage/graph/heap.pyx":301
+ * 
+ *         # swap with last
+ *         values[i1] = values[i2]             # <<<<<<<<<<<<<<
+ *         references[r1] = references[r2]
+ * 
+ */
+  (__pyx_v_values[__pyx_v_i1]) = (__pyx_v_values[__pyx_v_i2]);
+
+  /* "skimage/graph/heap.pyx":302
+ *         # swap with last
+ *         values[i1] = values[i2]
+ *         references[r1] = references[r2]             # <<<<<<<<<<<<<<
+ * 
+ *         # make last Null
+ */
+  (__pyx_v_references[__pyx_v_r1]) = (__pyx_v_references[__pyx_v_r2]);
+
+  /* "skimage/graph/heap.pyx":305
+ * 
+ *         # make last Null
+ *         values[i2] = inf             # <<<<<<<<<<<<<<
+ * 
+ *         # update
+ */
+  (__pyx_v_values[__pyx_v_i2]) = __pyx_v_7skimage_5graph_4heap_inf;
+
+  /* "skimage/graph/heap.pyx":308
+ * 
+ *         # update
+ *         self.count -= 1             # <<<<<<<<<<<<<<
+ *         count -= 1
+ *         if (levels > self.min_levels) and (count < (1 << (levels-2))):
+ */
+  __pyx_v_self->count = (__pyx_v_self->count - 1);
+
+  /* "skimage/graph/heap.pyx":309
+ *         # update
+ *         self.count -= 1
+ *         count -= 1             # <<<<<<<<<<<<<<
+ *         if (levels > self.min_levels) and (count < (1 << (levels-2))):
+ *             self._add_or_remove_level(-1)
+ */
+  __pyx_v_count = (__pyx_v_count - 1);
+
+  /* "skimage/graph/heap.pyx":310
+ *         self.count -= 1
+ *         count -= 1
+ *         if (levels > self.min_levels) and (count < (1 << (levels-2))):             # <<<<<<<<<<<<<<
+ *             self._add_or_remove_level(-1)
+ *         else:
+ */
+  __pyx_t_6 = ((__pyx_v_levels > __pyx_v_self->min_levels) != 0);
+  if (__pyx_t_6) {
+  } else {
+    __pyx_t_5 = __pyx_t_6;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_6 = ((__pyx_v_count < (1 << (__pyx_v_levels - 2))) != 0);
+  __pyx_t_5 = __pyx_t_6;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_5) {
+
+    /* "skimage/graph/heap.pyx":311
+ *         count -= 1
+ *         if (levels > self.min_levels) and (count < (1 << (levels-2))):
+ *             self._add_or_remove_level(-1)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self._update_one(i1)
+ */
+    ((struct __pyx_vtabstruct_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self->__pyx_vtab)->_add_or_remove_level(__pyx_v_self, -1);
+
+    /* "skimage/graph/heap.pyx":310
+ *         self.count -= 1
+ *         count -= 1
+ *         if (levels > self.min_levels) and (count < (1 << (levels-2))):             # <<<<<<<<<<<<<<
+ *             self._add_or_remove_level(-1)
+ *         else:
+ */
+    goto __pyx_L3;
+  }
+
+  /* "skimage/graph/heap.pyx":313
+ *             self._add_or_remove_level(-1)
+ *         else:
+ *             self._update_one(i1)             # <<<<<<<<<<<<<<
+ *             self._update_one(i2)
+ * 
+ */
+  /*else*/ {
+    ((struct __pyx_vtabstruct_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self->__pyx_vtab)->_update_one(__pyx_v_self, __pyx_v_i1);
+
+    /* "skimage/graph/heap.pyx":314
+ *         else:
+ *             self._update_one(i1)
+ *             self._update_one(i2)             # <<<<<<<<<<<<<<
+ * 
+ *     ## C Public methods
+ */
+    ((struct __pyx_vtabstruct_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self->__pyx_vtab)->_update_one(__pyx_v_self, __pyx_v_i2);
+  }
+  __pyx_L3:;
+
+  /* "skimage/graph/heap.pyx":285
+ *                 i = ii - 1
+ * 
+ *     cdef void _remove(self, INDEX_T i1) nogil:             # <<<<<<<<<<<<<<
+ *         """Remove a value from the heap. By index."""
+ *         cdef LEVELS_T levels = self.levels
+ */
+
+  /* function exit code */
+}
+
+/* "skimage/graph/heap.pyx":318
+ *     ## C Public methods
+ * 
+ *     cdef INDEX_T push_fast(self, VALUE_T value, REFERENCE_T reference) nogil:             # <<<<<<<<<<<<<<
+ *         """The c-method for fast pushing.
+ * 
+ */
+
+static __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_f_7skimage_5graph_4heap_10BinaryHeap_push_fast(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_v_value, __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_v_reference) {
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_v_levels;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_count;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_r;
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_t_1;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "skimage/graph/heap.pyx":325
+ *         """
+ *         # We need to resize if currently it just fits.
+ *         cdef LEVELS_T levels = self.levels             # <<<<<<<<<<<<<<
+ *         cdef INDEX_T count = self.count
+ *         if count >= (1 << levels):  # 2**self.levels:
+ */
+  __pyx_t_1 = __pyx_v_self->levels;
+  __pyx_v_levels = __pyx_t_1;
+
+  /* "skimage/graph/heap.pyx":326
+ *         # We need to resize if currently it just fits.
+ *         cdef LEVELS_T levels = self.levels
+ *         cdef INDEX_T count = self.count             # <<<<<<<<<<<<<<
+ *         if count >= (1 << levels):  # 2**self.levels:
+ *             self._add_or_remove_level(1)
+ */
+  __pyx_t_2 = __pyx_v_self->count;
+  __pyx_v_count = __pyx_t_2;
+
+  /* "skimage/graph/heap.pyx":327
+ *         cdef LEVELS_T levels = self.levels
+ *         cdef INDEX_T count = self.count
+ *         if count >= (1 << levels):  # 2**self.levels:             # <<<<<<<<<<<<<<
+ *             self._add_or_remove_level(1)
+ *             levels += 1
+ */
+  __pyx_t_3 = ((__pyx_v_count >= (1 << __pyx_v_levels)) != 0);
+  if (__pyx_t_3) {
+
+    /* "skimage/graph/heap.pyx":328
+ *         cdef INDEX_T count = self.count
+ *         if count >= (1 << levels):  # 2**self.levels:
+ *             self._add_or_remove_level(1)             # <<<<<<<<<<<<<<
+ *             levels += 1
+ * 
+ */
+    ((struct __pyx_vtabstruct_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self->__pyx_vtab)->_add_or_remove_level(__pyx_v_self, 1);
+
+    /* "skimage/graph/heap.pyx":329
+ *         if count >= (1 << levels):  # 2**self.levels:
+ *             self._add_or_remove_level(1)
+ *             levels += 1             # <<<<<<<<<<<<<<
+ * 
+ *         # insert new value
+ */
+    __pyx_v_levels = (__pyx_v_levels + 1);
+
+    /* "skimage/graph/heap.pyx":327
+ *         cdef LEVELS_T levels = self.levels
+ *         cdef INDEX_T count = self.count
+ *         if count >= (1 << levels):  # 2**self.levels:             # <<<<<<<<<<<<<<
+ *             self._add_or_remove_level(1)
+ *             levels += 1
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":332
+ * 
+ *         # insert new value
+ *         cdef INDEX_T i = ((1 << levels) - 1) + count  # LevelStart + n             # <<<<<<<<<<<<<<
+ *         self._values[i] = value
+ *         self._references[count] = reference
+ */
+  __pyx_v_i = (((1 << __pyx_v_levels) - 1) + __pyx_v_count);
+
+  /* "skimage/graph/heap.pyx":333
+ *         # insert new value
+ *         cdef INDEX_T i = ((1 << levels) - 1) + count  # LevelStart + n
+ *         self._values[i] = value             # <<<<<<<<<<<<<<
+ *         self._references[count] = reference
+ * 
+ */
+  (__pyx_v_self->_values[__pyx_v_i]) = __pyx_v_value;
+
+  /* "skimage/graph/heap.pyx":334
+ *         cdef INDEX_T i = ((1 << levels) - 1) + count  # LevelStart + n
+ *         self._values[i] = value
+ *         self._references[count] = reference             # <<<<<<<<<<<<<<
+ * 
+ *         # update
+ */
+  (__pyx_v_self->_references[__pyx_v_count]) = __pyx_v_reference;
+
+  /* "skimage/graph/heap.pyx":337
+ * 
+ *         # update
+ *         self.count += 1             # <<<<<<<<<<<<<<
+ *         self._update_one(i)
+ * 
+ */
+  __pyx_v_self->count = (__pyx_v_self->count + 1);
+
+  /* "skimage/graph/heap.pyx":338
+ *         # update
+ *         self.count += 1
+ *         self._update_one(i)             # <<<<<<<<<<<<<<
+ * 
+ *         # return
+ */
+  ((struct __pyx_vtabstruct_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self->__pyx_vtab)->_update_one(__pyx_v_self, __pyx_v_i);
+
+  /* "skimage/graph/heap.pyx":341
+ * 
+ *         # return
+ *         return count             # <<<<<<<<<<<<<<
+ * 
+ *     cdef VALUE_T pop_fast(self) nogil:
+ */
+  __pyx_r = __pyx_v_count;
+  goto __pyx_L0;
+
+  /* "skimage/graph/heap.pyx":318
+ *     ## C Public methods
+ * 
+ *     cdef INDEX_T push_fast(self, VALUE_T value, REFERENCE_T reference) nogil:             # <<<<<<<<<<<<<<
+ *         """The c-method for fast pushing.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":343
+ *         return count
+ * 
+ *     cdef VALUE_T pop_fast(self) nogil:             # <<<<<<<<<<<<<<
+ *         """The c-method for fast popping.
+ * 
+ */
+
+static __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_f_7skimage_5graph_4heap_10BinaryHeap_pop_fast(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self) {
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_v_values;
+  CYTHON_UNUSED __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_v_level;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i;
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_v_levels;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_ir;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_v_value;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_r;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_t_1;
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_t_2;
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_t_3;
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_t_4;
+  int __pyx_t_5;
+
+  /* "skimage/graph/heap.pyx":350
+ *         """
+ *         # shorter name for values
+ *         cdef VALUE_T *values = self._values             # <<<<<<<<<<<<<<
+ * 
+ *         # init index. start at 1 because we start in level 1
+ */
+  __pyx_t_1 = __pyx_v_self->_values;
+  __pyx_v_values = __pyx_t_1;
+
+  /* "skimage/graph/heap.pyx":354
+ *         # init index. start at 1 because we start in level 1
+ *         cdef LEVELS_T level
+ *         cdef INDEX_T i = 1             # <<<<<<<<<<<<<<
+ *         cdef LEVELS_T levels = self.levels
+ *         # search tree (using absolute indices)
+ */
+  __pyx_v_i = 1;
+
+  /* "skimage/graph/heap.pyx":355
+ *         cdef LEVELS_T level
+ *         cdef INDEX_T i = 1
+ *         cdef LEVELS_T levels = self.levels             # <<<<<<<<<<<<<<
+ *         # search tree (using absolute indices)
+ *         for level in range(1, levels):
+ */
+  __pyx_t_2 = __pyx_v_self->levels;
+  __pyx_v_levels = __pyx_t_2;
+
+  /* "skimage/graph/heap.pyx":357
+ *         cdef LEVELS_T levels = self.levels
+ *         # search tree (using absolute indices)
+ *         for level in range(1, levels):             # <<<<<<<<<<<<<<
+ *             if values[i] <= values[i+1]:
+ *                 i = i * 2 + 1  # CalcNextAbs
+ */
+  __pyx_t_2 = __pyx_v_levels;
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 1; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_level = __pyx_t_4;
+
+    /* "skimage/graph/heap.pyx":358
+ *         # search tree (using absolute indices)
+ *         for level in range(1, levels):
+ *             if values[i] <= values[i+1]:             # <<<<<<<<<<<<<<
+ *                 i = i * 2 + 1  # CalcNextAbs
+ *             else:
+ */
+    __pyx_t_5 = (((__pyx_v_values[__pyx_v_i]) <= (__pyx_v_values[(__pyx_v_i + 1)])) != 0);
+    if (__pyx_t_5) {
+
+      /* "skimage/graph/heap.pyx":359
+ *         for level in range(1, levels):
+ *             if values[i] <= values[i+1]:
+ *                 i = i * 2 + 1  # CalcNextAbs             # <<<<<<<<<<<<<<
+ *             else:
+ *                 i = (i+1) * 2 + 1  # CalcNextAbs
+ */
+      __pyx_v_i = ((__pyx_v_i * 2) + 1);
+
+      /* "skimage/graph/heap.pyx":358
+ *         # search tree (using absolute indices)
+ *         for level in range(1, levels):
+ *             if values[i] <= values[i+1]:             # <<<<<<<<<<<<<<
+ *                 i = i * 2 + 1  # CalcNextAbs
+ *             else:
+ */
+      goto __pyx_L5;
+    }
+
+    /* "skimage/graph/heap.pyx":361
+ *                 i = i * 2 + 1  # CalcNextAbs
+ *             else:
+ *                 i = (i+1) * 2 + 1  # CalcNextAbs             # <<<<<<<<<<<<<<
+ * 
+ *         # select best one in last level
+ */
+    /*else*/ {
+      __pyx_v_i = (((__pyx_v_i + 1) * 2) + 1);
+    }
+    __pyx_L5:;
+  }
+
+  /* "skimage/graph/heap.pyx":364
+ * 
+ *         # select best one in last level
+ *         if values[i] <= values[i+1]:             # <<<<<<<<<<<<<<
+ *             i = i
+ *         else:
+ */
+  __pyx_t_5 = (((__pyx_v_values[__pyx_v_i]) <= (__pyx_v_values[(__pyx_v_i + 1)])) != 0);
+  if (__pyx_t_5) {
+
+    /* "skimage/graph/heap.pyx":365
+ *         # select best one in last level
+ *         if values[i] <= values[i+1]:
+ *             i = i             # <<<<<<<<<<<<<<
+ *         else:
+ *             i += 1
+ */
+    goto __pyx_L6;
+  }
+
+  /* "skimage/graph/heap.pyx":367
+ *             i = i
+ *         else:
+ *             i += 1             # <<<<<<<<<<<<<<
+ * 
+ *         # get values
+ */
+  /*else*/ {
+    __pyx_v_i = (__pyx_v_i + 1);
+  }
+  __pyx_L6:;
+
+  /* "skimage/graph/heap.pyx":370
+ * 
+ *         # get values
+ *         cdef INDEX_T ir = i - ((1 << levels) - 1) # (2**self.levels-1)             # <<<<<<<<<<<<<<
+ *                                                   # LevelStart
+ *         cdef VALUE_T value = values[i]
+ */
+  __pyx_v_ir = (__pyx_v_i - ((1 << __pyx_v_levels) - 1));
+
+  /* "skimage/graph/heap.pyx":372
+ *         cdef INDEX_T ir = i - ((1 << levels) - 1) # (2**self.levels-1)
+ *                                                   # LevelStart
+ *         cdef VALUE_T value = values[i]             # <<<<<<<<<<<<<<
+ *         self._popped_ref = self._references[ir]
+ * 
+ */
+  __pyx_v_value = (__pyx_v_values[__pyx_v_i]);
+
+  /* "skimage/graph/heap.pyx":373
+ *                                                   # LevelStart
+ *         cdef VALUE_T value = values[i]
+ *         self._popped_ref = self._references[ir]             # <<<<<<<<<<<<<<
+ * 
+ *         # remove it
+ */
+  __pyx_v_self->_popped_ref = (__pyx_v_self->_references[__pyx_v_ir]);
+
+  /* "skimage/graph/heap.pyx":376
+ * 
+ *         # remove it
+ *         if self.count:             # <<<<<<<<<<<<<<
+ *             self._remove(i)
+ * 
+ */
+  __pyx_t_5 = (__pyx_v_self->count != 0);
+  if (__pyx_t_5) {
+
+    /* "skimage/graph/heap.pyx":377
+ *         # remove it
+ *         if self.count:
+ *             self._remove(i)             # <<<<<<<<<<<<<<
+ * 
+ *         # return
+ */
+    ((struct __pyx_vtabstruct_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self->__pyx_vtab)->_remove(__pyx_v_self, __pyx_v_i);
+
+    /* "skimage/graph/heap.pyx":376
+ * 
+ *         # remove it
+ *         if self.count:             # <<<<<<<<<<<<<<
+ *             self._remove(i)
+ * 
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":380
+ * 
+ *         # return
+ *         return value             # <<<<<<<<<<<<<<
+ * 
+ *     ## Python Public methods (that do not need to be VERY fast)
+ */
+  __pyx_r = __pyx_v_value;
+  goto __pyx_L0;
+
+  /* "skimage/graph/heap.pyx":343
+ *         return count
+ * 
+ *     cdef VALUE_T pop_fast(self) nogil:             # <<<<<<<<<<<<<<
+ *         """The c-method for fast popping.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":384
+ *     ## Python Public methods (that do not need to be VERY fast)
+ * 
+ *     def push(self, VALUE_T value, REFERENCE_T reference=-1):             # <<<<<<<<<<<<<<
+ *         """push(value, reference=-1)
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_11push(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7skimage_5graph_4heap_10BinaryHeap_10push[] = "push(value, reference=-1)\n\n        Append a value to the heap, with optional reference.\n\n        Parameters\n        ----------\n        value : float\n            Value to push onto the heap\n        reference : int, optional\n            Reference to associate with the given value.\n\n        ";
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_11push(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_v_value;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_v_reference;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("push (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_value,&__pyx_n_s_reference,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_value)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_reference);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "push") < 0)) __PYX_ERR(0, 384, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_value = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_value == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 384, __pyx_L3_error)
+    if (values[1]) {
+      __pyx_v_reference = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_reference == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 384, __pyx_L3_error)
+    } else {
+      __pyx_v_reference = ((__pyx_t_7skimage_5graph_4heap_REFERENCE_T)-1L);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("push", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 384, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("skimage.graph.heap.BinaryHeap.push", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_10push(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self), __pyx_v_value, __pyx_v_reference);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_10push(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_v_value, __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_v_reference) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("push", 0);
+
+  /* "skimage/graph/heap.pyx":397
+ * 
+ *         """
+ *         self.push_fast(value, reference)             # <<<<<<<<<<<<<<
+ * 
+ *     def min_val(self):
+ */
+  (void)(((struct __pyx_vtabstruct_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self->__pyx_vtab)->push_fast(__pyx_v_self, __pyx_v_value, __pyx_v_reference));
+
+  /* "skimage/graph/heap.pyx":384
+ *     ## Python Public methods (that do not need to be VERY fast)
+ * 
+ *     def push(self, VALUE_T value, REFERENCE_T reference=-1):             # <<<<<<<<<<<<<<
+ *         """push(value, reference=-1)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":399
+ *         self.push_fast(value, reference)
+ * 
+ *     def min_val(self):             # <<<<<<<<<<<<<<
+ *         """min_val()
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_13min_val(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7skimage_5graph_4heap_10BinaryHeap_12min_val[] = "min_val()\n\n        Get the minimum value on the heap.\n\n        Returns only the value, and does not remove it from the heap.\n\n        ";
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_13min_val(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("min_val (wrapper)", 0);
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_12min_val(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_12min_val(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self) {
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_v_values;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("min_val", 0);
+
+  /* "skimage/graph/heap.pyx":408
+ *         """
+ *         # shorter name for values
+ *         cdef VALUE_T *values = self._values             # <<<<<<<<<<<<<<
+ * 
+ *         # select best one in last level
+ */
+  __pyx_t_1 = __pyx_v_self->_values;
+  __pyx_v_values = __pyx_t_1;
+
+  /* "skimage/graph/heap.pyx":411
+ * 
+ *         # select best one in last level
+ *         if values[1] < values[2]:             # <<<<<<<<<<<<<<
+ *             return values[1]
+ *         else:
+ */
+  __pyx_t_2 = (((__pyx_v_values[1]) < (__pyx_v_values[2])) != 0);
+  if (__pyx_t_2) {
+
+    /* "skimage/graph/heap.pyx":412
+ *         # select best one in last level
+ *         if values[1] < values[2]:
+ *             return values[1]             # <<<<<<<<<<<<<<
+ *         else:
+ *             return values[2]
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = PyFloat_FromDouble((__pyx_v_values[1])); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 412, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "skimage/graph/heap.pyx":411
+ * 
+ *         # select best one in last level
+ *         if values[1] < values[2]:             # <<<<<<<<<<<<<<
+ *             return values[1]
+ *         else:
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":414
+ *             return values[1]
+ *         else:
+ *             return values[2]             # <<<<<<<<<<<<<<
+ * 
+ *     def values(self):
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = PyFloat_FromDouble((__pyx_v_values[2])); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 414, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "skimage/graph/heap.pyx":399
+ *         self.push_fast(value, reference)
+ * 
+ *     def min_val(self):             # <<<<<<<<<<<<<<
+ *         """min_val()
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("skimage.graph.heap.BinaryHeap.min_val", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":416
+ *             return values[2]
+ * 
+ *     def values(self):             # <<<<<<<<<<<<<<
+ *         """values()
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_15values(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7skimage_5graph_4heap_10BinaryHeap_14values[] = "values()\n\n        Get the values in the heap as a list.\n\n        ";
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_15values(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("values (wrapper)", 0);
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_14values(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_14values(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self) {
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i0;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_7genexpr__pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_2;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_3;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("values", 0);
+
+  /* "skimage/graph/heap.pyx":422
+ * 
+ *         """
+ *         cdef INDEX_T i0 = 2**self.levels - 1  # LevelStart             # <<<<<<<<<<<<<<
+ *         return [self._values[i] for i in range(i0, i0+self.count)]
+ * 
+ */
+  __pyx_v_i0 = (__Pyx_pow_long(2, ((long)__pyx_v_self->levels)) - 1);
+
+  /* "skimage/graph/heap.pyx":423
+ *         """
+ *         cdef INDEX_T i0 = 2**self.levels - 1  # LevelStart
+ *         return [self._values[i] for i in range(i0, i0+self.count)]             # <<<<<<<<<<<<<<
+ * 
+ *     def references(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  { /* enter inner scope */
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 423, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = (__pyx_v_i0 + __pyx_v_self->count);
+    __pyx_t_3 = __pyx_t_2;
+    for (__pyx_t_4 = __pyx_v_i0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_7genexpr__pyx_v_i = __pyx_t_4;
+      __pyx_t_5 = PyFloat_FromDouble((__pyx_v_self->_values[__pyx_7genexpr__pyx_v_i])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 423, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_5))) __PYX_ERR(0, 423, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    }
+  } /* exit inner scope */
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "skimage/graph/heap.pyx":416
+ *             return values[2]
+ * 
+ *     def values(self):             # <<<<<<<<<<<<<<
+ *         """values()
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("skimage.graph.heap.BinaryHeap.values", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":425
+ *         return [self._values[i] for i in range(i0, i0+self.count)]
+ * 
+ *     def references(self):             # <<<<<<<<<<<<<<
+ *         """references()
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_17references(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7skimage_5graph_4heap_10BinaryHeap_16references[] = "references()\n\n        Get the references in the heap as a list.\n\n        ";
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_17references(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("references (wrapper)", 0);
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_16references(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_16references(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self) {
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_8genexpr1__pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_2;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_3;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("references", 0);
+
+  /* "skimage/graph/heap.pyx":431
+ * 
+ *         """
+ *         return [self._references[i] for i in range(self.count)]             # <<<<<<<<<<<<<<
+ * 
+ *     def pop(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  { /* enter inner scope */
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 431, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = __pyx_v_self->count;
+    __pyx_t_3 = __pyx_t_2;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_8genexpr1__pyx_v_i = __pyx_t_4;
+      __pyx_t_5 = PyInt_FromSsize_t((__pyx_v_self->_references[__pyx_8genexpr1__pyx_v_i])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 431, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_5))) __PYX_ERR(0, 431, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    }
+  } /* exit inner scope */
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "skimage/graph/heap.pyx":425
+ *         return [self._values[i] for i in range(i0, i0+self.count)]
+ * 
+ *     def references(self):             # <<<<<<<<<<<<<<
+ *         """references()
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("skimage.graph.heap.BinaryHeap.references", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":433
+ *         return [self._references[i] for i in range(self.count)]
+ * 
+ *     def pop(self):             # <<<<<<<<<<<<<<
+ *         """pop()
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_19pop(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7skimage_5graph_4heap_10BinaryHeap_18pop[] = "pop()\n\n        Get the minimum value and remove it from the list.\n\n        Returns\n        -------\n        value : float\n        reference : int\n            If no reference was provided, -1 is returned here.\n\n        Raises\n        ------\n        IndexError\n            On attempt to pop from an empty heap\n\n        ";
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_19pop(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("pop (wrapper)", 0);
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_18pop(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_18pop(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self) {
+  PyObject *__pyx_v_value = NULL;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_v_ref;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("pop", 0);
+
+  /* "skimage/graph/heap.pyx":450
+ * 
+ *         """
+ *         if self.count == 0:             # <<<<<<<<<<<<<<
+ *             raise IndexError('pop from an empty heap')
+ *         value = self.pop_fast()
+ */
+  __pyx_t_1 = ((__pyx_v_self->count == 0) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "skimage/graph/heap.pyx":451
+ *         """
+ *         if self.count == 0:
+ *             raise IndexError('pop from an empty heap')             # <<<<<<<<<<<<<<
+ *         value = self.pop_fast()
+ *         ref = self._popped_ref
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_IndexError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 451, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 451, __pyx_L1_error)
+
+    /* "skimage/graph/heap.pyx":450
+ * 
+ *         """
+ *         if self.count == 0:             # <<<<<<<<<<<<<<
+ *             raise IndexError('pop from an empty heap')
+ *         value = self.pop_fast()
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":452
+ *         if self.count == 0:
+ *             raise IndexError('pop from an empty heap')
+ *         value = self.pop_fast()             # <<<<<<<<<<<<<<
+ *         ref = self._popped_ref
+ *         return value, ref
+ */
+  __pyx_t_2 = PyFloat_FromDouble(((struct __pyx_vtabstruct_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self->__pyx_vtab)->pop_fast(__pyx_v_self)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 452, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_value = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "skimage/graph/heap.pyx":453
+ *             raise IndexError('pop from an empty heap')
+ *         value = self.pop_fast()
+ *         ref = self._popped_ref             # <<<<<<<<<<<<<<
+ *         return value, ref
+ * 
+ */
+  __pyx_t_3 = __pyx_v_self->_popped_ref;
+  __pyx_v_ref = __pyx_t_3;
+
+  /* "skimage/graph/heap.pyx":454
+ *         value = self.pop_fast()
+ *         ref = self._popped_ref
+ *         return value, ref             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_v_ref); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 454, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 454, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_value);
+  __Pyx_GIVEREF(__pyx_v_value);
+  PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_value);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_2);
+  __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "skimage/graph/heap.pyx":433
+ *         return [self._references[i] for i in range(self.count)]
+ * 
+ *     def pop(self):             # <<<<<<<<<<<<<<
+ *         """pop()
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("skimage.graph.heap.BinaryHeap.pop", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_value);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pxd":16
+ * 
+ * cdef class BinaryHeap:
+ *     cdef readonly INDEX_T count             # <<<<<<<<<<<<<<
+ *     cdef readonly LEVELS_T levels, min_levels
+ *     cdef VALUE_T *_values
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_5count_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_5count_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_5count___get__(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_5count___get__(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_self->count); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 16, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("skimage.graph.heap.BinaryHeap.count.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pxd":17
+ * cdef class BinaryHeap:
+ *     cdef readonly INDEX_T count
+ *     cdef readonly LEVELS_T levels, min_levels             # <<<<<<<<<<<<<<
+ *     cdef VALUE_T *_values
+ *     cdef REFERENCE_T *_references
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_6levels_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_6levels_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_6levels___get__(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_6levels___get__(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_char(__pyx_v_self->levels); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("skimage.graph.heap.BinaryHeap.levels.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_10min_levels_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_10min_levels_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_10min_levels___get__(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_10min_levels___get__(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_unsigned_char(__pyx_v_self->min_levels); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("skimage.graph.heap.BinaryHeap.min_levels.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_21__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_21__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_20__reduce_cython__(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_20__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("skimage.graph.heap.BinaryHeap.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_23__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_23__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_10BinaryHeap_22__setstate_cython__(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_10BinaryHeap_22__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("skimage.graph.heap.BinaryHeap.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":511
+ *     """
+ * 
+ *     def __cinit__(self, INDEX_T initial_capacity=128, max_reference=None):             # <<<<<<<<<<<<<<
+ *         if max_reference is None:
+ *             max_reference = initial_capacity - 1
+ */
+
+/* Python wrapper */
+static int __pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_initial_capacity;
+  PyObject *__pyx_v_max_reference = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_initial_capacity,&__pyx_n_s_max_reference,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_initial_capacity);
+          if (value) { values[0] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_max_reference);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 511, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    if (values[0]) {
+      __pyx_v_initial_capacity = __Pyx_PyIndex_AsSsize_t(values[0]); if (unlikely((__pyx_v_initial_capacity == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 511, __pyx_L3_error)
+    } else {
+      __pyx_v_initial_capacity = ((__pyx_t_7skimage_5graph_4heap_INDEX_T)0x80);
+    }
+    __pyx_v_max_reference = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 0, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 511, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("skimage.graph.heap.FastUpdateBinaryHeap.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap___cinit__(((struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self), __pyx_v_initial_capacity, __pyx_v_max_reference);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap___cinit__(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_initial_capacity, PyObject *__pyx_v_max_reference) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__cinit__", 0);
+  __Pyx_INCREF(__pyx_v_max_reference);
+
+  /* "skimage/graph/heap.pyx":512
+ * 
+ *     def __cinit__(self, INDEX_T initial_capacity=128, max_reference=None):
+ *         if max_reference is None:             # <<<<<<<<<<<<<<
+ *             max_reference = initial_capacity - 1
+ *         self.max_reference = max_reference
+ */
+  __pyx_t_1 = (__pyx_v_max_reference == Py_None);
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "skimage/graph/heap.pyx":513
+ *     def __cinit__(self, INDEX_T initial_capacity=128, max_reference=None):
+ *         if max_reference is None:
+ *             max_reference = initial_capacity - 1             # <<<<<<<<<<<<<<
+ *         self.max_reference = max_reference
+ *         self._crossref = <INDEX_T *>malloc((self.max_reference + 1) *
+ */
+    __pyx_t_3 = PyInt_FromSsize_t((__pyx_v_initial_capacity - 1)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 513, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF_SET(__pyx_v_max_reference, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "skimage/graph/heap.pyx":512
+ * 
+ *     def __cinit__(self, INDEX_T initial_capacity=128, max_reference=None):
+ *         if max_reference is None:             # <<<<<<<<<<<<<<
+ *             max_reference = initial_capacity - 1
+ *         self.max_reference = max_reference
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":514
+ *         if max_reference is None:
+ *             max_reference = initial_capacity - 1
+ *         self.max_reference = max_reference             # <<<<<<<<<<<<<<
+ *         self._crossref = <INDEX_T *>malloc((self.max_reference + 1) *
+ *                                            sizeof(INDEX_T))
+ */
+  __pyx_t_4 = __Pyx_PyIndex_AsSsize_t(__pyx_v_max_reference); if (unlikely((__pyx_t_4 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 514, __pyx_L1_error)
+  __pyx_v_self->max_reference = __pyx_t_4;
+
+  /* "skimage/graph/heap.pyx":515
+ *             max_reference = initial_capacity - 1
+ *         self.max_reference = max_reference
+ *         self._crossref = <INDEX_T *>malloc((self.max_reference + 1) *             # <<<<<<<<<<<<<<
+ *                                            sizeof(INDEX_T))
+ * 
+ */
+  __pyx_v_self->_crossref = ((__pyx_t_7skimage_5graph_4heap_INDEX_T *)malloc(((__pyx_v_self->max_reference + 1) * (sizeof(__pyx_t_7skimage_5graph_4heap_INDEX_T)))));
+
+  /* "skimage/graph/heap.pyx":511
+ *     """
+ * 
+ *     def __cinit__(self, INDEX_T initial_capacity=128, max_reference=None):             # <<<<<<<<<<<<<<
+ *         if max_reference is None:
+ *             max_reference = initial_capacity - 1
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("skimage.graph.heap.FastUpdateBinaryHeap.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_max_reference);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":518
+ *                                            sizeof(INDEX_T))
+ * 
+ *     def __init__(self, INDEX_T initial_capacity=128, max_reference=None):             # <<<<<<<<<<<<<<
+ *         """__init__(initial_capacity=128, max_reference=None)
+ * 
+ */
+
+/* Python wrapper */
+static int __pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_3__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7skimage_5graph_4heap_20FastUpdateBinaryHeap_2__init__[] = "__init__(initial_capacity=128, max_reference=None)\n\n        Class constructor.\n\n        ";
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_7skimage_5graph_4heap_20FastUpdateBinaryHeap_2__init__;
+#endif
+static int __pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_3__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_initial_capacity;
+  CYTHON_UNUSED PyObject *__pyx_v_max_reference = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_initial_capacity,&__pyx_n_s_max_reference,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_initial_capacity);
+          if (value) { values[0] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_max_reference);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) __PYX_ERR(0, 518, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    if (values[0]) {
+      __pyx_v_initial_capacity = __Pyx_PyIndex_AsSsize_t(values[0]); if (unlikely((__pyx_v_initial_capacity == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 518, __pyx_L3_error)
+    } else {
+      __pyx_v_initial_capacity = ((__pyx_t_7skimage_5graph_4heap_INDEX_T)0x80);
+    }
+    __pyx_v_max_reference = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 518, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("skimage.graph.heap.FastUpdateBinaryHeap.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_2__init__(((struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self), __pyx_v_initial_capacity, __pyx_v_max_reference);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_2__init__(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_initial_capacity, CYTHON_UNUSED PyObject *__pyx_v_max_reference) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "skimage/graph/heap.pyx":524
+ * 
+ *         """
+ *         if self._crossref is NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         # below will call self.reset
+ */
+  __pyx_t_1 = ((__pyx_v_self->_crossref == NULL) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "skimage/graph/heap.pyx":525
+ *         """
+ *         if self._crossref is NULL:
+ *             raise MemoryError()             # <<<<<<<<<<<<<<
+ *         # below will call self.reset
+ *         BinaryHeap.__init__(self, initial_capacity)
+ */
+    PyErr_NoMemory(); __PYX_ERR(0, 525, __pyx_L1_error)
+
+    /* "skimage/graph/heap.pyx":524
+ * 
+ *         """
+ *         if self._crossref is NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         # below will call self.reset
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":527
+ *             raise MemoryError()
+ *         # below will call self.reset
+ *         BinaryHeap.__init__(self, initial_capacity)             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+ */
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_7skimage_5graph_4heap_BinaryHeap), __pyx_n_s_init); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 527, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = PyInt_FromSsize_t(__pyx_v_initial_capacity); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 527, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = NULL;
+  __pyx_t_6 = 0;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_6 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_5, ((PyObject *)__pyx_v_self), __pyx_t_4};
+    __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 527, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_5, ((PyObject *)__pyx_v_self), __pyx_t_4};
+    __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 527, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 527, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    if (__pyx_t_5) {
+      __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
+    }
+    __Pyx_INCREF(((PyObject *)__pyx_v_self));
+    __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+    PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, ((PyObject *)__pyx_v_self));
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_4);
+    __pyx_t_4 = 0;
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 527, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "skimage/graph/heap.pyx":518
+ *                                            sizeof(INDEX_T))
+ * 
+ *     def __init__(self, INDEX_T initial_capacity=128, max_reference=None):             # <<<<<<<<<<<<<<
+ *         """__init__(initial_capacity=128, max_reference=None)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("skimage.graph.heap.FastUpdateBinaryHeap.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":529
+ *         BinaryHeap.__init__(self, initial_capacity)
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self._crossref)
+ * 
+ */
+
+/* Python wrapper */
+static void __pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_5__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_5__dealloc__(PyObject *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_4__dealloc__(((struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_4__dealloc__(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__", 0);
+
+  /* "skimage/graph/heap.pyx":530
+ * 
+ *     def __dealloc__(self):
+ *         free(self._crossref)             # <<<<<<<<<<<<<<
+ * 
+ *     def reset(self):
+ */
+  free(__pyx_v_self->_crossref);
+
+  /* "skimage/graph/heap.pyx":529
+ *         BinaryHeap.__init__(self, initial_capacity)
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self._crossref)
+ * 
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "skimage/graph/heap.pyx":532
+ *         free(self._crossref)
+ * 
+ *     def reset(self):             # <<<<<<<<<<<<<<
+ *         """reset()
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_7reset(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7skimage_5graph_4heap_20FastUpdateBinaryHeap_6reset[] = "reset()\n\n        Reset the heap to default, empty state.\n\n        ";
+static PyObject *__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_7reset(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("reset (wrapper)", 0);
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_6reset(((struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_6reset(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self) {
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_t_4;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_t_5;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("reset", 0);
+
+  /* "skimage/graph/heap.pyx":538
+ * 
+ *         """
+ *         BinaryHeap.reset(self)             # <<<<<<<<<<<<<<
+ *         # set default values of crossrefs
+ *         cdef INDEX_T i
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_ptype_7skimage_5graph_4heap_BinaryHeap), __pyx_n_s_reset); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 538, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, ((PyObject *)__pyx_v_self)) : __Pyx_PyObject_CallOneArg(__pyx_t_2, ((PyObject *)__pyx_v_self));
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 538, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "skimage/graph/heap.pyx":541
+ *         # set default values of crossrefs
+ *         cdef INDEX_T i
+ *         for i in range(self.max_reference + 1):             # <<<<<<<<<<<<<<
+ *             self._crossref[i] = -1
+ * 
+ */
+  __pyx_t_4 = (__pyx_v_self->max_reference + 1);
+  __pyx_t_5 = __pyx_t_4;
+  for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+    __pyx_v_i = __pyx_t_6;
+
+    /* "skimage/graph/heap.pyx":542
+ *         cdef INDEX_T i
+ *         for i in range(self.max_reference + 1):
+ *             self._crossref[i] = -1             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void _remove(self, INDEX_T i1) nogil:
+ */
+    (__pyx_v_self->_crossref[__pyx_v_i]) = -1L;
+  }
+
+  /* "skimage/graph/heap.pyx":532
+ *         free(self._crossref)
+ * 
+ *     def reset(self):             # <<<<<<<<<<<<<<
+ *         """reset()
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("skimage.graph.heap.FastUpdateBinaryHeap.reset", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":544
+ *             self._crossref[i] = -1
+ * 
+ *     cdef void _remove(self, INDEX_T i1) nogil:             # <<<<<<<<<<<<<<
+ *         """Remove a value from the heap. By index."""
+ *         cdef LEVELS_T levels = self.levels
+ */
+
+static void __pyx_f_7skimage_5graph_4heap_20FastUpdateBinaryHeap__remove(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i1) {
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_v_levels;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_count;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i0;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i2;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_r1;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_r2;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_v_values;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T *__pyx_v_references;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T *__pyx_v_crossref;
+  __pyx_t_7skimage_5graph_4heap_LEVELS_T __pyx_t_1;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_t_2;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_t_3;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T *__pyx_t_4;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T *__pyx_t_5;
+  int __pyx_t_6;
+
+  /* "skimage/graph/heap.pyx":546
+ *     cdef void _remove(self, INDEX_T i1) nogil:
+ *         """Remove a value from the heap. By index."""
+ *         cdef LEVELS_T levels = self.levels             # <<<<<<<<<<<<<<
+ *         cdef INDEX_T count = self.count
+ * 
+ */
+  __pyx_t_1 = __pyx_v_self->__pyx_base.levels;
+  __pyx_v_levels = __pyx_t_1;
+
+  /* "skimage/graph/heap.pyx":547
+ *         """Remove a value from the heap. By index."""
+ *         cdef LEVELS_T levels = self.levels
+ *         cdef INDEX_T count = self.count             # <<<<<<<<<<<<<<
+ * 
+ *         # get indices
+ */
+  __pyx_t_2 = __pyx_v_self->__pyx_base.count;
+  __pyx_v_count = __pyx_t_2;
+
+  /* "skimage/graph/heap.pyx":550
+ * 
+ *         # get indices
+ *         cdef INDEX_T i0 = (1 << levels) - 1  # 2**self.levels - 1 # LevelStart             # <<<<<<<<<<<<<<
+ *         cdef INDEX_T i2 = i0 + count - 1
+ * 
+ */
+  __pyx_v_i0 = ((1 << __pyx_v_levels) - 1);
+
+  /* "skimage/graph/heap.pyx":551
+ *         # get indices
+ *         cdef INDEX_T i0 = (1 << levels) - 1  # 2**self.levels - 1 # LevelStart
+ *         cdef INDEX_T i2 = i0 + count - 1             # <<<<<<<<<<<<<<
+ * 
+ *         # get relative indices
+ */
+  __pyx_v_i2 = ((__pyx_v_i0 + __pyx_v_count) - 1);
+
+  /* "skimage/graph/heap.pyx":554
+ * 
+ *         # get relative indices
+ *         cdef INDEX_T r1 = i1 - i0             # <<<<<<<<<<<<<<
+ *         cdef INDEX_T r2 = count - 1
+ * 
+ */
+  __pyx_v_r1 = (__pyx_v_i1 - __pyx_v_i0);
+
+  /* "skimage/graph/heap.pyx":555
+ *         # get relative indices
+ *         cdef INDEX_T r1 = i1 - i0
+ *         cdef INDEX_T r2 = count - 1             # <<<<<<<<<<<<<<
+ * 
+ *         cdef VALUE_T *values = self._values
+ */
+  __pyx_v_r2 = (__pyx_v_count - 1);
+
+  /* "skimage/graph/heap.pyx":557
+ *         cdef INDEX_T r2 = count - 1
+ * 
+ *         cdef VALUE_T *values = self._values             # <<<<<<<<<<<<<<
+ *         cdef REFERENCE_T *references = self._references
+ *         cdef INDEX_T *crossref = self._crossref
+ */
+  __pyx_t_3 = __pyx_v_self->__pyx_base._values;
+  __pyx_v_values = __pyx_t_3;
+
+  /* "skimage/graph/heap.pyx":558
+ * 
+ *         cdef VALUE_T *values = self._values
+ *         cdef REFERENCE_T *references = self._references             # <<<<<<<<<<<<<<
+ *         cdef INDEX_T *crossref = self._crossref
+ * 
+ */
+  __pyx_t_4 = __pyx_v_self->__pyx_base._references;
+  __pyx_v_references = __pyx_t_4;
+
+  /* "skimage/graph/heap.pyx":559
+ *         cdef VALUE_T *values = self._values
+ *         cdef REFERENCE_T *references = self._references
+ *         cdef INDEX_T *crossref = self._crossref             # <<<<<<<<<<<<<<
+ * 
+ *         # update cross reference
+ */
+  __pyx_t_5 = __pyx_v_self->_crossref;
+  __pyx_v_crossref = __pyx_t_5;
+
+  /* "skimage/graph/heap.pyx":562
+ * 
+ *         # update cross reference
+ *         crossref[references[r2]] = r1             # <<<<<<<<<<<<<<
+ *         crossref[references[r1]] = -1  # disable removed item
+ * 
+ */
+  (__pyx_v_crossref[(__pyx_v_references[__pyx_v_r2])]) = __pyx_v_r1;
+
+  /* "skimage/graph/heap.pyx":563
+ *         # update cross reference
+ *         crossref[references[r2]] = r1
+ *         crossref[references[r1]] = -1  # disable removed item             # <<<<<<<<<<<<<<
+ * 
+ *         # swap with last
+ */
+  (__pyx_v_crossref[(__pyx_v_references[__pyx_v_r1])]) = -1L;
+
+  /* "skimage/graph/heap.pyx":566
+ * 
+ *         # swap with last
+ *         values[i1] = values[i2]             # <<<<<<<<<<<<<<
+ *         references[r1] = references[r2]
+ * 
+ */
+  (__pyx_v_values[__pyx_v_i1]) = (__pyx_v_values[__pyx_v_i2]);
+
+  /* "skimage/graph/heap.pyx":567
+ *         # swap with last
+ *         values[i1] = values[i2]
+ *         references[r1] = references[r2]             # <<<<<<<<<<<<<<
+ * 
+ *         # make last Null
+ */
+  (__pyx_v_references[__pyx_v_r1]) = (__pyx_v_references[__pyx_v_r2]);
+
+  /* "skimage/graph/heap.pyx":570
+ * 
+ *         # make last Null
+ *         values[i2] = inf             # <<<<<<<<<<<<<<
+ * 
+ *         # update
+ */
+  (__pyx_v_values[__pyx_v_i2]) = __pyx_v_7skimage_5graph_4heap_inf;
+
+  /* "skimage/graph/heap.pyx":573
+ * 
+ *         # update
+ *         self.count -= 1             # <<<<<<<<<<<<<<
+ *         count -= 1
+ *         if (levels > self.min_levels) & (count < (1 << (levels-2))):
+ */
+  __pyx_v_self->__pyx_base.count = (__pyx_v_self->__pyx_base.count - 1);
+
+  /* "skimage/graph/heap.pyx":574
+ *         # update
+ *         self.count -= 1
+ *         count -= 1             # <<<<<<<<<<<<<<
+ *         if (levels > self.min_levels) & (count < (1 << (levels-2))):
+ *             self._add_or_remove_level(-1)
+ */
+  __pyx_v_count = (__pyx_v_count - 1);
+
+  /* "skimage/graph/heap.pyx":575
+ *         self.count -= 1
+ *         count -= 1
+ *         if (levels > self.min_levels) & (count < (1 << (levels-2))):             # <<<<<<<<<<<<<<
+ *             self._add_or_remove_level(-1)
+ *         else:
+ */
+  __pyx_t_6 = (((__pyx_v_levels > __pyx_v_self->__pyx_base.min_levels) & (__pyx_v_count < (1 << (__pyx_v_levels - 2)))) != 0);
+  if (__pyx_t_6) {
+
+    /* "skimage/graph/heap.pyx":576
+ *         count -= 1
+ *         if (levels > self.min_levels) & (count < (1 << (levels-2))):
+ *             self._add_or_remove_level(-1)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self._update_one(i1)
+ */
+    ((struct __pyx_vtabstruct_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base._add_or_remove_level(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self), -1);
+
+    /* "skimage/graph/heap.pyx":575
+ *         self.count -= 1
+ *         count -= 1
+ *         if (levels > self.min_levels) & (count < (1 << (levels-2))):             # <<<<<<<<<<<<<<
+ *             self._add_or_remove_level(-1)
+ *         else:
+ */
+    goto __pyx_L3;
+  }
+
+  /* "skimage/graph/heap.pyx":578
+ *             self._add_or_remove_level(-1)
+ *         else:
+ *             self._update_one(i1)             # <<<<<<<<<<<<<<
+ *             self._update_one(i2)
+ * 
+ */
+  /*else*/ {
+    ((struct __pyx_vtabstruct_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base._update_one(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self), __pyx_v_i1);
+
+    /* "skimage/graph/heap.pyx":579
+ *         else:
+ *             self._update_one(i1)
+ *             self._update_one(i2)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef INDEX_T push_fast(self, VALUE_T value, REFERENCE_T reference) nogil:
+ */
+    ((struct __pyx_vtabstruct_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base._update_one(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self), __pyx_v_i2);
+  }
+  __pyx_L3:;
+
+  /* "skimage/graph/heap.pyx":544
+ *             self._crossref[i] = -1
+ * 
+ *     cdef void _remove(self, INDEX_T i1) nogil:             # <<<<<<<<<<<<<<
+ *         """Remove a value from the heap. By index."""
+ *         cdef LEVELS_T levels = self.levels
+ */
+
+  /* function exit code */
+}
+
+/* "skimage/graph/heap.pyx":581
+ *             self._update_one(i2)
+ * 
+ *     cdef INDEX_T push_fast(self, VALUE_T value, REFERENCE_T reference) nogil:             # <<<<<<<<<<<<<<
+ *         """The c method for fast pushing.
+ * 
+ */
+
+static __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_f_7skimage_5graph_4heap_20FastUpdateBinaryHeap_push_fast(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_v_value, __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_v_reference) {
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_ir;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "skimage/graph/heap.pyx":591
+ * 
+ *         """
+ *         if not (0 <= reference <= self.max_reference):             # <<<<<<<<<<<<<<
+ *             return -1
+ * 
+ */
+  __pyx_t_1 = (0 <= __pyx_v_reference);
+  if (__pyx_t_1) {
+    __pyx_t_1 = (__pyx_v_reference <= __pyx_v_self->max_reference);
+  }
+  __pyx_t_2 = ((!(__pyx_t_1 != 0)) != 0);
+  if (__pyx_t_2) {
+
+    /* "skimage/graph/heap.pyx":592
+ *         """
+ *         if not (0 <= reference <= self.max_reference):
+ *             return -1             # <<<<<<<<<<<<<<
+ * 
+ *         # init variable to store the index-in-the-heap
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "skimage/graph/heap.pyx":591
+ * 
+ *         """
+ *         if not (0 <= reference <= self.max_reference):             # <<<<<<<<<<<<<<
+ *             return -1
+ * 
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":599
+ *         # Reference is the index in the array where MCP is applied to.
+ *         # Find the index-in-the-heap using the crossref array.
+ *         cdef INDEX_T ir = self._crossref[reference]             # <<<<<<<<<<<<<<
+ * 
+ *         if ir != -1:
+ */
+  __pyx_v_ir = (__pyx_v_self->_crossref[__pyx_v_reference]);
+
+  /* "skimage/graph/heap.pyx":601
+ *         cdef INDEX_T ir = self._crossref[reference]
+ * 
+ *         if ir != -1:             # <<<<<<<<<<<<<<
+ *             # update
+ *             i = (1 << self.levels) - 1 + ir
+ */
+  __pyx_t_2 = ((__pyx_v_ir != -1L) != 0);
+  if (__pyx_t_2) {
+
+    /* "skimage/graph/heap.pyx":603
+ *         if ir != -1:
+ *             # update
+ *             i = (1 << self.levels) - 1 + ir             # <<<<<<<<<<<<<<
+ *             self._values[i] = value
+ *             self._update_one(i)
+ */
+    __pyx_v_i = (((1 << __pyx_v_self->__pyx_base.levels) - 1) + __pyx_v_ir);
+
+    /* "skimage/graph/heap.pyx":604
+ *             # update
+ *             i = (1 << self.levels) - 1 + ir
+ *             self._values[i] = value             # <<<<<<<<<<<<<<
+ *             self._update_one(i)
+ *             return ir
+ */
+    (__pyx_v_self->__pyx_base._values[__pyx_v_i]) = __pyx_v_value;
+
+    /* "skimage/graph/heap.pyx":605
+ *             i = (1 << self.levels) - 1 + ir
+ *             self._values[i] = value
+ *             self._update_one(i)             # <<<<<<<<<<<<<<
+ *             return ir
+ * 
+ */
+    ((struct __pyx_vtabstruct_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base._update_one(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self), __pyx_v_i);
+
+    /* "skimage/graph/heap.pyx":606
+ *             self._values[i] = value
+ *             self._update_one(i)
+ *             return ir             # <<<<<<<<<<<<<<
+ * 
+ *         # if not updated: append normally and store reference
+ */
+    __pyx_r = __pyx_v_ir;
+    goto __pyx_L0;
+
+    /* "skimage/graph/heap.pyx":601
+ *         cdef INDEX_T ir = self._crossref[reference]
+ * 
+ *         if ir != -1:             # <<<<<<<<<<<<<<
+ *             # update
+ *             i = (1 << self.levels) - 1 + ir
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":609
+ * 
+ *         # if not updated: append normally and store reference
+ *         ir = BinaryHeap.push_fast(self, value, reference)             # <<<<<<<<<<<<<<
+ *         self._crossref[reference] = ir
+ *         return ir
+ */
+  __pyx_v_ir = __pyx_f_7skimage_5graph_4heap_10BinaryHeap_push_fast(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self), __pyx_v_value, __pyx_v_reference);
+
+  /* "skimage/graph/heap.pyx":610
+ *         # if not updated: append normally and store reference
+ *         ir = BinaryHeap.push_fast(self, value, reference)
+ *         self._crossref[reference] = ir             # <<<<<<<<<<<<<<
+ *         return ir
+ * 
+ */
+  (__pyx_v_self->_crossref[__pyx_v_reference]) = __pyx_v_ir;
+
+  /* "skimage/graph/heap.pyx":611
+ *         ir = BinaryHeap.push_fast(self, value, reference)
+ *         self._crossref[reference] = ir
+ *         return ir             # <<<<<<<<<<<<<<
+ * 
+ *     cdef INDEX_T push_if_lower_fast(self, VALUE_T value,
+ */
+  __pyx_r = __pyx_v_ir;
+  goto __pyx_L0;
+
+  /* "skimage/graph/heap.pyx":581
+ *             self._update_one(i2)
+ * 
+ *     cdef INDEX_T push_fast(self, VALUE_T value, REFERENCE_T reference) nogil:             # <<<<<<<<<<<<<<
+ *         """The c method for fast pushing.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":613
+ *         return ir
+ * 
+ *     cdef INDEX_T push_if_lower_fast(self, VALUE_T value,             # <<<<<<<<<<<<<<
+ *                                     REFERENCE_T reference) nogil:
+ *         """If the reference is already present, will update its value ONLY if
+ */
+
+static __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_f_7skimage_5graph_4heap_20FastUpdateBinaryHeap_push_if_lower_fast(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_v_value, __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_v_reference) {
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_ir;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_v_values;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T *__pyx_t_3;
+
+  /* "skimage/graph/heap.pyx":624
+ * 
+ *         """
+ *         if not (0 <= reference <= self.max_reference):             # <<<<<<<<<<<<<<
+ *             return -1
+ * 
+ */
+  __pyx_t_1 = (0 <= __pyx_v_reference);
+  if (__pyx_t_1) {
+    __pyx_t_1 = (__pyx_v_reference <= __pyx_v_self->max_reference);
+  }
+  __pyx_t_2 = ((!(__pyx_t_1 != 0)) != 0);
+  if (__pyx_t_2) {
+
+    /* "skimage/graph/heap.pyx":625
+ *         """
+ *         if not (0 <= reference <= self.max_reference):
+ *             return -1             # <<<<<<<<<<<<<<
+ * 
+ *         # init variable to store the index-in-the-heap
+ */
+    __pyx_r = -1L;
+    goto __pyx_L0;
+
+    /* "skimage/graph/heap.pyx":624
+ * 
+ *         """
+ *         if not (0 <= reference <= self.max_reference):             # <<<<<<<<<<<<<<
+ *             return -1
+ * 
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":632
+ *         # Reference is the index in the array where MCP is applied to.
+ *         # Find the index-in-the-heap using the crossref array.
+ *         cdef INDEX_T ir = self._crossref[reference]             # <<<<<<<<<<<<<<
+ *         cdef VALUE_T *values = self._values
+ *         self._pushed = 1
+ */
+  __pyx_v_ir = (__pyx_v_self->_crossref[__pyx_v_reference]);
+
+  /* "skimage/graph/heap.pyx":633
+ *         # Find the index-in-the-heap using the crossref array.
+ *         cdef INDEX_T ir = self._crossref[reference]
+ *         cdef VALUE_T *values = self._values             # <<<<<<<<<<<<<<
+ *         self._pushed = 1
+ *         if ir != -1:
+ */
+  __pyx_t_3 = __pyx_v_self->__pyx_base._values;
+  __pyx_v_values = __pyx_t_3;
+
+  /* "skimage/graph/heap.pyx":634
+ *         cdef INDEX_T ir = self._crossref[reference]
+ *         cdef VALUE_T *values = self._values
+ *         self._pushed = 1             # <<<<<<<<<<<<<<
+ *         if ir != -1:
+ *             # update
+ */
+  __pyx_v_self->_pushed = 1;
+
+  /* "skimage/graph/heap.pyx":635
+ *         cdef VALUE_T *values = self._values
+ *         self._pushed = 1
+ *         if ir != -1:             # <<<<<<<<<<<<<<
+ *             # update
+ *             i = (1 << self.levels) - 1 + ir
+ */
+  __pyx_t_2 = ((__pyx_v_ir != -1L) != 0);
+  if (__pyx_t_2) {
+
+    /* "skimage/graph/heap.pyx":637
+ *         if ir != -1:
+ *             # update
+ *             i = (1 << self.levels) - 1 + ir             # <<<<<<<<<<<<<<
+ *             if values[i] > value:
+ *                 values[i] = value
+ */
+    __pyx_v_i = (((1 << __pyx_v_self->__pyx_base.levels) - 1) + __pyx_v_ir);
+
+    /* "skimage/graph/heap.pyx":638
+ *             # update
+ *             i = (1 << self.levels) - 1 + ir
+ *             if values[i] > value:             # <<<<<<<<<<<<<<
+ *                 values[i] = value
+ *                 self._update_one(i)
+ */
+    __pyx_t_2 = (((__pyx_v_values[__pyx_v_i]) > __pyx_v_value) != 0);
+    if (__pyx_t_2) {
+
+      /* "skimage/graph/heap.pyx":639
+ *             i = (1 << self.levels) - 1 + ir
+ *             if values[i] > value:
+ *                 values[i] = value             # <<<<<<<<<<<<<<
+ *                 self._update_one(i)
+ *             else:
+ */
+      (__pyx_v_values[__pyx_v_i]) = __pyx_v_value;
+
+      /* "skimage/graph/heap.pyx":640
+ *             if values[i] > value:
+ *                 values[i] = value
+ *                 self._update_one(i)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 self._pushed = 0
+ */
+      ((struct __pyx_vtabstruct_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base._update_one(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self), __pyx_v_i);
+
+      /* "skimage/graph/heap.pyx":638
+ *             # update
+ *             i = (1 << self.levels) - 1 + ir
+ *             if values[i] > value:             # <<<<<<<<<<<<<<
+ *                 values[i] = value
+ *                 self._update_one(i)
+ */
+      goto __pyx_L5;
+    }
+
+    /* "skimage/graph/heap.pyx":642
+ *                 self._update_one(i)
+ *             else:
+ *                 self._pushed = 0             # <<<<<<<<<<<<<<
+ *             return ir
+ * 
+ */
+    /*else*/ {
+      __pyx_v_self->_pushed = 0;
+    }
+    __pyx_L5:;
+
+    /* "skimage/graph/heap.pyx":643
+ *             else:
+ *                 self._pushed = 0
+ *             return ir             # <<<<<<<<<<<<<<
+ * 
+ *         # if not updated: append normally and store reference
+ */
+    __pyx_r = __pyx_v_ir;
+    goto __pyx_L0;
+
+    /* "skimage/graph/heap.pyx":635
+ *         cdef VALUE_T *values = self._values
+ *         self._pushed = 1
+ *         if ir != -1:             # <<<<<<<<<<<<<<
+ *             # update
+ *             i = (1 << self.levels) - 1 + ir
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":646
+ * 
+ *         # if not updated: append normally and store reference
+ *         ir = BinaryHeap.push_fast(self, value, reference)             # <<<<<<<<<<<<<<
+ *         self._crossref[reference] = ir
+ *         return ir
+ */
+  __pyx_v_ir = __pyx_f_7skimage_5graph_4heap_10BinaryHeap_push_fast(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self), __pyx_v_value, __pyx_v_reference);
+
+  /* "skimage/graph/heap.pyx":647
+ *         # if not updated: append normally and store reference
+ *         ir = BinaryHeap.push_fast(self, value, reference)
+ *         self._crossref[reference] = ir             # <<<<<<<<<<<<<<
+ *         return ir
+ * 
+ */
+  (__pyx_v_self->_crossref[__pyx_v_reference]) = __pyx_v_ir;
+
+  /* "skimage/graph/heap.pyx":648
+ *         ir = BinaryHeap.push_fast(self, value, reference)
+ *         self._crossref[reference] = ir
+ *         return ir             # <<<<<<<<<<<<<<
+ * 
+ *     cdef VALUE_T value_of_fast(self, REFERENCE_T reference):
+ */
+  __pyx_r = __pyx_v_ir;
+  goto __pyx_L0;
+
+  /* "skimage/graph/heap.pyx":613
+ *         return ir
+ * 
+ *     cdef INDEX_T push_if_lower_fast(self, VALUE_T value,             # <<<<<<<<<<<<<<
+ *                                     REFERENCE_T reference) nogil:
+ *         """If the reference is already present, will update its value ONLY if
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":650
+ *         return ir
+ * 
+ *     cdef VALUE_T value_of_fast(self, REFERENCE_T reference):             # <<<<<<<<<<<<<<
+ *         """Return the value corresponding to the given reference.
+ * 
+ */
+
+static __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_f_7skimage_5graph_4heap_20FastUpdateBinaryHeap_value_of_fast(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_v_reference) {
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_i;
+  __pyx_t_7skimage_5graph_4heap_INDEX_T __pyx_v_ir;
+  __pyx_t_7skimage_5graph_4heap_VALUE_T __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __Pyx_RefNannySetupContext("value_of_fast", 0);
+
+  /* "skimage/graph/heap.pyx":657
+ * 
+ *         """
+ *         if not (0 <= reference <= self.max_reference):             # <<<<<<<<<<<<<<
+ *             self._invalid_ref = 1
+ *             return inf
+ */
+  __pyx_t_1 = (0 <= __pyx_v_reference);
+  if (__pyx_t_1) {
+    __pyx_t_1 = (__pyx_v_reference <= __pyx_v_self->max_reference);
+  }
+  __pyx_t_2 = ((!(__pyx_t_1 != 0)) != 0);
+  if (__pyx_t_2) {
+
+    /* "skimage/graph/heap.pyx":658
+ *         """
+ *         if not (0 <= reference <= self.max_reference):
+ *             self._invalid_ref = 1             # <<<<<<<<<<<<<<
+ *             return inf
+ * 
+ */
+    __pyx_v_self->_invalid_ref = 1;
+
+    /* "skimage/graph/heap.pyx":659
+ *         if not (0 <= reference <= self.max_reference):
+ *             self._invalid_ref = 1
+ *             return inf             # <<<<<<<<<<<<<<
+ * 
+ *         # init variable to store the index-in-the-heap
+ */
+    __pyx_r = __pyx_v_7skimage_5graph_4heap_inf;
+    goto __pyx_L0;
+
+    /* "skimage/graph/heap.pyx":657
+ * 
+ *         """
+ *         if not (0 <= reference <= self.max_reference):             # <<<<<<<<<<<<<<
+ *             self._invalid_ref = 1
+ *             return inf
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":666
+ *         # Reference is the index in the array where MCP is applied to.
+ *         # Find the index-in-the-heap using the crossref array.
+ *         cdef INDEX_T ir = self._crossref[reference]             # <<<<<<<<<<<<<<
+ *         self._invalid_ref = 0
+ *         if ir == -1:
+ */
+  __pyx_v_ir = (__pyx_v_self->_crossref[__pyx_v_reference]);
+
+  /* "skimage/graph/heap.pyx":667
+ *         # Find the index-in-the-heap using the crossref array.
+ *         cdef INDEX_T ir = self._crossref[reference]
+ *         self._invalid_ref = 0             # <<<<<<<<<<<<<<
+ *         if ir == -1:
+ *             self._invalid_ref = 1
+ */
+  __pyx_v_self->_invalid_ref = 0;
+
+  /* "skimage/graph/heap.pyx":668
+ *         cdef INDEX_T ir = self._crossref[reference]
+ *         self._invalid_ref = 0
+ *         if ir == -1:             # <<<<<<<<<<<<<<
+ *             self._invalid_ref = 1
+ *             return inf
+ */
+  __pyx_t_2 = ((__pyx_v_ir == -1L) != 0);
+  if (__pyx_t_2) {
+
+    /* "skimage/graph/heap.pyx":669
+ *         self._invalid_ref = 0
+ *         if ir == -1:
+ *             self._invalid_ref = 1             # <<<<<<<<<<<<<<
+ *             return inf
+ *         i = (1 << self.levels) - 1 + ir
+ */
+    __pyx_v_self->_invalid_ref = 1;
+
+    /* "skimage/graph/heap.pyx":670
+ *         if ir == -1:
+ *             self._invalid_ref = 1
+ *             return inf             # <<<<<<<<<<<<<<
+ *         i = (1 << self.levels) - 1 + ir
+ *         return self._values[i]
+ */
+    __pyx_r = __pyx_v_7skimage_5graph_4heap_inf;
+    goto __pyx_L0;
+
+    /* "skimage/graph/heap.pyx":668
+ *         cdef INDEX_T ir = self._crossref[reference]
+ *         self._invalid_ref = 0
+ *         if ir == -1:             # <<<<<<<<<<<<<<
+ *             self._invalid_ref = 1
+ *             return inf
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":671
+ *             self._invalid_ref = 1
+ *             return inf
+ *         i = (1 << self.levels) - 1 + ir             # <<<<<<<<<<<<<<
+ *         return self._values[i]
+ * 
+ */
+  __pyx_v_i = (((1 << __pyx_v_self->__pyx_base.levels) - 1) + __pyx_v_ir);
+
+  /* "skimage/graph/heap.pyx":672
+ *             return inf
+ *         i = (1 << self.levels) - 1 + ir
+ *         return self._values[i]             # <<<<<<<<<<<<<<
+ * 
+ *     def push(self, double value, int reference):
+ */
+  __pyx_r = (__pyx_v_self->__pyx_base._values[__pyx_v_i]);
+  goto __pyx_L0;
+
+  /* "skimage/graph/heap.pyx":650
+ *         return ir
+ * 
+ *     cdef VALUE_T value_of_fast(self, REFERENCE_T reference):             # <<<<<<<<<<<<<<
+ *         """Return the value corresponding to the given reference.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":674
+ *         return self._values[i]
+ * 
+ *     def push(self, double value, int reference):             # <<<<<<<<<<<<<<
+ *         """push(value, reference)
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_9push(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7skimage_5graph_4heap_20FastUpdateBinaryHeap_8push[] = "push(value, reference)\n\n        Append/update a value in the heap.\n\n        Parameters\n        ----------\n        value : float\n        reference : int\n            If the reference is already present in the array, the value for\n            that reference will be updated, otherwise the (value, reference)\n            pair will be added to the heap.\n\n        Raises\n        ------\n        ValueError\n            On pushing a reference outside the range [0, max_reference].\n\n        ";
+static PyObject *__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_9push(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  double __pyx_v_value;
+  int __pyx_v_reference;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("push (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_value,&__pyx_n_s_reference,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_value)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_reference)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("push", 1, 2, 2, 1); __PYX_ERR(0, 674, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "push") < 0)) __PYX_ERR(0, 674, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_value = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_value == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 674, __pyx_L3_error)
+    __pyx_v_reference = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_reference == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 674, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("push", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 674, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("skimage.graph.heap.FastUpdateBinaryHeap.push", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_8push(((struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self), __pyx_v_value, __pyx_v_reference);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_8push(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, double __pyx_v_value, int __pyx_v_reference) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("push", 0);
+
+  /* "skimage/graph/heap.pyx":693
+ * 
+ *         """
+ *         if self.push_fast(value, reference) == -1:             # <<<<<<<<<<<<<<
+ *             raise ValueError('reference outside of range [0, max_reference]')
+ * 
+ */
+  __pyx_t_1 = ((((struct __pyx_vtabstruct_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self->__pyx_base.__pyx_vtab)->__pyx_base.push_fast(((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)__pyx_v_self), __pyx_v_value, __pyx_v_reference) == -1L) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "skimage/graph/heap.pyx":694
+ *         """
+ *         if self.push_fast(value, reference) == -1:
+ *             raise ValueError('reference outside of range [0, max_reference]')             # <<<<<<<<<<<<<<
+ * 
+ *     def push_if_lower(self, double value, int reference):
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 694, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 694, __pyx_L1_error)
+
+    /* "skimage/graph/heap.pyx":693
+ * 
+ *         """
+ *         if self.push_fast(value, reference) == -1:             # <<<<<<<<<<<<<<
+ *             raise ValueError('reference outside of range [0, max_reference]')
+ * 
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":674
+ *         return self._values[i]
+ * 
+ *     def push(self, double value, int reference):             # <<<<<<<<<<<<<<
+ *         """push(value, reference)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("skimage.graph.heap.FastUpdateBinaryHeap.push", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":696
+ *             raise ValueError('reference outside of range [0, max_reference]')
+ * 
+ *     def push_if_lower(self, double value, int reference):             # <<<<<<<<<<<<<<
+ *         """push_if_lower(value, reference)
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_11push_if_lower(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7skimage_5graph_4heap_20FastUpdateBinaryHeap_10push_if_lower[] = "push_if_lower(value, reference)\n\n        Append/update a value in the heap if the extant value is lower.\n\n        If the reference is already in the heap, update only of the new value\n        is lower than the current one. If the reference is not present, the\n        value will always be pushed to the heap.\n\n        Parameters\n        ----------\n        value : float\n        reference : int\n            If the reference is already present in the array, the value for\n            that reference will be updated, otherwise the (value, reference)\n            pair will be added to the heap.\n\n        Returns\n        -------\n        pushed : bool\n            True if an append/update occurred, False if otherwise.\n\n        Raises\n        ------\n        ValueError\n            On pushing a reference outside the range [0, max_reference].\n\n        ";
+static PyObject *__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_11push_if_lower(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  double __pyx_v_value;
+  int __pyx_v_reference;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("push_if_lower (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_value,&__pyx_n_s_reference,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_value)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_reference)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("push_if_lower", 1, 2, 2, 1); __PYX_ERR(0, 696, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "push_if_lower") < 0)) __PYX_ERR(0, 696, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_value = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_value == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 696, __pyx_L3_error)
+    __pyx_v_reference = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_reference == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 696, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("push_if_lower", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 696, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("skimage.graph.heap.FastUpdateBinaryHeap.push_if_lower", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_10push_if_lower(((struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self), __pyx_v_value, __pyx_v_reference);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_10push_if_lower(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, double __pyx_v_value, int __pyx_v_reference) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("push_if_lower", 0);
+
+  /* "skimage/graph/heap.pyx":724
+ * 
+ *         """
+ *         if self.push_if_lower_fast(value, reference) == -1:             # <<<<<<<<<<<<<<
+ *             raise ValueError('reference outside of range [0, max_reference]')
+ *         return self._pushed == 1
+ */
+  __pyx_t_1 = ((((struct __pyx_vtabstruct_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self->__pyx_base.__pyx_vtab)->push_if_lower_fast(__pyx_v_self, __pyx_v_value, __pyx_v_reference) == -1L) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "skimage/graph/heap.pyx":725
+ *         """
+ *         if self.push_if_lower_fast(value, reference) == -1:
+ *             raise ValueError('reference outside of range [0, max_reference]')             # <<<<<<<<<<<<<<
+ *         return self._pushed == 1
+ * 
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 725, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 725, __pyx_L1_error)
+
+    /* "skimage/graph/heap.pyx":724
+ * 
+ *         """
+ *         if self.push_if_lower_fast(value, reference) == -1:             # <<<<<<<<<<<<<<
+ *             raise ValueError('reference outside of range [0, max_reference]')
+ *         return self._pushed == 1
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":726
+ *         if self.push_if_lower_fast(value, reference) == -1:
+ *             raise ValueError('reference outside of range [0, max_reference]')
+ *         return self._pushed == 1             # <<<<<<<<<<<<<<
+ * 
+ *     def value_of(self, int reference):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __Pyx_PyBool_FromLong((__pyx_v_self->_pushed == 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 726, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "skimage/graph/heap.pyx":696
+ *             raise ValueError('reference outside of range [0, max_reference]')
+ * 
+ *     def push_if_lower(self, double value, int reference):             # <<<<<<<<<<<<<<
+ *         """push_if_lower(value, reference)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("skimage.graph.heap.FastUpdateBinaryHeap.push_if_lower", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":728
+ *         return self._pushed == 1
+ * 
+ *     def value_of(self, int reference):             # <<<<<<<<<<<<<<
+ *         """value_of(reference)
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_13value_of(PyObject *__pyx_v_self, PyObject *__pyx_arg_reference); /*proto*/
+static char __pyx_doc_7skimage_5graph_4heap_20FastUpdateBinaryHeap_12value_of[] = "value_of(reference)\n\n        Get the value corresponding to a given reference.\n\n        Parameters\n        ----------\n        reference : int\n            A reference already pushed to the heap.\n\n        Returns\n        -------\n        value : float\n\n        Raises\n        ------\n        ValueError\n            On querying a reference outside the range [0, max_reference], or\n            not already pushed to the heap.\n\n        ";
+static PyObject *__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_13value_of(PyObject *__pyx_v_self, PyObject *__pyx_arg_reference) {
+  int __pyx_v_reference;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("value_of (wrapper)", 0);
+  assert(__pyx_arg_reference); {
+    __pyx_v_reference = __Pyx_PyInt_As_int(__pyx_arg_reference); if (unlikely((__pyx_v_reference == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 728, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("skimage.graph.heap.FastUpdateBinaryHeap.value_of", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_12value_of(((struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self), ((int)__pyx_v_reference));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_12value_of(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, int __pyx_v_reference) {
+  PyObject *__pyx_v_value = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("value_of", 0);
+
+  /* "skimage/graph/heap.pyx":749
+ * 
+ *         """
+ *         value = self.value_of_fast(reference)             # <<<<<<<<<<<<<<
+ *         if self._invalid_ref:
+ *             raise ValueError('invalid reference')
+ */
+  __pyx_t_1 = PyFloat_FromDouble(((struct __pyx_vtabstruct_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self->__pyx_base.__pyx_vtab)->value_of_fast(__pyx_v_self, __pyx_v_reference)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 749, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_value = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "skimage/graph/heap.pyx":750
+ *         """
+ *         value = self.value_of_fast(reference)
+ *         if self._invalid_ref:             # <<<<<<<<<<<<<<
+ *             raise ValueError('invalid reference')
+ *         return value
+ */
+  __pyx_t_2 = (__pyx_v_self->_invalid_ref != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "skimage/graph/heap.pyx":751
+ *         value = self.value_of_fast(reference)
+ *         if self._invalid_ref:
+ *             raise ValueError('invalid reference')             # <<<<<<<<<<<<<<
+ *         return value
+ * 
+ */
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 751, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 751, __pyx_L1_error)
+
+    /* "skimage/graph/heap.pyx":750
+ *         """
+ *         value = self.value_of_fast(reference)
+ *         if self._invalid_ref:             # <<<<<<<<<<<<<<
+ *             raise ValueError('invalid reference')
+ *         return value
+ */
+  }
+
+  /* "skimage/graph/heap.pyx":752
+ *         if self._invalid_ref:
+ *             raise ValueError('invalid reference')
+ *         return value             # <<<<<<<<<<<<<<
+ * 
+ *     def cross_references(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_value);
+  __pyx_r = __pyx_v_value;
+  goto __pyx_L0;
+
+  /* "skimage/graph/heap.pyx":728
+ *         return self._pushed == 1
+ * 
+ *     def value_of(self, int reference):             # <<<<<<<<<<<<<<
+ *         """value_of(reference)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("skimage.graph.heap.FastUpdateBinaryHeap.value_of", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_value);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pyx":754
+ *         return value
+ * 
+ *     def cross_references(self):             # <<<<<<<<<<<<<<
+ *         """Get the cross references in the heap as a list."""
+ *         return [self._crossref[i] for i in range(self.max_reference + 1)]
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_15cross_references(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7skimage_5graph_4heap_20FastUpdateBinaryHeap_14cross_references[] = "Get the cross references in the heap as a list.";
+static PyObject *__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_15cross_references(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("cross_references (wrapper)", 0);
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_14cross_references(((struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_14cross_references(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self) {
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_8genexpr2__pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_t_2;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_t_3;
+  __pyx_t_7skimage_5graph_4heap_REFERENCE_T __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("cross_references", 0);
+
+  /* "skimage/graph/heap.pyx":756
+ *     def cross_references(self):
+ *         """Get the cross references in the heap as a list."""
+ *         return [self._crossref[i] for i in range(self.max_reference + 1)]             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  { /* enter inner scope */
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 756, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = (__pyx_v_self->max_reference + 1);
+    __pyx_t_3 = __pyx_t_2;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_8genexpr2__pyx_v_i = __pyx_t_4;
+      __pyx_t_5 = PyInt_FromSsize_t((__pyx_v_self->_crossref[__pyx_8genexpr2__pyx_v_i])); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 756, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_5))) __PYX_ERR(0, 756, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    }
+  } /* exit inner scope */
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "skimage/graph/heap.pyx":754
+ *         return value
+ * 
+ *     def cross_references(self):             # <<<<<<<<<<<<<<
+ *         """Get the cross references in the heap as a list."""
+ *         return [self._crossref[i] for i in range(self.max_reference + 1)]
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("skimage.graph.heap.FastUpdateBinaryHeap.cross_references", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "skimage/graph/heap.pxd":31
+ * 
+ * cdef class FastUpdateBinaryHeap(BinaryHeap):
+ *     cdef readonly REFERENCE_T max_reference             # <<<<<<<<<<<<<<
+ *     cdef INDEX_T *_crossref
+ *     cdef BOOL_T _invalid_ref
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_13max_reference_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_13max_reference_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_13max_reference___get__(((struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_13max_reference___get__(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_v_self->max_reference); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 31, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("skimage.graph.heap.FastUpdateBinaryHeap.max_reference.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_17__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_17__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_16__reduce_cython__(((struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_16__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("skimage.graph.heap.FastUpdateBinaryHeap.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_19__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_19__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_18__setstate_cython__(((struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7skimage_5graph_4heap_20FastUpdateBinaryHeap_18__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("skimage.graph.heap.FastUpdateBinaryHeap.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static struct __pyx_vtabstruct_7skimage_5graph_4heap_BinaryHeap __pyx_vtable_7skimage_5graph_4heap_BinaryHeap;
+
+static PyObject *__pyx_tp_new_7skimage_5graph_4heap_BinaryHeap(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *)o);
+  p->__pyx_vtab = __pyx_vtabptr_7skimage_5graph_4heap_BinaryHeap;
+  if (unlikely(__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_1__cinit__(o, a, k) < 0)) goto bad;
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static void __pyx_tp_dealloc_7skimage_5graph_4heap_BinaryHeap(PyObject *o) {
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !__Pyx_PyObject_GC_IsFinalized(o))) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
+    __pyx_pw_7skimage_5graph_4heap_10BinaryHeap_7__dealloc__(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
+    PyErr_Restore(etype, eval, etb);
+  }
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static PyObject *__pyx_getprop_7skimage_5graph_4heap_10BinaryHeap_count(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7skimage_5graph_4heap_10BinaryHeap_5count_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_7skimage_5graph_4heap_10BinaryHeap_levels(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7skimage_5graph_4heap_10BinaryHeap_6levels_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_7skimage_5graph_4heap_10BinaryHeap_min_levels(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7skimage_5graph_4heap_10BinaryHeap_10min_levels_1__get__(o);
+}
+
+static PyMethodDef __pyx_methods_7skimage_5graph_4heap_BinaryHeap[] = {
+  {"reset", (PyCFunction)__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_5reset, METH_NOARGS, __pyx_doc_7skimage_5graph_4heap_10BinaryHeap_4reset},
+  {"push", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_11push, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7skimage_5graph_4heap_10BinaryHeap_10push},
+  {"min_val", (PyCFunction)__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_13min_val, METH_NOARGS, __pyx_doc_7skimage_5graph_4heap_10BinaryHeap_12min_val},
+  {"values", (PyCFunction)__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_15values, METH_NOARGS, __pyx_doc_7skimage_5graph_4heap_10BinaryHeap_14values},
+  {"references", (PyCFunction)__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_17references, METH_NOARGS, __pyx_doc_7skimage_5graph_4heap_10BinaryHeap_16references},
+  {"pop", (PyCFunction)__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_19pop, METH_NOARGS, __pyx_doc_7skimage_5graph_4heap_10BinaryHeap_18pop},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_21__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_7skimage_5graph_4heap_10BinaryHeap_23__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_7skimage_5graph_4heap_BinaryHeap[] = {
+  {(char *)"count", __pyx_getprop_7skimage_5graph_4heap_10BinaryHeap_count, 0, (char *)0, 0},
+  {(char *)"levels", __pyx_getprop_7skimage_5graph_4heap_10BinaryHeap_levels, 0, (char *)0, 0},
+  {(char *)"min_levels", __pyx_getprop_7skimage_5graph_4heap_10BinaryHeap_min_levels, 0, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_7skimage_5graph_4heap_BinaryHeap = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "skimage.graph.heap.BinaryHeap", /*tp_name*/
+  sizeof(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_7skimage_5graph_4heap_BinaryHeap, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  __pyx_pw_7skimage_5graph_4heap_10BinaryHeap_9__str__, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "BinaryHeap(initial_capacity=128)\n\n    A binary heap class that can store values and an integer reference.\n\n    A binary heap is an object to store values in, optimized in such a way\n    that the minimum (or maximum, but a minimum in this implementation)\n    value can be found in O(log2(N)) time. In this implementation, a reference\n    value (a single integer) can also be stored with each value.\n\n    Use the methods push() and pop() to put in or extract values.\n    In C, use the corresponding push_fast() and pop_fast().\n\n    Parameters\n    ----------\n    initial_capacity : int\n        Estimate of the size of the heap, if known in advance. (In any case,\n        the heap will dynamically grow and shrink as required, though never\n        below the `initial_capacity`.)\n\n    Attributes\n    ----------\n    count : int\n        The number of values in the heap\n    levels : int\n        The number of levels in the binary heap (see Notes below). The values\n        are stored in the last level, so 2**levels is the capacity of the\n        heap before another resize is required.\n    min_levels : int\n        The minimum number of levels in the heap (relates to the\n        `initial_capacity` parameter.)\n\n    Notes\n    -----\n    This implementation stores the binary heap in an array twice as long as\n    the number of elements in the heap. The array is structured in levels,\n    starting at level 0 with a single value, doubling the amount of values in\n    each level. The final level contains the actual values, the level before\n    it contains the pairwise minimum values. The level before that contains\n    the pairwise minimum values of that level, etc. Take a look at this\n    illustration:\n\n    level: 0 11 2222 33333333 4444444444444444\n    index: 0 12 3456 78901234 5678901234567890\n                        1          2         3\n\n     The actual values are stored in level 4. The minimum value of position 15\n    and 16 is stored in position 7"". min(17,18)->8, min(7,8)->3, min(3,4)->1.\n    When adding a value, only the path to the top has to be updated, which\n    takesO(log2(N)) time.\n\n     The advantage of this implementation relative to more common\n    implementations that swap values when pushing to the array is that data\n    only needs to be swapped once when an element is removed. This means that\n    keeping an array of references along with the values is very inexpensive.\n    Th disadvantage is that if you pop the minimum value, the tree has to be\n    traced from top to bottom and back. So if you only want values and no\n    references, this implementation will probably be slower. If you need\n    references (and maybe cross references to be kept up to date) this\n    implementation will be faster.\n\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_7skimage_5graph_4heap_BinaryHeap, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_7skimage_5graph_4heap_BinaryHeap, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_7skimage_5graph_4heap_10BinaryHeap_3__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_7skimage_5graph_4heap_BinaryHeap, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+static struct __pyx_vtabstruct_7skimage_5graph_4heap_FastUpdateBinaryHeap __pyx_vtable_7skimage_5graph_4heap_FastUpdateBinaryHeap;
+
+static PyObject *__pyx_tp_new_7skimage_5graph_4heap_FastUpdateBinaryHeap(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *p;
+  PyObject *o = __pyx_tp_new_7skimage_5graph_4heap_BinaryHeap(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_7skimage_5graph_4heap_BinaryHeap*)__pyx_vtabptr_7skimage_5graph_4heap_FastUpdateBinaryHeap;
+  if (unlikely(__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_1__cinit__(o, a, k) < 0)) goto bad;
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static void __pyx_tp_dealloc_7skimage_5graph_4heap_FastUpdateBinaryHeap(PyObject *o) {
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !__Pyx_PyObject_GC_IsFinalized(o))) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
+    __pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_5__dealloc__(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
+    PyErr_Restore(etype, eval, etb);
+  }
+  __pyx_tp_dealloc_7skimage_5graph_4heap_BinaryHeap(o);
+}
+
+static PyObject *__pyx_getprop_7skimage_5graph_4heap_20FastUpdateBinaryHeap_max_reference(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_13max_reference_1__get__(o);
+}
+
+static PyMethodDef __pyx_methods_7skimage_5graph_4heap_FastUpdateBinaryHeap[] = {
+  {"reset", (PyCFunction)__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_7reset, METH_NOARGS, __pyx_doc_7skimage_5graph_4heap_20FastUpdateBinaryHeap_6reset},
+  {"push", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_9push, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7skimage_5graph_4heap_20FastUpdateBinaryHeap_8push},
+  {"push_if_lower", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_11push_if_lower, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7skimage_5graph_4heap_20FastUpdateBinaryHeap_10push_if_lower},
+  {"value_of", (PyCFunction)__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_13value_of, METH_O, __pyx_doc_7skimage_5graph_4heap_20FastUpdateBinaryHeap_12value_of},
+  {"cross_references", (PyCFunction)__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_15cross_references, METH_NOARGS, __pyx_doc_7skimage_5graph_4heap_20FastUpdateBinaryHeap_14cross_references},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_17__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_19__setstate_cython__, METH_O, 0},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_7skimage_5graph_4heap_FastUpdateBinaryHeap[] = {
+  {(char *)"max_reference", __pyx_getprop_7skimage_5graph_4heap_20FastUpdateBinaryHeap_max_reference, 0, (char *)0, 0},
+  {0, 0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_7skimage_5graph_4heap_FastUpdateBinaryHeap = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "skimage.graph.heap.FastUpdateBinaryHeap", /*tp_name*/
+  sizeof(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_7skimage_5graph_4heap_FastUpdateBinaryHeap, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  #if CYTHON_COMPILING_IN_PYPY
+  __pyx_pw_7skimage_5graph_4heap_10BinaryHeap_9__str__, /*tp_str*/
+  #else
+  0, /*tp_str*/
+  #endif
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "FastUpdateBinaryHeap(initial_capacity=128, max_reference=None)\n\n    Binary heap that allows the value of a reference to be updated quickly.\n\n    This heap class keeps cross-references so that the value associated with a\n    given reference can be quickly queried (O(1) time) or updated (O(log2(N))\n    time). This is ideal for pathfinding algorithms that implement some\n    variant of Dijkstra's algorithm.\n\n    Parameters\n    ----------\n    initial_capacity : int\n        Estimate of the size of the heap, if known in advance. (In any case,\n        the heap will dynamically grow and shrink as required, though never\n        below the `initial_capacity`.)\n\n    max_reference : int, optional\n        Largest reference value that might be pushed to the heap. (Pushing a\n        larger value will result in an error.) If no value is provided,\n        `1-initial_capacity` will be used. For the cross-reference index to\n        work, all references must be in the range [0, max_reference];\n        references pushed outside of that range will not be added to the heap.\n        The cross-references are kept as a 1-d array of length\n        `max_reference+1', so memory use of this heap is effectively\n        O(max_reference)\n\n    Attributes\n    ----------\n    count : int\n        The number of values in the heap\n    levels : int\n        The number of levels in the binary heap (see Notes below). The values\n        are stored in the last level, so 2**levels is the capacity of the\n        heap before another resize is required.\n    min_levels : int\n        The minimum number of levels in the heap (relates to the\n        `initial_capacity` parameter.)\n    max_reference : int\n        The provided or calculated maximum allowed reference value.\n\n    Notes\n    -----\n    The cross-references map data[reference]->internalindex, such that the\n    value corresponding to a given reference can be found efficiently. This\n    can be queried with the value_of() ""method.\n\n    A special method, push_if_lower() is provided that will update the heap if\n    the given reference is not in the heap, or if it is and the provided value\n    is lower than the current value in the heap. This is again useful for\n    pathfinding algorithms.\n\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_7skimage_5graph_4heap_FastUpdateBinaryHeap, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_7skimage_5graph_4heap_FastUpdateBinaryHeap, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_7skimage_5graph_4heap_20FastUpdateBinaryHeap_3__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_7skimage_5graph_4heap_FastUpdateBinaryHeap, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_heap(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_heap},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "heap",
+    __pyx_k_Cython_implementation_of_a_binar, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_kp_u_, __pyx_k_, sizeof(__pyx_k_), 0, 1, 0, 0},
+  {&__pyx_n_s_BinaryHeap, __pyx_k_BinaryHeap, sizeof(__pyx_k_BinaryHeap), 0, 0, 1, 1},
+  {&__pyx_n_s_FastUpdateBinaryHeap, __pyx_k_FastUpdateBinaryHeap, sizeof(__pyx_k_FastUpdateBinaryHeap), 0, 0, 1, 1},
+  {&__pyx_n_s_IndexError, __pyx_k_IndexError, sizeof(__pyx_k_IndexError), 0, 0, 1, 1},
+  {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
+  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+  {&__pyx_kp_u__2, __pyx_k__2, sizeof(__pyx_k__2), 0, 1, 0, 0},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_kp_u_g, __pyx_k_g, sizeof(__pyx_k_g), 0, 1, 0, 0},
+  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+  {&__pyx_n_s_init, __pyx_k_init, sizeof(__pyx_k_init), 0, 0, 1, 1},
+  {&__pyx_n_s_initial_capacity, __pyx_k_initial_capacity, sizeof(__pyx_k_initial_capacity), 0, 0, 1, 1},
+  {&__pyx_kp_u_invalid_reference, __pyx_k_invalid_reference, sizeof(__pyx_k_invalid_reference), 0, 1, 0, 0},
+  {&__pyx_kp_u_level_i, __pyx_k_level_i, sizeof(__pyx_k_level_i), 0, 1, 0, 0},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_max_reference, __pyx_k_max_reference, sizeof(__pyx_k_max_reference), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
+  {&__pyx_kp_u_pop_from_an_empty_heap, __pyx_k_pop_from_an_empty_heap, sizeof(__pyx_k_pop_from_an_empty_heap), 0, 1, 0, 0},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_s_reference, __pyx_k_reference, sizeof(__pyx_k_reference), 0, 0, 1, 1},
+  {&__pyx_kp_u_reference_outside_of_range_0_max, __pyx_k_reference_outside_of_range_0_max, sizeof(__pyx_k_reference_outside_of_range_0_max), 0, 1, 0, 0},
+  {&__pyx_n_s_reset, __pyx_k_reset, sizeof(__pyx_k_reset), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_n_s_value, __pyx_k_value, sizeof(__pyx_k_value), 0, 0, 1, 1},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 157, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 169, __pyx_L1_error)
+  __pyx_builtin_IndexError = __Pyx_GetBuiltinName(__pyx_n_s_IndexError); if (!__pyx_builtin_IndexError) __PYX_ERR(0, 451, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 694, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "skimage/graph/heap.pyx":451
+ *         """
+ *         if self.count == 0:
+ *             raise IndexError('pop from an empty heap')             # <<<<<<<<<<<<<<
+ *         value = self.pop_fast()
+ *         ref = self._popped_ref
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_u_pop_from_an_empty_heap); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 451, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+
+  /* "skimage/graph/heap.pyx":694
+ *         """
+ *         if self.push_fast(value, reference) == -1:
+ *             raise ValueError('reference outside of range [0, max_reference]')             # <<<<<<<<<<<<<<
+ * 
+ *     def push_if_lower(self, double value, int reference):
+ */
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_reference_outside_of_range_0_max); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 694, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+
+  /* "skimage/graph/heap.pyx":751
+ *         value = self.value_of_fast(reference)
+ *         if self._invalid_ref:
+ *             raise ValueError('invalid reference')             # <<<<<<<<<<<<<<
+ *         return value
+ * 
+ */
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_invalid_reference); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 751, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __pyx_vtabptr_7skimage_5graph_4heap_BinaryHeap = &__pyx_vtable_7skimage_5graph_4heap_BinaryHeap;
+  __pyx_vtable_7skimage_5graph_4heap_BinaryHeap._add_or_remove_level = (void (*)(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *, __pyx_t_7skimage_5graph_4heap_LEVELS_T))__pyx_f_7skimage_5graph_4heap_10BinaryHeap__add_or_remove_level;
+  __pyx_vtable_7skimage_5graph_4heap_BinaryHeap._update = (void (*)(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *))__pyx_f_7skimage_5graph_4heap_10BinaryHeap__update;
+  __pyx_vtable_7skimage_5graph_4heap_BinaryHeap._update_one = (void (*)(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *, __pyx_t_7skimage_5graph_4heap_INDEX_T))__pyx_f_7skimage_5graph_4heap_10BinaryHeap__update_one;
+  __pyx_vtable_7skimage_5graph_4heap_BinaryHeap._remove = (void (*)(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *, __pyx_t_7skimage_5graph_4heap_INDEX_T))__pyx_f_7skimage_5graph_4heap_10BinaryHeap__remove;
+  __pyx_vtable_7skimage_5graph_4heap_BinaryHeap.push_fast = (__pyx_t_7skimage_5graph_4heap_INDEX_T (*)(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *, __pyx_t_7skimage_5graph_4heap_VALUE_T, __pyx_t_7skimage_5graph_4heap_REFERENCE_T))__pyx_f_7skimage_5graph_4heap_10BinaryHeap_push_fast;
+  __pyx_vtable_7skimage_5graph_4heap_BinaryHeap.pop_fast = (__pyx_t_7skimage_5graph_4heap_VALUE_T (*)(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *))__pyx_f_7skimage_5graph_4heap_10BinaryHeap_pop_fast;
+  if (PyType_Ready(&__pyx_type_7skimage_5graph_4heap_BinaryHeap) < 0) __PYX_ERR(0, 48, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_7skimage_5graph_4heap_BinaryHeap.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7skimage_5graph_4heap_BinaryHeap.tp_dictoffset && __pyx_type_7skimage_5graph_4heap_BinaryHeap.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_7skimage_5graph_4heap_BinaryHeap.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_7skimage_5graph_4heap_BinaryHeap, "__init__"); if (unlikely(!wrapper)) __PYX_ERR(0, 48, __pyx_L1_error)
+    if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
+      __pyx_wrapperbase_7skimage_5graph_4heap_10BinaryHeap_2__init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_7skimage_5graph_4heap_10BinaryHeap_2__init__.doc = __pyx_doc_7skimage_5graph_4heap_10BinaryHeap_2__init__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_7skimage_5graph_4heap_10BinaryHeap_2__init__;
+    }
+  }
+  #endif
+  if (__Pyx_SetVtable(__pyx_type_7skimage_5graph_4heap_BinaryHeap.tp_dict, __pyx_vtabptr_7skimage_5graph_4heap_BinaryHeap) < 0) __PYX_ERR(0, 48, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_BinaryHeap, (PyObject *)&__pyx_type_7skimage_5graph_4heap_BinaryHeap) < 0) __PYX_ERR(0, 48, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_7skimage_5graph_4heap_BinaryHeap) < 0) __PYX_ERR(0, 48, __pyx_L1_error)
+  __pyx_ptype_7skimage_5graph_4heap_BinaryHeap = &__pyx_type_7skimage_5graph_4heap_BinaryHeap;
+  __pyx_vtabptr_7skimage_5graph_4heap_FastUpdateBinaryHeap = &__pyx_vtable_7skimage_5graph_4heap_FastUpdateBinaryHeap;
+  __pyx_vtable_7skimage_5graph_4heap_FastUpdateBinaryHeap.__pyx_base = *__pyx_vtabptr_7skimage_5graph_4heap_BinaryHeap;
+  __pyx_vtable_7skimage_5graph_4heap_FastUpdateBinaryHeap.__pyx_base._remove = (void (*)(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *, __pyx_t_7skimage_5graph_4heap_INDEX_T))__pyx_f_7skimage_5graph_4heap_20FastUpdateBinaryHeap__remove;
+  __pyx_vtable_7skimage_5graph_4heap_FastUpdateBinaryHeap.__pyx_base.push_fast = (__pyx_t_7skimage_5graph_4heap_INDEX_T (*)(struct __pyx_obj_7skimage_5graph_4heap_BinaryHeap *, __pyx_t_7skimage_5graph_4heap_VALUE_T, __pyx_t_7skimage_5graph_4heap_REFERENCE_T))__pyx_f_7skimage_5graph_4heap_20FastUpdateBinaryHeap_push_fast;
+  __pyx_vtable_7skimage_5graph_4heap_FastUpdateBinaryHeap.value_of_fast = (__pyx_t_7skimage_5graph_4heap_VALUE_T (*)(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *, __pyx_t_7skimage_5graph_4heap_REFERENCE_T))__pyx_f_7skimage_5graph_4heap_20FastUpdateBinaryHeap_value_of_fast;
+  __pyx_vtable_7skimage_5graph_4heap_FastUpdateBinaryHeap.push_if_lower_fast = (__pyx_t_7skimage_5graph_4heap_INDEX_T (*)(struct __pyx_obj_7skimage_5graph_4heap_FastUpdateBinaryHeap *, __pyx_t_7skimage_5graph_4heap_VALUE_T, __pyx_t_7skimage_5graph_4heap_REFERENCE_T))__pyx_f_7skimage_5graph_4heap_20FastUpdateBinaryHeap_push_if_lower_fast;
+  __pyx_type_7skimage_5graph_4heap_FastUpdateBinaryHeap.tp_base = __pyx_ptype_7skimage_5graph_4heap_BinaryHeap;
+  if (PyType_Ready(&__pyx_type_7skimage_5graph_4heap_FastUpdateBinaryHeap) < 0) __PYX_ERR(0, 457, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_7skimage_5graph_4heap_FastUpdateBinaryHeap.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7skimage_5graph_4heap_FastUpdateBinaryHeap.tp_dictoffset && __pyx_type_7skimage_5graph_4heap_FastUpdateBinaryHeap.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_7skimage_5graph_4heap_FastUpdateBinaryHeap.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_7skimage_5graph_4heap_FastUpdateBinaryHeap, "__init__"); if (unlikely(!wrapper)) __PYX_ERR(0, 457, __pyx_L1_error)
+    if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
+      __pyx_wrapperbase_7skimage_5graph_4heap_20FastUpdateBinaryHeap_2__init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_7skimage_5graph_4heap_20FastUpdateBinaryHeap_2__init__.doc = __pyx_doc_7skimage_5graph_4heap_20FastUpdateBinaryHeap_2__init__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_7skimage_5graph_4heap_20FastUpdateBinaryHeap_2__init__;
+    }
+  }
+  #endif
+  if (__Pyx_SetVtable(__pyx_type_7skimage_5graph_4heap_FastUpdateBinaryHeap.tp_dict, __pyx_vtabptr_7skimage_5graph_4heap_FastUpdateBinaryHeap) < 0) __PYX_ERR(0, 457, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_FastUpdateBinaryHeap, (PyObject *)&__pyx_type_7skimage_5graph_4heap_FastUpdateBinaryHeap) < 0) __PYX_ERR(0, 457, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_7skimage_5graph_4heap_FastUpdateBinaryHeap) < 0) __PYX_ERR(0, 457, __pyx_L1_error)
+  __pyx_ptype_7skimage_5graph_4heap_FastUpdateBinaryHeap = &__pyx_type_7skimage_5graph_4heap_FastUpdateBinaryHeap;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC initheap(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC initheap(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit_heap(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_heap(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_heap(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'heap' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_heap(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("heap", __pyx_methods, __pyx_k_Cython_implementation_of_a_binar, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_skimage__graph__heap) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "skimage.graph.heap")) {
+      if (unlikely(PyDict_SetItemString(modules, "skimage.graph.heap", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_type_import_code();
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "skimage/graph/heap.pyx":41
+ *   double Py_HUGE_VAL
+ * 
+ * cdef VALUE_T inf = Py_HUGE_VAL             # <<<<<<<<<<<<<<
+ * 
+ * # this is handy
+ */
+  __pyx_v_7skimage_5graph_4heap_inf = Py_HUGE_VAL;
+
+  /* "skimage/graph/heap.pyx":1
+ * # -*- python -*-             # <<<<<<<<<<<<<<
+ * 
+ * """Cython implementation of a binary min heap.
+ */
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init skimage.graph.heap", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init skimage.graph.heap");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    while (PyDict_Next(kwds, &pos, &key, &value)) {
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+            continue;
+        }
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (**name == key) ? 0 :
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key);
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    return -1;
+}
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_SubtractObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, int inplace, int zerodivision_check) {
+    (void)inplace;
+    (void)zerodivision_check;
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long x;
+        long a = PyInt_AS_LONG(op1);
+            x = (long)((unsigned long)a - b);
+            if (likely((x^a) >= 0 || (x^~b) >= 0))
+                return PyInt_FromLong(x);
+            return PyLong_Type.tp_as_number->nb_subtract(op1, op2);
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        const digit* digits = ((PyLongObject*)op1)->ob_digit;
+        const Py_ssize_t size = Py_SIZE(op1);
+        if (likely(__Pyx_sst_abs(size) <= 1)) {
+            a = likely(size) ? digits[0] : 0;
+            if (size == -1) a = -a;
+        } else {
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+#ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+#endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_subtract(op1, op2);
+            }
+        }
+                x = a - b;
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla - llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+        double a = PyFloat_AS_DOUBLE(op1);
+            double result;
+            PyFPE_START_PROTECT("subtract", return NULL)
+            result = ((double)a) - (double)b;
+            PyFPE_END_PROTECT(result)
+            return PyFloat_FromDouble(result);
+    }
+    return (inplace ? PyNumber_InPlaceSubtract : PyNumber_Subtract)(op1, op2);
+}
+#endif
+
+/* PyNumberPow2 */
+static PyObject* __Pyx__PyNumber_PowerOf2(PyObject *two, PyObject *exp, PyObject *none, int inplace) {
+#if !CYTHON_COMPILING_IN_PYPY
+    Py_ssize_t shiftby;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(exp))) {
+        shiftby = PyInt_AS_LONG(exp);
+    } else
+#endif
+    if (likely(PyLong_CheckExact(exp))) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        const Py_ssize_t size = Py_SIZE(exp);
+        if (likely(size == 1)) {
+            shiftby = ((PyLongObject*)exp)->ob_digit[0];
+        } else if (size == 0) {
+            return PyInt_FromLong(1L);
+        } else if (unlikely(size < 0)) {
+            goto fallback;
+        } else {
+            shiftby = PyLong_AsSsize_t(exp);
+        }
+        #else
+        shiftby = PyLong_AsSsize_t(exp);
+        #endif
+    } else {
+        goto fallback;
+    }
+    if (likely(shiftby >= 0)) {
+        if ((size_t)shiftby <= sizeof(long) * 8 - 2) {
+            long value = 1L << shiftby;
+            return PyInt_FromLong(value);
+#ifdef HAVE_LONG_LONG
+        } else if ((size_t)shiftby <= sizeof(unsigned PY_LONG_LONG) * 8 - 1) {
+            unsigned PY_LONG_LONG value = ((unsigned PY_LONG_LONG)1) << shiftby;
+            return PyLong_FromUnsignedLongLong(value);
+#endif
+        } else {
+            PyObject *result, *one = PyInt_FromLong(1L);
+            if (unlikely(!one)) return NULL;
+            result = PyNumber_Lshift(one, exp);
+            Py_DECREF(one);
+            return result;
+        }
+    } else if (shiftby == -1 && PyErr_Occurred()) {
+        PyErr_Clear();
+    }
+fallback:
+#endif
+    return (inplace ? PyNumber_InPlacePower : PyNumber_Power)(two, exp, none);
+}
+
+/* PyUnicode_Substring */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_Substring(
+            PyObject* text, Py_ssize_t start, Py_ssize_t stop) {
+    Py_ssize_t length;
+    if (unlikely(__Pyx_PyUnicode_READY(text) == -1)) return NULL;
+    length = __Pyx_PyUnicode_GET_LENGTH(text);
+    if (start < 0) {
+        start += length;
+        if (start < 0)
+            start = 0;
+    }
+    if (stop < 0)
+        stop += length;
+    else if (stop > length)
+        stop = length;
+    if (stop <= start)
+        return __Pyx_NewRef(__pyx_empty_unicode);
+#if CYTHON_PEP393_ENABLED
+    return PyUnicode_FromKindAndData(PyUnicode_KIND(text),
+        PyUnicode_1BYTE_DATA(text) + start*PyUnicode_KIND(text), stop-start);
+#else
+    return PyUnicode_FromUnicode(PyUnicode_AS_UNICODE(text)+start, stop-start);
+#endif
+}
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* DivInt[__pyx_t_7skimage_5graph_4heap_INDEX_T] */
+static CYTHON_INLINE __pyx_t_7skimage_5graph_4heap_INDEX_T __Pyx_div___pyx_t_7skimage_5graph_4heap_INDEX_T(__pyx_t_7skimage_5graph_4heap_INDEX_T a, __pyx_t_7skimage_5graph_4heap_INDEX_T b) {
+    __pyx_t_7skimage_5graph_4heap_INDEX_T q = a / b;
+    __pyx_t_7skimage_5graph_4heap_INDEX_T r = a - q*b;
+    q -= ((r != 0) & ((r ^ b) < 0));
+    return q;
+}
+
+/* ModInt[__pyx_t_7skimage_5graph_4heap_INDEX_T] */
+static CYTHON_INLINE __pyx_t_7skimage_5graph_4heap_INDEX_T __Pyx_mod___pyx_t_7skimage_5graph_4heap_INDEX_T(__pyx_t_7skimage_5graph_4heap_INDEX_T a, __pyx_t_7skimage_5graph_4heap_INDEX_T b) {
+    __pyx_t_7skimage_5graph_4heap_INDEX_T r = a % b;
+    r += ((r != 0) & ((r ^ b) < 0)) * b;
+    return r;
+}
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* PyObject_GenericGetAttrNoDict */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, attr_name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(attr_name));
+#endif
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name) {
+    PyObject *descr;
+    PyTypeObject *tp = Py_TYPE(obj);
+    if (unlikely(!PyString_Check(attr_name))) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    assert(!tp->tp_dictoffset);
+    descr = _PyType_Lookup(tp, attr_name);
+    if (unlikely(!descr)) {
+        return __Pyx_RaiseGenericGetAttributeError(tp, attr_name);
+    }
+    Py_INCREF(descr);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_HAVE_CLASS)))
+    #endif
+    {
+        descrgetfunc f = Py_TYPE(descr)->tp_descr_get;
+        if (unlikely(f)) {
+            PyObject *res = f(descr, obj, (PyObject *)tp);
+            Py_DECREF(descr);
+            return res;
+        }
+    }
+    return descr;
+}
+#endif
+
+/* PyObject_GenericGetAttr */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* SetVTable */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX >= 0x02070000
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#else
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
+/* SetupReduce */
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
+#else
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
+#endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred())
+        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* IntPow */
+static CYTHON_INLINE long __Pyx_pow_long(long b, long e) {
+    long t = b;
+    switch (e) {
+        case 3:
+            t *= b;
+        CYTHON_FALLTHROUGH;
+        case 2:
+            t *= b;
+        CYTHON_FALLTHROUGH;
+        case 1:
+            return t;
+        case 0:
+            return 1;
+    }
+    #if 1
+    if (unlikely(e<0)) return 0;
+    #endif
+    t = 1;
+    while (likely(e)) {
+        t *= (b * (e&1)) | ((~e)&1);
+        b *= b;
+        e >>= 1;
+    }
+    return t;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_char(unsigned char value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned char neg_one = (unsigned char) -1, const_zero = (unsigned char) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(unsigned char) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(unsigned char) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned char) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(unsigned char) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned char) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(unsigned char),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE unsigned char __Pyx_PyInt_As_unsigned_char(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned char neg_one = (unsigned char) -1, const_zero = (unsigned char) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(unsigned char) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(unsigned char, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (unsigned char) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (unsigned char) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(unsigned char, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(unsigned char) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) >= 2 * PyLong_SHIFT) {
+                            return (unsigned char) (((((unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(unsigned char) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) >= 3 * PyLong_SHIFT) {
+                            return (unsigned char) (((((((unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(unsigned char) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) >= 4 * PyLong_SHIFT) {
+                            return (unsigned char) (((((((((unsigned char)digits[3]) << PyLong_SHIFT) | (unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (unsigned char) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(unsigned char) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned char, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(unsigned char) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned char, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (unsigned char) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(unsigned char, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(unsigned char,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(unsigned char) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 2 * PyLong_SHIFT) {
+                            return (unsigned char) (((unsigned char)-1)*(((((unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(unsigned char) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 2 * PyLong_SHIFT) {
+                            return (unsigned char) ((((((unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(unsigned char) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 3 * PyLong_SHIFT) {
+                            return (unsigned char) (((unsigned char)-1)*(((((((unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(unsigned char) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 3 * PyLong_SHIFT) {
+                            return (unsigned char) ((((((((unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(unsigned char) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 4 * PyLong_SHIFT) {
+                            return (unsigned char) (((unsigned char)-1)*(((((((((unsigned char)digits[3]) << PyLong_SHIFT) | (unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(unsigned char) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(unsigned char, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(unsigned char) - 1 > 4 * PyLong_SHIFT) {
+                            return (unsigned char) ((((((((((unsigned char)digits[3]) << PyLong_SHIFT) | (unsigned char)digits[2]) << PyLong_SHIFT) | (unsigned char)digits[1]) << PyLong_SHIFT) | (unsigned char)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(unsigned char) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned char, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(unsigned char) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(unsigned char, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            unsigned char val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (unsigned char) -1;
+        }
+    } else {
+        unsigned char val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (unsigned char) -1;
+        val = __Pyx_PyInt_As_unsigned_char(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to unsigned char");
+    return (unsigned char) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to unsigned char");
+    return (unsigned char) -1;
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* InitStrings */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */